@@ -34,7 +34,7 @@ from .const import (
     EntityFilterSource,
 )
 from .entry_data import ConfigEntryData
-from .helpers import SmartHomePlatform
+from .helpers import SmartHomePlatform, async_unload_registry_info_cache
 from .http import async_register_http
 
 if TYPE_CHECKING:
@@ -130,6 +130,14 @@ class YandexSmartHome:
         """Unload a config entry."""
         data = self.get_entry_data(entry)
         await data.async_unload()
+
+        if not any(
+            e.state == ConfigEntryState.LOADED
+            for e in self._hass.config_entries.async_entries(DOMAIN)
+            if e.entry_id != entry.entry_id
+        ):
+            async_unload_registry_info_cache(self._hass)
+
         return True
 
     async def async_remove_entry(self, entry: ConfigEntry) -> None:
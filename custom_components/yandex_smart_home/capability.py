@@ -11,7 +11,7 @@ from homeassistant.core import Context, HomeAssistant, State
 from homeassistant.helpers.typing import ConfigType
 
 from .const import CONF_SLOW
-from .helpers import CacheStore, ListRegistry
+from .helpers import CacheStore, DomainRegistry
 from .schema import (
     CapabilityDescription,
     CapabilityInstance,
@@ -67,7 +67,7 @@ class Capability(Protocol[CapabilityInstanceActionState]):
 
     def get_description(self) -> CapabilityDescription | None:
         """Return a description for a device list request. Capability with an empty description isn't discoverable."""
-        return CapabilityDescription(
+        return CapabilityDescription.construct(
             type=self.type, retrievable=self.retrievable, reportable=self.reportable, parameters=self.parameters
         )
 
@@ -79,8 +79,8 @@ class Capability(Protocol[CapabilityInstanceActionState]):
     def get_instance_state(self) -> CapabilityInstanceState | None:
         """Return a state for a state query request."""
         if (value := self.get_value()) is not None:
-            return CapabilityInstanceState(
-                type=self.type, state=CapabilityInstanceStateValue(instance=self.instance, value=value)
+            return CapabilityInstanceState.construct(
+                type=self.type, state=CapabilityInstanceStateValue.construct(instance=self.instance, value=value)
             )
 
         return None
@@ -208,6 +208,15 @@ class StateCapability(Capability[CapabilityInstanceActionState], Protocol):
     state: State
     device_id: str
 
+    domains: set[str] | None = None
+    """Domains the capability may be supported for (None for any domain)."""
+
+    device_classes: set[str] | None = None
+    """Device classes the capability may be supported for (None for any device class)."""
+
+    supported_by_shape: bool = True
+    """Test if the capability support depends only on the state shape and the entity config."""
+
     _hass: HomeAssistant
     _entry_data: ConfigEntryData
 
@@ -230,4 +239,4 @@ class StateCapability(Capability[CapabilityInstanceActionState], Protocol):
         return self._entry_data.cache
 
 
-STATE_CAPABILITIES_REGISTRY = ListRegistry[type[StateCapability[Any]]]()
+STATE_CAPABILITIES_REGISTRY = DomainRegistry[type[StateCapability[Any]]]()
@@ -27,9 +27,9 @@ from homeassistant.core import Context, HomeAssistant, State
 from homeassistant.util.color import RGBColor
 
 from .capability import STATE_CAPABILITIES_REGISTRY, Capability, StateCapability
-from .color import SOLID_LIGHT_EFFECT, ColorConverter, ColorTemperatureConverter, LightState
+from .color import SOLID_LIGHT_EFFECT, ColorConverter, ColorTemperatureConverter, LightState, get_color_converter
 from .const import CONF_COLOR_PROFILE, CONF_ENTITY_CUSTOM_MODES, CONF_ENTITY_MODE_MAP
-from .helpers import APIError
+from .helpers import APIError, async_call_service
 from .schema import (
     CapabilityInstance,
     CapabilityParameterColorModel,
@@ -115,6 +115,8 @@ class ColorSettingCapability(StateCapability[ColorSettingCapabilityInstanceActio
 class RGBColorCapability(StateCapability[RGBInstanceActionState], LightState):
     """Capability to control color of a light device."""
 
+    domains = {light.DOMAIN}
+
     type = CapabilityType.COLOR_SETTING
     instance = ColorSettingCapabilityInstance.RGB
 
@@ -169,8 +171,13 @@ class RGBColorCapability(StateCapability[RGBInstanceActionState], LightState):
         else:
             service_data[ATTR_RGB_COLOR] = tuple(color)
 
-        await self._hass.services.async_call(
-            light.DOMAIN, SERVICE_TURN_ON, service_data, blocking=self._wait_for_service_call, context=context
+        await async_call_service(
+            self._hass,
+            light.DOMAIN,
+            SERVICE_TURN_ON,
+            service_data,
+            blocking=self._wait_for_service_call,
+            context=context,
         )
 
     @cached_property
@@ -178,19 +185,21 @@ class RGBColorCapability(StateCapability[RGBInstanceActionState], LightState):
         """Return the color converter."""
         if color_profile_name := self._entity_config.get(CONF_COLOR_PROFILE):
             try:
-                return ColorConverter(self._entry_data.color_profiles[color_profile_name])
+                return get_color_converter(self._entry_data.color_profiles[color_profile_name])
             except KeyError:
                 raise APIError(
                     ResponseCode.NOT_SUPPORTED_IN_CURRENT_MODE,
                     f"Color profile '{color_profile_name}' not found for {self}",
                 )
 
-        return ColorConverter()
+        return get_color_converter()
 
 
 class ColorTemperatureCapability(StateCapability[TemperatureKInstanceActionState], LightState):
     """Capability to control color temperature of a light device."""
 
+    domains = {light.DOMAIN}
+
     type = CapabilityType.COLOR_SETTING
     instance = ColorSettingCapabilityInstance.TEMPERATURE_K
 
@@ -279,8 +288,13 @@ class ColorTemperatureCapability(StateCapability[TemperatureKInstanceActionState
         else:
             service_data[ATTR_RGB_COLOR] = (255, 255, 255)
 
-        await self._hass.services.async_call(
-            light.DOMAIN, SERVICE_TURN_ON, service_data, blocking=self._wait_for_service_call, context=context
+        await async_call_service(
+            self._hass,
+            light.DOMAIN,
+            SERVICE_TURN_ON,
+            service_data,
+            blocking=self._wait_for_service_call,
+            context=context,
         )
 
     @cached_property
@@ -386,6 +400,8 @@ class ColorSceneCapability(Capability[SceneInstanceActionState]):
 class ColorSceneStateCapability(ColorSceneCapability, StateCapability[SceneInstanceActionState]):
     """Capability to control effect of a light device."""
 
+    domains = {light.DOMAIN}
+
     _scenes_map_default = {
         ColorScene.ALARM: ["Тревога", "Alarm", "Shine", "Strobe Mega"],
         ColorScene.ALICE: ["Алиса", "Alice", "Meeting"],
@@ -429,7 +445,8 @@ class ColorSceneStateCapability(ColorSceneCapability, StateCapability[SceneInsta
 
     async def set_instance_state(self, context: Context, state: SceneInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             light.DOMAIN,
             SERVICE_TURN_ON,
             {
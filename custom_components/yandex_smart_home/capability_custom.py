@@ -36,7 +36,7 @@ from .const import (
     CONF_ENTITY_RANGE_PRECISION,
     CONF_STATE_UNKNOWN,
 )
-from .helpers import ActionNotAllowed, APIError
+from .helpers import ActionNotAllowed, APIError, async_get_value_template, async_render_template
 from .schema import (
     CapabilityInstance,
     CapabilityType,
@@ -129,7 +129,7 @@ class CustomCapability(Capability[Any], Protocol):
             return self._value
 
         try:
-            return self._value_template.async_render()
+            return async_render_template(self._value_template, self._entry_data.template_results)
         except TemplateError as exc:
             raise APIError(ResponseCode.INVALID_VALUE, f"Failed to get current value for {self}: {exc!r}")
 
@@ -139,11 +139,23 @@ class CustomCapability(Capability[Any], Protocol):
             f"<{self.__class__.__name__}"
             f" device_id={self.device_id }"
             f" instance={self.instance}"
-            f" value_template={self._value_template}"
+            f" {self._value_source}"
             f" value={self._value}"
             f">"
         )
 
+    @property
+    def _value_source(self) -> str:
+        """Return the representation of the value source."""
+        if self._value_template is None or CONF_STATE_TEMPLATE in self._config:
+            return f"value_template={self._value_template}"
+
+        entity_id = self._config.get(CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ENTITY_ID, self.device_id)
+        if attribute := self._config.get(CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ATTRIBUTE):
+            return f"entity_id={entity_id} attribute={attribute}"
+
+        return f"entity_id={entity_id}"
+
 
 class CustomOnOffCapability(CustomCapability, OnOffCapability):
     """OnOff capability that user can set up using yaml configuration."""
@@ -402,7 +414,7 @@ def get_custom_capability(
     device_id: str,
 ) -> CustomCapability:
     """Return initialized custom capability based on parameters."""
-    value_template = get_value_template(hass, device_id, capability_config)
+    value_template = get_value_template(hass, entry_data, device_id, capability_config)
 
     match capability_type:
         case CapabilityType.ON_OFF:
@@ -431,7 +443,9 @@ def get_custom_capability(
     raise APIError(ResponseCode.INTERNAL_ERROR, f"Unsupported capability type: {capability_type}")
 
 
-def get_value_template(hass: HomeAssistant, device_id: str, capability_config: ConfigType) -> Template | None:
+def get_value_template(
+    hass: HomeAssistant, entry_data: ConfigEntryData, device_id: str, capability_config: ConfigType
+) -> Template | None:
     """Return capability value template from capability configuration."""
     if template := capability_config.get(CONF_STATE_TEMPLATE):
         return cast(Template, template)
@@ -440,8 +454,8 @@ def get_value_template(hass: HomeAssistant, device_id: str, capability_config: C
     attribute = capability_config.get(CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ATTRIBUTE)
 
     if attribute:
-        return Template("{{ state_attr('%s', '%s') }}" % (entity_id or device_id, attribute), hass)
+        return async_get_value_template(hass, entry_data, entity_id or device_id, attribute)
     elif entity_id:
-        return Template("{{ states('%s') }}" % entity_id, hass)
+        return async_get_value_template(hass, entry_data, entity_id)
 
     return None
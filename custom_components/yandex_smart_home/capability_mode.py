@@ -2,7 +2,10 @@
 
 from abc import ABC, abstractmethod
 from contextlib import suppress
+from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
+from itertools import chain
 import logging
 import math
 from typing import Any, Iterable, Protocol
@@ -19,7 +22,7 @@ from homeassistant.util.percentage import ordered_list_item_to_percentage, perce
 
 from .capability import STATE_CAPABILITIES_REGISTRY, Capability, StateCapability
 from .const import CONF_ENTITY_MODE_MAP, CONF_FEATURES, STATE_NONE, MediaPlayerFeature
-from .helpers import APIError
+from .helpers import APIError, async_call_service
 from .schema import (
     CapabilityType,
     ModeCapabilityInstance,
@@ -142,6 +145,105 @@ class XiaomiMiotCleanupMode(StrEnum):
     CUSTOM = "Custom"
 
 
+_YANDEX_MODE_FALLBACK_NAMES: dict[ModeCapabilityMode, tuple[str, ...]] = {
+    mode: (mode.value,) for mode in ModeCapabilityMode
+}
+"""HA mode names that are equal to Yandex modes, used when the modes map is not set in the entity configuration."""
+
+
+@dataclass(frozen=True, slots=True)
+class ModesLookup:
+    """Lookup tables between Yandex and HA modes for a modes map and a list of supported HA modes."""
+
+    supported_ha_modes: frozenset[str]
+    supported_ha_modes_lower: frozenset[str]
+    supported_yandex_modes: tuple[ModeCapabilityMode, ...]
+    mapped_yandex_modes: dict[str, ModeCapabilityMode]
+    index_yandex_modes: dict[str, ModeCapabilityMode]
+    ha_modes: dict[ModeCapabilityMode, str]
+    use_fallback: bool
+
+    def get_fallback_yandex_mode(self, ha_mode: str) -> ModeCapabilityMode | None:
+        """Return Yandex mode for HA mode which is not in the modes map."""
+        if not self.use_fallback:
+            return None
+
+        return _get_fallback_yandex_mode(ha_mode, self.index_yandex_modes)
+
+
+@lru_cache(maxsize=1024)
+def get_modes_lookup(
+    modes_map: tuple[tuple[ModeCapabilityMode, tuple[str, ...]], ...],
+    index_fallback: tuple[tuple[int, ModeCapabilityMode], ...] | None,
+    supported_ha_modes: tuple[str, ...],
+) -> ModesLookup:
+    """Build lookup tables for the modes map and the supported HA modes.
+
+    Fallbacks (a HA mode that is equal to a Yandex mode and the index of a HA mode) are used only
+    when the modes map is not set in the entity configuration (index_fallback is not None).
+    """
+    use_fallback = index_fallback is not None
+    index_fallback_dict = dict(index_fallback or ())
+
+    mapped_yandex_modes: dict[str, ModeCapabilityMode] = {}
+    for yandex_mode, names in modes_map:
+        for name in names:
+            mapped_yandex_modes.setdefault(name.lower(), yandex_mode)
+
+    index_yandex_modes: dict[str, ModeCapabilityMode] = {}
+    supported_ha_modes_by_lower: dict[str, str] = {}
+    for idx, ha_mode in enumerate(supported_ha_modes):
+        if idx in index_fallback_dict:
+            index_yandex_modes.setdefault(ha_mode, index_fallback_dict[idx])
+        supported_ha_modes_by_lower.setdefault(ha_mode.lower(), ha_mode)
+
+    ha_modes: dict[ModeCapabilityMode, str] = {}
+    modes_map_dict = dict(modes_map)
+    fallback_names = _YANDEX_MODE_FALLBACK_NAMES if use_fallback else {}
+    for yandex_mode in ModeCapabilityMode:
+        for name in chain(modes_map_dict.get(yandex_mode, ()), fallback_names.get(yandex_mode, ())):
+            if (supported_ha_mode := supported_ha_modes_by_lower.get(name.lower())) is not None:
+                ha_modes[yandex_mode] = supported_ha_mode
+                break
+        else:
+            if use_fallback:
+                for idx, fallback_yandex_mode in index_fallback_dict.items():
+                    if fallback_yandex_mode == yandex_mode:
+                        if idx < len(supported_ha_modes):
+                            ha_modes[yandex_mode] = supported_ha_modes[idx]
+                        break
+
+    supported_yandex_modes: set[ModeCapabilityMode] = set()
+    for ha_mode in supported_ha_modes:
+        if mode := mapped_yandex_modes.get(ha_mode.lower()):
+            supported_yandex_modes.add(mode)
+        elif use_fallback and (mode := _get_fallback_yandex_mode(ha_mode, index_yandex_modes)):
+            supported_yandex_modes.add(mode)
+
+    return ModesLookup(
+        supported_ha_modes=frozenset(supported_ha_modes),
+        supported_ha_modes_lower=frozenset(supported_ha_modes_by_lower),
+        supported_yandex_modes=tuple(sorted(supported_yandex_modes)),
+        mapped_yandex_modes=mapped_yandex_modes,
+        index_yandex_modes=index_yandex_modes,
+        ha_modes=ha_modes,
+        use_fallback=use_fallback,
+    )
+
+
+def _get_fallback_yandex_mode(
+    ha_mode: str, index_yandex_modes: dict[str, ModeCapabilityMode]
+) -> ModeCapabilityMode | None:
+    """Return Yandex mode that is equal to HA mode or Yandex mode by index of HA mode."""
+    with suppress(ValueError):
+        return ModeCapabilityMode(ha_mode.lower())
+
+    if ha_mode.lower() != STATE_OFF:
+        return index_yandex_modes.get(ha_mode)
+
+    return None
+
+
 class ModeCapability(Capability[ModeCapabilityInstanceActionState], Protocol):
     """Base class for capabilities with mode functionality like thermostat mode or fan speed.
 
@@ -178,12 +280,7 @@ class ModeCapability(Capability[ModeCapabilityInstanceActionState], Protocol):
     @property
     def supported_yandex_modes(self) -> list[ModeCapabilityMode]:
         """Returns a list of supported Yandex modes."""
-        modes = set()
-        for ha_value in self.supported_ha_modes:
-            if value := self.get_yandex_mode_by_ha_mode(ha_value, hide_warnings=True):
-                modes.add(value)
-
-        return sorted(modes)
+        return list(self._modes_lookup.supported_yandex_modes)
 
     @property
     def supported_ha_modes(self) -> list[str]:
@@ -208,32 +305,21 @@ class ModeCapability(Capability[ModeCapabilityInstanceActionState], Protocol):
 
     def get_yandex_mode_by_ha_mode(self, ha_mode: str, hide_warnings: bool = False) -> ModeCapabilityMode | None:
         """Return Yandex mode for HA mode."""
-        mode = None
-        for yandex_mode, names in self.modes_map.items():
-            if ha_mode.lower() in [n.lower() for n in names]:
-                mode = yandex_mode
-                break
+        lookup = self._modes_lookup
+        mode = lookup.mapped_yandex_modes.get(ha_mode.lower())
 
-        if mode is not None and ha_mode not in self.supported_ha_modes:
+        if mode is not None and ha_mode not in lookup.supported_ha_modes:
             raise APIError(
                 ResponseCode.INVALID_VALUE,
                 f"Unsupported HA mode '{ha_mode}' for {self}: not in {self.supported_ha_modes}",
             )
 
-        if not self.modes_map_config:
-            if mode is None:
-                with suppress(ValueError):
-                    mode = ModeCapabilityMode(ha_mode.lower())
-
-            if mode is None and ha_mode.lower() != STATE_OFF:
-                try:
-                    mode = self._modes_map_index_fallback[self.supported_ha_modes.index(ha_mode)]
-                except (IndexError, ValueError, KeyError):
-                    pass
+        if mode is None:
+            mode = lookup.get_fallback_yandex_mode(ha_mode)
 
         if mode is None and not hide_warnings:
             if ha_mode.lower() not in (STATE_OFF, STATE_UNAVAILABLE, STATE_UNKNOWN, STATE_NONE):
-                if ha_mode.lower() in [m.lower() for m in self.supported_ha_modes]:
+                if ha_mode.lower() in lookup.supported_ha_modes_lower:
                     _LOGGER.warning(
                         f"Failed to get Yandex mode for mode '{ha_mode}' for {self}. "
                         f"It may cause inconsistencies between Yandex and HA. "
@@ -244,25 +330,23 @@ class ModeCapability(Capability[ModeCapabilityInstanceActionState], Protocol):
 
     def get_ha_mode_by_yandex_mode(self, yandex_mode: ModeCapabilityMode) -> str:
         """Return HA mode for Yandex mode."""
-        ha_modes = self.modes_map.get(yandex_mode, [])
-        if not self.modes_map_config:
-            ha_modes.append(yandex_mode.value)
-
-        for ha_mode in ha_modes:
-            for am in self.supported_ha_modes:
-                if am.lower() == ha_mode.lower():
-                    return am
-
-        if not self.modes_map_config:
-            for ha_idx, yandex_mode_idx in self._modes_map_index_fallback.items():
-                if yandex_mode_idx == yandex_mode:
-                    return self.supported_ha_modes[ha_idx]
+        if (ha_mode := self._modes_lookup.ha_modes.get(yandex_mode)) is not None:
+            return ha_mode
 
         raise APIError(
             ResponseCode.INVALID_VALUE,
             f"Unsupported mode '{yandex_mode}' for {self}, see https://docs.yaha-cloud.ru/v1.0.x/config/modes/",
         )
 
+    @property
+    def _modes_lookup(self) -> ModesLookup:
+        """Return lookup tables for the modes map and the supported HA modes."""
+        return get_modes_lookup(
+            tuple((k, tuple(v)) for k, v in self.modes_map.items()),
+            None if self.modes_map_config else tuple(self._modes_map_index_fallback.items()),
+            tuple(self.supported_ha_modes),
+        )
+
     @abstractmethod
     def get_value(self) -> ModeCapabilityMode | None:
         """Return the current capability value."""
@@ -295,6 +379,7 @@ class ThermostatCapability(StateModeCapability):
     """Capability to control mode of a climate device."""
 
     instance = ModeCapabilityInstance.THERMOSTAT
+    domains = {climate.DOMAIN}
 
     _modes_map_default = {
         ModeCapabilityMode.HEAT: [HVACMode.HEAT],
@@ -314,7 +399,8 @@ class ThermostatCapability(StateModeCapability):
 
     async def set_instance_state(self, context: Context, state: ModeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             climate.DOMAIN,
             climate.SERVICE_SET_HVAC_MODE,
             {
@@ -335,6 +421,7 @@ class SwingCapability(StateModeCapability):
     """Capability to control swing mode of a climate device."""
 
     instance = ModeCapabilityInstance.SWING
+    domains = {climate.DOMAIN}
 
     _modes_map_default = {
         ModeCapabilityMode.VERTICAL: ["ud"],
@@ -353,7 +440,8 @@ class SwingCapability(StateModeCapability):
 
     async def set_instance_state(self, context: Context, state: ModeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             climate.DOMAIN,
             climate.SERVICE_SET_SWING_MODE,
             {
@@ -384,6 +472,8 @@ class ProgramCapability(StateModeCapability, ABC):
 class ProgramCapabilityClimate(ProgramCapability):
     """Capability to control the mode preset of a climate device."""
 
+    domains = {climate.DOMAIN}
+
     _modes_map_default = {
         ModeCapabilityMode.AUTO: [
             climate.const.PRESET_NONE,
@@ -417,7 +507,8 @@ class ProgramCapabilityClimate(ProgramCapability):
 
     async def set_instance_state(self, context: Context, state: ModeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             climate.DOMAIN,
             climate.SERVICE_SET_PRESET_MODE,
             {
@@ -442,6 +533,8 @@ class ProgramCapabilityClimate(ProgramCapability):
 class ProgramCapabilityHumidifier(ProgramCapability):
     """Capability to control the mode of a humidifier device."""
 
+    domains = {humidifier.DOMAIN}
+
     _modes_map_default = {
         ModeCapabilityMode.FAN_ONLY: [
             XiaomiFanMode.FAN,
@@ -492,7 +585,8 @@ class ProgramCapabilityHumidifier(ProgramCapability):
 
     async def set_instance_state(self, context: Context, state: ModeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             humidifier.DOMAIN,
             humidifier.SERVICE_SET_MODE,
             {
@@ -517,6 +611,8 @@ class ProgramCapabilityHumidifier(ProgramCapability):
 class ProgramCapabilityFan(ProgramCapability):
     """Capability to control the mode preset of a fan device."""
 
+    domains = {fan.DOMAIN}
+
     _modes_map_default = {
         ModeCapabilityMode.ECO: [
             XiaomiFanMode.IDLE,
@@ -560,7 +656,8 @@ class ProgramCapabilityFan(ProgramCapability):
 
     async def set_instance_state(self, context: Context, state: ModeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             fan.DOMAIN,
             fan.SERVICE_SET_PRESET_MODE,
             {
@@ -586,6 +683,8 @@ class InputSourceCapability(StateModeCapability):
     """Capability to control the input source of a media player device."""
 
     instance = ModeCapabilityInstance.INPUT_SOURCE
+    domains = {media_player.DOMAIN}
+    supported_by_shape = False  # the source list may be restored from the cache
 
     @property
     def supported(self) -> bool:
@@ -605,7 +704,8 @@ class InputSourceCapability(StateModeCapability):
 
     async def set_instance_state(self, context: Context, state: ModeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             media_player.DOMAIN,
             media_player.SERVICE_SELECT_SOURCE,
             {
@@ -642,6 +742,8 @@ class FanSpeedCapability(StateModeCapability, ABC):
 class FanSpeedCapabilityClimate(FanSpeedCapability):
     """Capability to control the fan speed of a climate device."""
 
+    domains = {climate.DOMAIN}
+
     _modes_map_default = {
         ModeCapabilityMode.AUTO: [
             climate.FAN_AUTO,
@@ -691,7 +793,8 @@ class FanSpeedCapabilityClimate(FanSpeedCapability):
 
     async def set_instance_state(self, context: Context, state: ModeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             climate.DOMAIN,
             climate.SERVICE_SET_FAN_MODE,
             {
@@ -722,6 +825,8 @@ class FanSpeedCapabilityClimate(FanSpeedCapability):
 class FanSpeedCapabilityFanViaPreset(FanSpeedCapability):
     """Capability to control the fan speed of a fan device via preset."""
 
+    domains = {fan.DOMAIN}
+
     _modes_map_default = {
         ModeCapabilityMode.AUTO: [
             climate.FAN_AUTO,
@@ -771,7 +876,8 @@ class FanSpeedCapabilityFanViaPreset(FanSpeedCapability):
 
     async def set_instance_state(self, context: Context, state: ModeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             fan.DOMAIN,
             fan.SERVICE_SET_PRESET_MODE,
             {
@@ -796,6 +902,8 @@ class FanSpeedCapabilityFanViaPreset(FanSpeedCapability):
 class FanSpeedCapabilityFanViaPercentage(FanSpeedCapability):
     """Capability to control the fan speed in percents of a fan device."""
 
+    domains = {fan.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -843,7 +951,8 @@ class FanSpeedCapabilityFanViaPercentage(FanSpeedCapability):
         else:
             ha_mode = ordered_list_item_to_percentage(self.supported_ha_modes, state.value)
 
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             fan.DOMAIN,
             fan.SERVICE_SET_PERCENTAGE,
             {ATTR_ENTITY_ID: self.state.entity_id, fan.ATTR_PERCENTAGE: ha_mode},
@@ -892,6 +1001,7 @@ class CleanupModeCapability(StateModeCapability):
     """Capability to control the program of a vacuum."""
 
     instance = ModeCapabilityInstance.CLEANUP_MODE
+    domains = {vacuum.DOMAIN}
 
     _modes_map_default = {
         ModeCapabilityMode.ECO: [
@@ -937,7 +1047,8 @@ class CleanupModeCapability(StateModeCapability):
 
     async def set_instance_state(self, context: Context, state: ModeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             vacuum.DOMAIN,
             vacuum.SERVICE_SET_FAN_SPEED,
             {
@@ -56,7 +56,7 @@ from .const import (
     SKYKETTLE_MODE_BOIL,
     MediaPlayerFeature,
 )
-from .helpers import ActionNotAllowed, APIError
+from .helpers import ActionNotAllowed, APIError, async_call_service
 from .schema import (
     CapabilityType,
     OnOffCapabilityInstance,
@@ -139,6 +139,8 @@ class OnlyOnCapability(ActionOnlyCapabilityMixin, OnOffCapability, ABC):
 class OnOffCapabilityBasic(OnOffCapability):
     """Capability to turn on or off a device."""
 
+    domains = {light.DOMAIN, fan.DOMAIN, switch.DOMAIN, humidifier.DOMAIN, input_boolean.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -146,7 +148,8 @@ class OnOffCapabilityBasic(OnOffCapability):
 
     async def _set_instance_state(self, context: Context, state: OnOffCapabilityInstanceActionState) -> None:
         """Change the capability state (if wasn't overriden by the user)."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             self.state.domain,
             self._get_service(state),
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -158,6 +161,8 @@ class OnOffCapabilityBasic(OnOffCapability):
 class OnOffCapabilityAutomation(OnOffCapability):
     """Capability to enable or disable an automation."""
 
+    domains = {automation.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -169,7 +174,8 @@ class OnOffCapabilityAutomation(OnOffCapability):
 
     async def _set_instance_state(self, context: Context, state: OnOffCapabilityInstanceActionState) -> None:
         """Change the capability state (if wasn't overriden by the user)."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             automation.DOMAIN,
             self._get_service(state),
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -181,6 +187,8 @@ class OnOffCapabilityAutomation(OnOffCapability):
 class OnOffCapabilityGroup(OnOffCapability):
     """Capability to turn on or off a group of devices."""
 
+    domains = {group.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -188,7 +196,8 @@ class OnOffCapabilityGroup(OnOffCapability):
 
     async def _set_instance_state(self, context: Context, state: OnOffCapabilityInstanceActionState) -> None:
         """Change the capability state (if wasn't overriden by the user)."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             HA_DOMAIN,
             self._get_service(state),
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -200,6 +209,8 @@ class OnOffCapabilityGroup(OnOffCapability):
 class OnOffCapabilityScript(OnlyOnCapability):
     """Capability to call a script or scene."""
 
+    domains = {scene.DOMAIN, script.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -215,7 +226,8 @@ class OnOffCapabilityScript(OnlyOnCapability):
 
     async def _set_instance_state(self, context: Context, state: OnOffCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             self.state.domain,
             SERVICE_TURN_ON,
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -227,6 +239,8 @@ class OnOffCapabilityScript(OnlyOnCapability):
 class OnOffCapabilityButton(OnlyOnCapability):
     """Capability to press a button."""
 
+    domains = {button.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -234,7 +248,8 @@ class OnOffCapabilityButton(OnlyOnCapability):
 
     async def _set_instance_state(self, context: Context, state: OnOffCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             self.state.domain,
             button.SERVICE_PRESS,
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -246,6 +261,8 @@ class OnOffCapabilityButton(OnlyOnCapability):
 class OnOffCapabilityInputButton(OnlyOnCapability):
     """Capability to press a input_button."""
 
+    domains = {input_button.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -253,7 +270,8 @@ class OnOffCapabilityInputButton(OnlyOnCapability):
 
     async def _set_instance_state(self, context: Context, state: OnOffCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             self.state.domain,
             input_button.SERVICE_PRESS,
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -265,6 +283,8 @@ class OnOffCapabilityInputButton(OnlyOnCapability):
 class OnOffCapabilityLock(OnOffCapability):
     """Capability to lock or unlock a lock."""
 
+    domains = {lock.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -284,7 +304,8 @@ class OnOffCapabilityLock(OnOffCapability):
         else:
             service = SERVICE_LOCK
 
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             lock.DOMAIN,
             service,
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -296,6 +317,8 @@ class OnOffCapabilityLock(OnOffCapability):
 class OnOffCapabilityCover(OnOffCapability):
     """Capability to open or close a cover."""
 
+    domains = {cover.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -312,7 +335,8 @@ class OnOffCapabilityCover(OnOffCapability):
         else:
             service = SERVICE_CLOSE_COVER
 
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             cover.DOMAIN,
             service,
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -324,6 +348,8 @@ class OnOffCapabilityCover(OnOffCapability):
 class OnOffCapabilityRemote(ActionOnlyCapabilityMixin, OnOffCapability):
     """Capability to turn on or off a remote."""
 
+    domains = {remote.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -336,7 +362,8 @@ class OnOffCapabilityRemote(ActionOnlyCapabilityMixin, OnOffCapability):
 
     async def _set_instance_state(self, context: Context, state: OnOffCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             remote.DOMAIN,
             self._get_service(state),
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -348,6 +375,8 @@ class OnOffCapabilityRemote(ActionOnlyCapabilityMixin, OnOffCapability):
 class OnOffCapabilityMediaPlayer(OnOffCapability):
     """Capability to turn on or off a media player device."""
 
+    domains = {media_player.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -367,7 +396,8 @@ class OnOffCapabilityMediaPlayer(OnOffCapability):
 
     async def _set_instance_state(self, context: Context, state: OnOffCapabilityInstanceActionState) -> None:
         """Change the capability state (if wasn't overriden by the user)."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             media_player.DOMAIN,
             self._get_service(state),
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -379,6 +409,8 @@ class OnOffCapabilityMediaPlayer(OnOffCapability):
 class OnOffCapabilityVacuum(OnOffCapability):
     """Capability to start or stop cleaning by a vacuum."""
 
+    domains = {vacuum.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -419,7 +451,8 @@ class OnOffCapabilityVacuum(OnOffCapability):
             elif self._state_features & VacuumEntityFeature.STOP:
                 service = vacuum.SERVICE_STOP
 
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             vacuum.DOMAIN,
             service,
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -431,6 +464,8 @@ class OnOffCapabilityVacuum(OnOffCapability):
 class OnOffCapabilityClimate(OnOffCapability):
     """Capability to turn on or off a climate device."""
 
+    domains = {climate.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -458,14 +493,16 @@ class OnOffCapabilityClimate(OnOffCapability):
         else:
             service = SERVICE_TURN_OFF
 
-        await self._hass.services.async_call(
-            climate.DOMAIN, service, service_data, blocking=self._wait_for_service_call, context=context
+        await async_call_service(
+            self._hass, climate.DOMAIN, service, service_data, blocking=self._wait_for_service_call, context=context
         )
 
 
 class OnOffCapabilityWaterHeater(OnOffCapability):
     """Capability to turn on or off a water heater."""
 
+    domains = {water_heater.DOMAIN}
+
     _water_heater_operations = {
         STATE_ON: [STATE_ON, "On", "ON", water_heater.STATE_ELECTRIC, SKYKETTLE_MODE_BOIL],
         STATE_OFF: [STATE_OFF, "Off", "OFF"],
@@ -488,7 +525,8 @@ class OnOffCapabilityWaterHeater(OnOffCapability):
             await self._set_state_operation_mode(context, state)
 
     async def _set_state_on_off(self, context: Context, state: OnOffCapabilityInstanceActionState) -> None:
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             water_heater.DOMAIN,
             self._get_service(state),
             {
@@ -513,7 +551,8 @@ class OnOffCapabilityWaterHeater(OnOffCapability):
                 f"Unable to determine operation mode for {target_state_text} state for {self}",
             )
 
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             water_heater.DOMAIN,
             water_heater.SERVICE_SET_OPERATION_MODE,
             {ATTR_ENTITY_ID: self.state.entity_id, water_heater.ATTR_OPERATION_MODE: mode},
@@ -532,6 +571,8 @@ class OnOffCapabilityWaterHeater(OnOffCapability):
 class OnOffCapabilityValve(OnOffCapability):
     """Capability to open or close a valve."""
 
+    domains = {valve.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -548,7 +589,8 @@ class OnOffCapabilityValve(OnOffCapability):
         else:
             service = SERVICE_CLOSE_VALVE
 
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             valve.DOMAIN,
             service,
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -49,7 +49,7 @@ from .const import (
     STATE_NONE,
     MediaPlayerFeature,
 )
-from .helpers import APIError
+from .helpers import APIError, async_call_service
 from .schema import (
     CapabilityType,
     RangeCapabilityInstance,
@@ -175,6 +175,7 @@ class CoverPositionCapability(StateRangeCapability):
     """Capability to control position of a cover."""
 
     instance = RangeCapabilityInstance.OPEN
+    domains = {cover.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -188,7 +189,8 @@ class CoverPositionCapability(StateRangeCapability):
 
     async def set_instance_state(self, context: Context, state: RangeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             cover.DOMAIN,
             SERVICE_SET_COVER_POSITION,
             {ATTR_ENTITY_ID: self.state.entity_id, cover.ATTR_POSITION: self._get_service_call_value(state)},
@@ -215,6 +217,8 @@ class TemperatureCapability(StateRangeCapability, ABC):
 class TemperatureCapabilityWaterHeater(TemperatureCapability):
     """Capability to control a water heater target temperature."""
 
+    domains = {water_heater.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -224,7 +228,8 @@ class TemperatureCapabilityWaterHeater(TemperatureCapability):
 
     async def set_instance_state(self, context: Context, state: RangeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             water_heater.DOMAIN,
             water_heater.SERVICE_SET_TEMPERATURE,
             {ATTR_ENTITY_ID: self.state.entity_id, ATTR_TEMPERATURE: self._get_service_call_value(state)},
@@ -249,6 +254,8 @@ class TemperatureCapabilityWaterHeater(TemperatureCapability):
 class TemperatureCapabilityClimate(TemperatureCapability):
     """Capability to control a climate device target temperature."""
 
+    domains = {climate.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -258,7 +265,8 @@ class TemperatureCapabilityClimate(TemperatureCapability):
 
     async def set_instance_state(self, context: Context, state: RangeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             climate.DOMAIN,
             climate.SERVICE_SET_TEMPERATURE,
             {ATTR_ENTITY_ID: self.state.entity_id, ATTR_TEMPERATURE: self._get_service_call_value(state)},
@@ -294,6 +302,8 @@ class HumidityCapability(StateRangeCapability, ABC):
 class HumidityCapabilityHumidifier(HumidityCapability):
     """Capability to control a humidifier target humidity."""
 
+    domains = {humidifier.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -301,7 +311,8 @@ class HumidityCapabilityHumidifier(HumidityCapability):
 
     async def set_instance_state(self, context: Context, state: RangeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             humidifier.DOMAIN,
             humidifier.SERVICE_SET_HUMIDITY,
             {ATTR_ENTITY_ID: self.state.entity_id, humidifier.ATTR_HUMIDITY: self._get_service_call_value(state)},
@@ -326,6 +337,8 @@ class HumidityCapabilityHumidifier(HumidityCapability):
 class HumidityCapabilityXiaomiFan(HumidityCapability):
     """Capability to control a Xiaomi fan target humidity."""
 
+    domains = {fan.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the capability is supported."""
@@ -338,7 +351,8 @@ class HumidityCapabilityXiaomiFan(HumidityCapability):
 
     async def set_instance_state(self, context: Context, state: RangeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             DOMAIN_XIAOMI_AIRPURIFIER,
             SERVICE_FAN_SET_TARGET_HUMIDITY,
             {ATTR_ENTITY_ID: self.state.entity_id, humidifier.ATTR_HUMIDITY: self._get_service_call_value(state)},
@@ -355,6 +369,7 @@ class BrightnessCapability(StateRangeCapability):
     """Capability to control brightness of a device."""
 
     instance = RangeCapabilityInstance.BRIGHTNESS
+    domains = {light.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -375,7 +390,8 @@ class BrightnessCapability(StateRangeCapability):
         else:
             attribute = light.ATTR_BRIGHTNESS_PCT
 
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             light.DOMAIN,
             SERVICE_TURN_ON,
             {ATTR_ENTITY_ID: self.state.entity_id, attribute: state.value},
@@ -400,6 +416,7 @@ class WhiteLightBrightnessCapability(StateRangeCapability, LightState):
     """Capability to control white brightness and cold white brightness of a RGBW/RGBWW light device."""
 
     instance = RangeCapabilityInstance.VOLUME
+    domains = {light.DOMAIN}
     volume_default_relative_step = 3
     brightness_relative_step = 20
 
@@ -434,8 +451,13 @@ class WhiteLightBrightnessCapability(StateRangeCapability, LightState):
         else:
             service_data[light.ATTR_RGBW_COLOR] = color + (brightness,)
 
-        await self._hass.services.async_call(
-            light.DOMAIN, SERVICE_TURN_ON, service_data, blocking=self._wait_for_service_call, context=context
+        await async_call_service(
+            self._hass,
+            light.DOMAIN,
+            SERVICE_TURN_ON,
+            service_data,
+            blocking=self._wait_for_service_call,
+            context=context,
         )
 
     def _get_value(self) -> float | None:
@@ -455,6 +477,7 @@ class WarmWhiteLightBrightnessCapability(StateRangeCapability, LightState):
     """Capability to control warm white brightness of a RGBWW light device."""
 
     instance = RangeCapabilityInstance.OPEN
+    domains = {light.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -471,7 +494,8 @@ class WarmWhiteLightBrightnessCapability(StateRangeCapability, LightState):
         color = self._rgb_color or RGBColor(0, 0, 0)
         brightness_pct = self._get_service_call_value(state)
 
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             light.DOMAIN,
             SERVICE_TURN_ON,
             {
@@ -499,6 +523,7 @@ class VolumeCapability(StateRangeCapability):
     """Capability to control volume of a device."""
 
     instance = RangeCapabilityInstance.VOLUME
+    domains = {media_player.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -529,7 +554,8 @@ class VolumeCapability(StateRangeCapability):
     async def set_instance_state(self, context: Context, state: RangeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
         if self.support_random_access:
-            await self._hass.services.async_call(
+            await async_call_service(
+                self._hass,
                 media_player.DOMAIN,
                 SERVICE_VOLUME_SET,
                 {
@@ -555,7 +581,8 @@ class VolumeCapability(StateRangeCapability):
             volume_step = int(abs(state.value))
 
         for _ in range(volume_step):
-            await self._hass.services.async_call(
+            await async_call_service(
+                self._hass,
                 media_player.DOMAIN,
                 service,
                 {ATTR_ENTITY_ID: self.state.entity_id},
@@ -588,6 +615,7 @@ class ChannelCapability(StateRangeCapability):
     """Capability to control media playback state."""
 
     instance = RangeCapabilityInstance.CHANNEL
+    domains = {media_player.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -644,7 +672,8 @@ class ChannelCapability(StateRangeCapability):
                 else:
                     service = SERVICE_MEDIA_PREVIOUS_TRACK
 
-                await self._hass.services.async_call(
+                await async_call_service(
+                    self._hass,
                     media_player.DOMAIN,
                     service,
                     {ATTR_ENTITY_ID: self.state.entity_id},
@@ -659,7 +688,8 @@ class ChannelCapability(StateRangeCapability):
                 value = self._get_absolute_value(state.value)
 
         try:
-            await self._hass.services.async_call(
+            await async_call_service(
+                self._hass,
                 media_player.DOMAIN,
                 media_player.SERVICE_PLAY_MEDIA,
                 {
@@ -703,6 +733,7 @@ class ValvePositionCapability(StateRangeCapability):
     """Capability to control position of a device."""
 
     instance = RangeCapabilityInstance.OPEN
+    domains = {valve.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -716,7 +747,8 @@ class ValvePositionCapability(StateRangeCapability):
 
     async def set_instance_state(self, context: Context, state: RangeCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             valve.DOMAIN,
             SERVICE_SET_VALVE_POSITION,
             {ATTR_ENTITY_ID: self.state.entity_id, valve.ATTR_POSITION: self._get_service_call_value(state)},
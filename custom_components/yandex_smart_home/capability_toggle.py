@@ -24,6 +24,7 @@ from homeassistant.core import Context
 from .capability import STATE_CAPABILITIES_REGISTRY, ActionOnlyCapabilityMixin, Capability, StateCapability
 from .color import SOLID_LIGHT_EFFECT, LightState
 from .const import CONF_FEATURES, MediaPlayerFeature
+from .helpers import async_call_service
 from .schema import (
     CapabilityType,
     ToggleCapabilityInstance,
@@ -74,7 +75,8 @@ class BacklightCapability(StateToggleCapability):
         else:
             service = SERVICE_TURN_OFF
 
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             self.state.domain,
             service,
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -87,6 +89,7 @@ class MuteCapability(StateToggleCapability):
     """Capability to mute and unmute device."""
 
     instance = ToggleCapabilityInstance.MUTE
+    domains = {media_player.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -111,7 +114,8 @@ class MuteCapability(StateToggleCapability):
 
     async def set_instance_state(self, context: Context, state: ToggleCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             media_player.DOMAIN,
             SERVICE_VOLUME_MUTE,
             {ATTR_ENTITY_ID: self.state.entity_id, media_player.ATTR_MEDIA_VOLUME_MUTED: state.value},
@@ -124,6 +128,7 @@ class PauseCapabilityMediaPlayer(StateToggleCapability):
     """Capability to pause and resume media player playback."""
 
     instance = ToggleCapabilityInstance.PAUSE
+    domains = {media_player.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -151,7 +156,8 @@ class PauseCapabilityMediaPlayer(StateToggleCapability):
         else:
             service = SERVICE_MEDIA_PLAY
 
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             media_player.DOMAIN,
             service,
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -164,6 +170,7 @@ class PauseCapabilityCover(ActionOnlyCapabilityMixin, StateToggleCapability):
     """Capability to stop a cover."""
 
     instance = ToggleCapabilityInstance.PAUSE
+    domains = {cover.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -172,7 +179,8 @@ class PauseCapabilityCover(ActionOnlyCapabilityMixin, StateToggleCapability):
 
     async def set_instance_state(self, context: Context, state: ToggleCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             cover.DOMAIN,
             SERVICE_STOP_COVER,
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -185,6 +193,7 @@ class PauseCapabilityLight(ActionOnlyCapabilityMixin, StateToggleCapability, Lig
     """Capability to turn on solid light effect for a light device."""
 
     instance = ToggleCapabilityInstance.PAUSE
+    domains = {light.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -193,7 +202,8 @@ class PauseCapabilityLight(ActionOnlyCapabilityMixin, StateToggleCapability, Lig
 
     async def set_instance_state(self, context: Context, state: ToggleCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             light.DOMAIN,
             SERVICE_TURN_ON,
             {ATTR_ENTITY_ID: self.state.entity_id, light.ATTR_EFFECT: SOLID_LIGHT_EFFECT},
@@ -206,6 +216,7 @@ class PauseCapabilityVacuum(StateToggleCapability):
     """Capability to stop a vacuum."""
 
     instance = ToggleCapabilityInstance.PAUSE
+    domains = {vacuum.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -223,7 +234,8 @@ class PauseCapabilityVacuum(StateToggleCapability):
         else:
             service = vacuum.SERVICE_START
 
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             vacuum.DOMAIN,
             service,
             {ATTR_ENTITY_ID: self.state.entity_id},
@@ -236,6 +248,7 @@ class OscillationCapability(StateToggleCapability):
     """Capability to control fan oscillation."""
 
     instance = ToggleCapabilityInstance.OSCILLATION
+    domains = {fan.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -248,7 +261,8 @@ class OscillationCapability(StateToggleCapability):
 
     async def set_instance_state(self, context: Context, state: ToggleCapabilityInstanceActionState) -> None:
         """Change the capability state."""
-        await self._hass.services.async_call(
+        await async_call_service(
+            self._hass,
             fan.DOMAIN,
             fan.SERVICE_OSCILLATE,
             {ATTR_ENTITY_ID: self.state.entity_id, fan.ATTR_OSCILLATING: state.value},
@@ -41,6 +41,8 @@ if TYPE_CHECKING:
 class VideoStreamCapability(ActionOnlyCapabilityMixin, StateCapability[GetStreamInstanceActionState]):
     """Capability to stream from cameras."""
 
+    domains = {camera.DOMAIN}
+
     type = CapabilityType.VIDEO_STREAM
     instance = VideoStreamCapabilityInstance.GET_STREAM
 
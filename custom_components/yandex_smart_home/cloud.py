@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 from asyncio import TimeoutError
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
+import random
 from typing import TYPE_CHECKING, Any, AsyncIterable, cast
 
 from aiohttp import ClientConnectorError, ClientResponseError, ClientWebSocketResponse, WSMessage, WSMsgType, hdrs
-from homeassistant.core import CALLBACK_TYPE, Context, HassJob, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Context, HassJob, HomeAssistant, callback
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE, async_create_clientsession, async_get_clientsession
 from homeassistant.helpers.event import async_call_later
@@ -54,6 +57,37 @@ class CloudRequest(BaseModel):
     message: str = ""
 
 
+@dataclass
+class CloudConnectionStats:
+    """Hold health metrics of the cloud connection."""
+
+    connect_latency: float | None = None
+    connected_at: datetime | None = None
+    connected_time: float = 0.0
+    messages_handled: int = 0
+    request_time: float = 0.0
+    reconnect_count: int = 0
+    last_close_code: int | None = None
+
+    def as_dict(self, now: datetime) -> dict[str, Any]:
+        """Return a dictionary representation of the metrics."""
+        connected_time = self.connected_time
+        if self.connected_at:
+            connected_time += (now - self.connected_at).total_seconds()
+
+        return {
+            "connected": self.connected_at is not None,
+            "connect_latency": self.connect_latency,
+            "connected_time": round(connected_time, 3),
+            "messages_handled": self.messages_handled,
+            "average_request_time": (
+                round(self.request_time / self.messages_handled, 4) if self.messages_handled else None
+            ),
+            "reconnect_count": self.reconnect_count,
+            "last_close_code": self.last_close_code,
+        }
+
+
 class CloudManager:
     """Class to manage cloud connection."""
 
@@ -65,9 +99,12 @@ class CloudManager:
         self._last_connection_at: datetime | None = None
         self._fast_reconnection_count = 0
         self._ws: ClientWebSocketResponse | None = None
-        self._ws_reconnect_delay = DEFAULT_RECONNECTION_DELAY
+        self._ws_reconnect_delay: float = DEFAULT_RECONNECTION_DELAY
         self._ws_active = True
         self._unsub_connect: CALLBACK_TYPE | None = None
+        self._send_lock = asyncio.Lock()
+        self._request_tasks: set[asyncio.Task[None]] = set()
+        self.stats = CloudConnectionStats()
 
         self._url = f"{BASE_API_URL}/connect"
 
@@ -75,6 +112,7 @@ class CloudManager:
         """Connect to the cloud."""
         try:
             _LOGGER.debug(f"Connecting to {self._url}")
+            connect_started_at = self._hass.loop.time()
             self._ws = await self._session.ws_connect(
                 self._url,
                 heartbeat=45,
@@ -88,24 +126,43 @@ class CloudManager:
             _LOGGER.debug("Connection to Yandex Smart Home cloud established")
             self._ws_reconnect_delay = DEFAULT_RECONNECTION_DELAY
             self._last_connection_at = dt.utcnow()
+            self.stats.connect_latency = round(self._hass.loop.time() - connect_started_at, 3)
+            self.stats.connected_at = self._last_connection_at
             ir.async_delete_issue(self._hass, DOMAIN, ISSUE_ID_RECONNECTING_TOO_FAST)
 
+            semaphore = asyncio.Semaphore(self._entry_data.cloud_request_concurrency)
             async for msg in cast(AsyncIterable[WSMessage], self._ws):
                 if msg.type == WSMsgType.TEXT:
-                    await self._on_message(msg)
+                    request = CloudRequest.parse_raw(msg.data)
+                    self._dispatch_request(self._ws, request, semaphore)
 
             _LOGGER.debug(f"Disconnected: {self._ws.close_code}")
+            self._on_disconnected()
             if self._ws.close_code is not None:
                 self._try_reconnect()
         except (ClientConnectorError, ClientResponseError, TimeoutError):
             _LOGGER.exception("Failed to connect to Yandex Smart Home cloud")
+            self._on_disconnected()
             self._try_reconnect()
         except Exception:
             _LOGGER.exception("Unexpected exception")
+            self._on_disconnected()
             self._try_reconnect()
 
         return None
 
+    @callback
+    def _on_disconnected(self) -> None:
+        """Cancel pending requests and update the connection metrics after the connection is closed or failed."""
+        self._cancel_request_tasks()
+
+        if self.stats.connected_at:
+            self.stats.connected_time += (dt.utcnow() - self.stats.connected_at).total_seconds()
+            self.stats.connected_at = None
+            self.stats.last_close_code = self._ws.close_code if self._ws else None
+
+        return None
+
     async def async_disconnect(self, *_: Any) -> None:
         """Disconnect from the cloud."""
         self._ws_active = False
@@ -116,27 +173,68 @@ class CloudManager:
             self._unsub_connect()
             self._unsub_connect = None
 
+        self._cancel_request_tasks()
         return None
 
-    async def _on_message(self, message: WSMessage) -> None:
-        """Handle incoming request from the cloud."""
-        request = CloudRequest.parse_raw(message.data)
-        _LOGGER.debug("Request: %s (message: %s)" % (request.action, request.message))
-
-        data = RequestData(
-            entry_data=self._entry_data,
-            context=Context(user_id=await self._entry_data.async_get_context_user_id()),
-            platform=request.platform,
-            request_user_id=self._entry_data.cloud_instance_id,
-            request_id=request.request_id,
+    @callback
+    def _cancel_request_tasks(self) -> None:
+        """Cancel pending requests whose responses can no longer be sent."""
+        for task in list(self._request_tasks):
+            task.cancel()
+
+        return None
+
+    @callback
+    def _dispatch_request(
+        self, ws: ClientWebSocketResponse, request: CloudRequest, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Handle a request in a separate task to avoid blocking the following ones."""
+        task = self._hass.async_create_task(
+            self._async_handle_request(ws, request, semaphore), f"{DOMAIN}_cloud_request_{request.request_id}"
         )
+        self._request_tasks.add(task)
+        task.add_done_callback(self._request_tasks.discard)
+        return None
 
-        result = await handlers.async_handle_request(self._hass, data, request.action, request.message)
-        response = result.as_json()
-        _LOGGER.debug(f"Response: {response}")
+    async def _async_handle_request(
+        self, ws: ClientWebSocketResponse, request: CloudRequest, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Handle incoming request from the cloud."""
+        async with semaphore:
+            _LOGGER.debug("Request: %s (message: %s)" % (request.action, request.message))
+            started_at = self._hass.loop.time()
+
+            data = RequestData(
+                entry_data=self._entry_data,
+                context=Context(user_id=self._entry_data.context_user_id),
+                platform=request.platform,
+                request_user_id=self._entry_data.cloud_instance_id,
+                request_id=request.request_id,
+            )
+
+            result = await handlers.async_handle_request(self._hass, data, request.action, request.message)
+            response = result.as_json()
+            _LOGGER.debug(f"Response: {response}")
+
+            await self._async_send(ws, request, response)
+
+            self.stats.messages_handled += 1
+            self.stats.request_time += self._hass.loop.time() - started_at
+
+        return None
+
+    async def _async_send(self, ws: ClientWebSocketResponse, request: CloudRequest, response: str) -> None:
+        """Send a response to the cloud, one at a time."""
+        async with self._send_lock:
+            if ws.closed:
+                _LOGGER.debug(f"Connection closed, dropping response for {request.request_id}")
+                return None
+
+            try:
+                await ws.send_str(response)
+            except ConnectionError:
+                _LOGGER.debug(f"Failed to send response for {request.request_id}", exc_info=True)
 
-        assert self._ws is not None
-        await self._ws.send_str(response)
         return None
 
     def _try_reconnect(self) -> None:
@@ -144,7 +242,10 @@ class CloudManager:
         if not self._ws_active:
             return None
 
-        self._ws_reconnect_delay = min(2 * self._ws_reconnect_delay, MAX_RECONNECTION_DELAY)
+        # decorrelated jitter spreads reconnections of many instances after the cloud restart
+        self._ws_reconnect_delay = min(
+            random.uniform(DEFAULT_RECONNECTION_DELAY, 3 * self._ws_reconnect_delay), MAX_RECONNECTION_DELAY
+        )
 
         if self._last_connection_at and self._last_connection_at + FAST_RECONNECTION_TIME > dt.utcnow():
             self._fast_reconnection_count += 1
@@ -164,7 +265,8 @@ class CloudManager:
             )
             _LOGGER.warning(f"Reconnecting too fast, next reconnection in {self._ws_reconnect_delay} seconds")
 
-        _LOGGER.debug(f"Trying to reconnect in {self._ws_reconnect_delay} seconds")
+        _LOGGER.debug(f"Trying to reconnect in {self._ws_reconnect_delay:.1f} seconds")
+        self.stats.reconnect_count += 1
         self._unsub_connect = async_call_later(self._hass, self._ws_reconnect_delay, HassJob(self.async_connect))
         return None
 
@@ -1,8 +1,7 @@
 """Color manipulation helpers."""
 
 from enum import StrEnum
-from functools import cached_property
-from math import sqrt
+from functools import cached_property, lru_cache
 from typing import Final, Protocol, Self
 
 from homeassistant.components.light import (
@@ -22,6 +21,15 @@ from homeassistant.util.color import RGBColor, color_hs_to_RGB, color_xy_to_RGB
 
 SOLID_LIGHT_EFFECT: Final = "Solid"
 
+_COLOR_MATCH_DISTANCE: Final = 2
+_COLOR_MATCH_OFFSETS: Final = tuple(
+    (dr, dg, db)
+    for dr in range(-_COLOR_MATCH_DISTANCE, _COLOR_MATCH_DISTANCE + 1)
+    for dg in range(-_COLOR_MATCH_DISTANCE, _COLOR_MATCH_DISTANCE + 1)
+    for db in range(-_COLOR_MATCH_DISTANCE, _COLOR_MATCH_DISTANCE + 1)
+    if dr**2 + dg**2 + db**2 <= _COLOR_MATCH_DISTANCE**2
+)
+
 
 class ColorName(StrEnum):
     RED = "red"
@@ -90,7 +98,7 @@ class ColorProfiles(dict[str, ColorProfile]):
     @classmethod
     def from_dict(cls, data: dict[str, dict[str, int]]) -> Self:
         """Intialize the color profiles from a dict."""
-        profiles = cls._default_profiles.copy()
+        profiles = {name: profile.copy() for name, profile in cls._default_profiles.items()}
         for profile_name, mapping in data.items():
             profiles.setdefault(profile_name, {})
             profiles[profile_name].update({ColorName(name): v for name, v in mapping.items()})
@@ -134,22 +142,34 @@ class ColorConverter:
             self._yandex_mapping[yandex_value] = ha_value
             self._ha_mapping[ha_value] = yandex_value
 
+        # all HA colors close to the mapped ones (the first mapped color wins)
+        self._ha_neighborhood_mapping: dict[tuple[int, int, int], int] = {}
+        for ha_value, yandex_value in self._ha_mapping.items():
+            r, g, b = int_to_rgb(ha_value)
+            for dr, dg, db in _COLOR_MATCH_OFFSETS:
+                self._ha_neighborhood_mapping.setdefault((r + dr, g + dg, b + db), yandex_value)
+
     def get_ha_color(self, yandex_color: int) -> RGBColor:
         """Return HA color for Yandex color."""
         return int_to_rgb(self._yandex_mapping.get(yandex_color, yandex_color))
 
     def get_yandex_color(self, ha_color: RGBColor) -> int:
         """Return Yandex color for HA color."""
-        for from_ha_value, to_yandex_value in self._ha_mapping.items():
-            if self._distance(ha_color, int_to_rgb(from_ha_value)) <= 2:
-                return to_yandex_value
+        if (yandex_value := self._ha_neighborhood_mapping.get(ha_color)) is not None:
+            return yandex_value
 
         return rgb_to_int(ha_color)
 
-    @staticmethod
-    def _distance(a: RGBColor, b: RGBColor) -> float:
-        """Return a distance between two colors."""
-        return abs(sqrt((a.r - b.r) ** 2 + (a.g - b.g) ** 2 + (a.b - b.b) ** 2))
+
+@lru_cache(maxsize=32)
+def _get_color_converter(profile: tuple[tuple[ColorName, int], ...]) -> ColorConverter:
+    """Return the color converter for the color profile items."""
+    return ColorConverter(dict(profile))
+
+
+def get_color_converter(profile: ColorProfile | None = None) -> ColorConverter:
+    """Return the color converter for the color profile (shared by all capabilities with the same profile)."""
+    return _get_color_converter(tuple((profile or {}).items()))
 
 
 class ColorTemperatureConverter:
@@ -15,8 +15,11 @@ import voluptuous as vol
 
 from .color import ColorName, rgb_to_int
 from .const import (
+    CONF_ACTION_CONCURRENCY,
+    CONF_ACTION_TIMEOUT,
     CONF_BACKLIGHT_ENTITY_ID,
     CONF_BETA,
+    CONF_CLOUD_REQUEST_CONCURRENCY,
     CONF_CLOUD_STREAM,
     CONF_COLOR_PROFILE,
     CONF_ENTITY_CONFIG,
@@ -52,6 +55,7 @@ from .const import (
     CONF_NOTIFIER_SKILL_ID,
     CONF_NOTIFIER_USER_ID,
     CONF_PRESSURE_UNIT,
+    CONF_REQUEST_TIMEOUT,
     CONF_SETTINGS,
     CONF_SLOW,
     CONF_STATE_UNKNOWN,
@@ -451,6 +455,12 @@ SETTINGS_SCHEMA = vol.All(
         vol.Optional(CONF_PRESSURE_UNIT): cv.string,
         vol.Optional(CONF_BETA): cv.boolean,
         vol.Optional(CONF_CLOUD_STREAM): cv.boolean,
+        vol.Optional(CONF_ACTION_CONCURRENCY): cv.positive_int,
+        vol.Optional(CONF_ACTION_TIMEOUT): vol.All(vol.Coerce(float), vol.Range(min=0, min_included=False)),
+        vol.Optional(CONF_CLOUD_REQUEST_CONCURRENCY): cv.positive_int,
+        vol.Optional(CONF_REQUEST_TIMEOUT): {
+            vol.In(["query", "action"]): vol.All(vol.Coerce(float), vol.Range(min=0, min_included=False))
+        },
     },
 )
 
@@ -8,6 +8,10 @@ CONF_SETTINGS = "settings"
 CONF_PRESSURE_UNIT = "pressure_unit"
 CONF_BETA = "beta"
 CONF_CLOUD_STREAM = "cloud_stream"
+CONF_ACTION_CONCURRENCY = "action_concurrency"
+CONF_ACTION_TIMEOUT = "action_timeout"
+CONF_CLOUD_REQUEST_CONCURRENCY = "cloud_request_concurrency"
+CONF_REQUEST_TIMEOUT = "request_timeout"
 CONF_CONNECTION_TYPE = "connection_type"
 CONF_CLOUD_INSTANCE = "cloud_instance"
 CONF_CLOUD_INSTANCE_ID = "id"
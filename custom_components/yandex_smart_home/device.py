@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import re
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Hashable
 
 from homeassistant.components import (
     air_quality,
@@ -41,6 +41,10 @@ from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
+    ATTR_FRIENDLY_NAME,
+    ATTR_MODEL,
+    ATTR_SUPPORTED_FEATURES,
+    ATTR_UNIT_OF_MEASUREMENT,
     CLOUD_NEVER_EXPOSED_ENTITIES,
     CONF_DEVICE_CLASS,
     CONF_NAME,
@@ -51,8 +55,6 @@ from homeassistant.const import (
     STATE_UNKNOWN,
 )
 from homeassistant.core import Context, HomeAssistant, State, callback
-from homeassistant.helpers.area_registry import AreaEntry
-from homeassistant.helpers.entity_registry import RegistryEntry
 from homeassistant.helpers.template import Template
 
 from custom_components.yandex_smart_home.const import (
@@ -61,6 +63,7 @@ from custom_components.yandex_smart_home.const import (
     CONF_ENTITY_CUSTOM_RANGES,
     CONF_ENTITY_CUSTOM_TOGGLES,
     CONF_ENTITY_PROPERTIES,
+    CONF_ENTITY_PROPERTY_ENTITY,
     CONF_ERROR_CODE_TEMPLATE,
 )
 
@@ -79,9 +82,20 @@ from . import (  # noqa: F401
 from .capability import STATE_CAPABILITIES_REGISTRY, Capability, DummyCapability, StateCapability
 from .capability_custom import get_custom_capability
 from .capability_toggle import BacklightCapability
-from .helpers import ActionNotAllowed, APIError, _get_registry_entries
+from .helpers import (
+    ActionNotAllowed,
+    APIError,
+    RegistryInfo,
+    async_get_registry_info_cache,
+    async_render_template,
+    cache_template_renders,
+)
 from .property import STATE_PROPERTIES_REGISTRY, Property, StateProperty
-from .property_custom import get_custom_property, get_event_platform_custom_property_type
+from .property_custom import (
+    get_custom_property,
+    get_event_platform_custom_property_type,
+    get_value_template as get_property_value_template,
+)
 from .schema import (
     CapabilityDescription,
     CapabilityInstanceAction,
@@ -167,6 +181,42 @@ _DEVICE_CLASS_TO_DEVICE_TYPES: dict[tuple[str, str], DeviceType] = {
     (event.DOMAIN, EventDeviceClass.MOTION): DeviceType.SENSOR_MOTION,
 }
 
+_STATE_SHAPE_ATTRIBUTES = (
+    ATTR_DEVICE_CLASS,
+    ATTR_SUPPORTED_FEATURES,
+    ATTR_UNIT_OF_MEASUREMENT,
+    ATTR_MODEL,
+    light.ATTR_SUPPORTED_COLOR_MODES,
+    light.ATTR_EFFECT_LIST,
+    climate.ATTR_HVAC_MODES,
+    climate.ATTR_SWING_MODES,
+    climate.ATTR_PRESET_MODES,
+    climate.ATTR_FAN_MODES,
+    climate.ATTR_FAN_MODE,
+    humidifier.ATTR_AVAILABLE_MODES,
+    fan.ATTR_PERCENTAGE_STEP,
+    vacuum.ATTR_FAN_SPEED_LIST,
+    "action",
+)
+"""State attributes which values affect supported capabilities and properties."""
+
+_DESCRIPTION_ATTRIBUTES = (
+    ATTR_FRIENDLY_NAME,
+    climate.ATTR_MIN_TEMP,
+    climate.ATTR_MAX_TEMP,
+    climate.ATTR_TARGET_TEMP_STEP,
+    humidifier.ATTR_MIN_HUMIDITY,
+    humidifier.ATTR_MAX_HUMIDITY,
+    water_heater.ATTR_OPERATION_LIST,
+    media_player.ATTR_INPUT_SOURCE_LIST,
+    light.ATTR_MIN_COLOR_TEMP_KELVIN,
+    light.ATTR_MAX_COLOR_TEMP_KELVIN,
+)
+"""State attributes which values affect the device name and parameters of capabilities and properties."""
+
+_QUERY_CHUNK_SIZE = 50
+"""Number of devices queried without yielding to the event loop."""
+
 type DeviceId = str
 
 
@@ -233,9 +283,9 @@ class Device:
 
                             _append_capabilities(custom_capability)
 
-        for CapabilityT in STATE_CAPABILITIES_REGISTRY:
-            state_capability = CapabilityT(self._hass, self._entry_data, self.id, self._state)
-            _append_capabilities(state_capability)
+        for state_capability in self._get_supported_state_capabilities():
+            if state_capability not in capabilities and state_capability not in disabled_capabilities:
+                capabilities.append(state_capability)
 
         if backlight_entity_id := self._config.get(CONF_BACKLIGHT_ENTITY_ID):
             backlight_state = self._hass.states.get(backlight_entity_id)
@@ -278,9 +328,8 @@ class Device:
                 if event_platform_property.supported and event_platform_property not in properties:
                     properties.append(event_platform_property)
 
-        for PropertyT in STATE_PROPERTIES_REGISTRY:
-            device_property = PropertyT(self._hass, self._entry_data, self.id, self._state)
-            if device_property.supported and device_property not in properties:
+        for device_property in self._get_supported_state_properties():
+            if device_property not in properties:
                 properties.append(device_property)
 
         return properties
@@ -290,6 +339,65 @@ class Device:
         """Return properties for the device based on the state."""
         return [p for p in self.get_properties() if isinstance(p, StateProperty)]
 
+    @callback
+    def _get_supported_state_capabilities(self) -> list[StateCapability[Any]]:
+        """Return supported capabilities from the registry (types are cached per state shape)."""
+        capabilities: list[StateCapability[Any]] = []
+        shape = _get_state_shape(self._state)
+        cached = self._entry_data.capability_types_cache.get(self.id)
+        if shape is not None and cached and cached[0] == shape:
+            for CapabilityT in cached[1]:
+                state_capability = CapabilityT(self._hass, self._entry_data, self.id, self._state)
+                if state_capability.supported:
+                    capabilities.append(state_capability)
+
+            return capabilities
+
+        types: list[type[StateCapability[Any]]] = []
+        for CapabilityT in STATE_CAPABILITIES_REGISTRY.get_for_domain(self._state.domain, self._state_device_class):
+            state_capability = CapabilityT(self._hass, self._entry_data, self.id, self._state)
+            if supported := state_capability.supported:
+                capabilities.append(state_capability)
+            if supported or not CapabilityT.supported_by_shape:
+                types.append(CapabilityT)
+
+        if shape is not None:
+            self._entry_data.capability_types_cache[self.id] = (shape, types)
+
+        return capabilities
+
+    @callback
+    def _get_supported_state_properties(self) -> list[StateProperty]:
+        """Return supported properties from the registry (types are cached per state shape)."""
+        properties: list[StateProperty] = []
+        shape = _get_state_shape(self._state)
+        cached = self._entry_data.property_types_cache.get(self.id)
+        if shape is not None and cached and cached[0] == shape:
+            for PropertyT in cached[1]:
+                device_property = PropertyT(self._hass, self._entry_data, self.id, self._state)
+                if device_property.supported:
+                    properties.append(device_property)
+
+            return properties
+
+        types: list[type[StateProperty]] = []
+        for PropertyT in STATE_PROPERTIES_REGISTRY.get_for_domain(self._state.domain, self._state_device_class):
+            device_property = PropertyT(self._hass, self._entry_data, self.id, self._state)
+            if device_property.supported:
+                properties.append(device_property)
+                types.append(PropertyT)
+
+        if shape is not None:
+            self._entry_data.property_types_cache[self.id] = (shape, types)
+
+        return properties
+
+    @property
+    def _state_device_class(self) -> str | None:
+        """Return device class of the state."""
+        device_class = self._state.attributes.get(ATTR_DEVICE_CLASS)
+        return device_class if isinstance(device_class, str) else None
+
     @property
     def should_expose(self) -> bool:
         """Test if the device should be exposed."""
@@ -310,7 +418,7 @@ class Device:
         """Test if the device is unavailable."""
         state_template: Template | None
         if (state_template := self._config.get(CONF_STATE_TEMPLATE)) is not None:
-            return bool(state_template.async_render() == STATE_UNAVAILABLE)
+            return bool(async_render_template(state_template, self._entry_data.template_results) == STATE_UNAVAILABLE)
 
         return self._state.state == STATE_UNAVAILABLE
 
@@ -326,7 +434,75 @@ class Device:
         return _DEVICE_CLASS_TO_DEVICE_TYPES.get((domain, device_class), _DOMAIN_TO_DEVICE_TYPES.get(domain))
 
     async def describe(self) -> DeviceDescription | None:
-        """Return description of the device."""
+        """Return description of the device (cached while its source data is unchanged)."""
+        registry_info = async_get_registry_info_cache(self._hass).async_get(self.id, self._entry_data.use_entry_aliases)
+        state_key = _get_description_state_key(self._state)
+
+        cached = self._entry_data.device_description_cache.get(self.id)
+        if state_key is not None and cached is not None:
+            cache_key, referenced_entity_ids, description = cached
+            if cache_key == (
+                registry_info,
+                state_key,
+                self._get_referenced_state_keys(referenced_entity_ids),
+                self._cached_attributes_key,
+            ):
+                return description
+
+        description = self._get_description(registry_info)
+        if state_key is not None:
+            referenced_entity_ids = self._get_description_referenced_entity_ids()
+            self._entry_data.device_description_cache[self.id] = (
+                (
+                    registry_info,
+                    state_key,
+                    self._get_referenced_state_keys(referenced_entity_ids),
+                    self._cached_attributes_key,
+                ),
+                referenced_entity_ids,
+                description,
+            )
+
+        return description
+
+    @property
+    def _cached_attributes_key(self) -> tuple[Any, ...]:
+        """Return fingerprint of the entity attributes saved in the cache store (used by capabilities)."""
+        values: list[Any] = []
+        for name, value in sorted(self._entry_data.cache.get_attr_values(self.id).items()):
+            values.append((name, tuple(value) if isinstance(value, list) else value))
+
+        return tuple(values)
+
+    @callback
+    def _get_description_referenced_entity_ids(self) -> list[str]:
+        """Return other entities which state affects the description."""
+        entity_ids: set[str] = set()
+        if backlight_entity_id := self._config.get(CONF_BACKLIGHT_ENTITY_ID):
+            entity_ids.add(backlight_entity_id)
+
+        for property_config in self._config.get(CONF_ENTITY_PROPERTIES, []):
+            if (value_template := get_property_value_template(property_config)) is not None:
+                entity_ids.update(value_template.async_render_to_info().entities)
+            else:
+                entity_ids.add(property_config.get(CONF_ENTITY_PROPERTY_ENTITY, self.id))
+
+        entity_ids.discard(self.id)
+        return sorted(entity_ids)
+
+    @callback
+    def _get_referenced_state_keys(self, entity_ids: list[str]) -> tuple[Any, ...]:
+        """Return description fingerprints of the referenced entities."""
+        keys: list[Any] = []
+        for entity_id in entity_ids:
+            state = self._hass.states.get(entity_id)
+            keys.append(_get_description_state_key(state) if state else None)
+
+        return tuple(keys)
+
+    @callback
+    def _get_description(self, registry_info: RegistryInfo) -> DeviceDescription | None:
+        """Build description of the device."""
         capabilities: list[CapabilityDescription] = []
         for c in self.get_capabilities():
             if c_description := c.get_description():
@@ -340,27 +516,19 @@ class Device:
         if not capabilities and not properties:
             return None
 
-        entity_entry, device_entry, area_entry = _get_registry_entries(self._hass, self.id)
-        device_info = DeviceInfo(model=self.id)
-        if device_entry is not None:
-            if device_entry.model:
-                device_model = f"{device_entry.model} | {self.id}"
-            else:
-                device_model = self.id
-
-            device_info = DeviceInfo(
-                manufacturer=device_entry.manufacturer,
-                model=device_model,
-                sw_version=device_entry.sw_version,
-            )
+        device_info = DeviceInfo.construct(
+            manufacturer=registry_info.manufacturer,
+            model=f"{registry_info.model} | {self.id}" if registry_info.model else self.id,
+            sw_version=registry_info.sw_version,
+        )
 
-        if (room := self._get_room(area_entry)) is not None:
+        if (room := self._get_room(registry_info)) is not None:
             room = room.strip()
 
         assert self.type
-        return DeviceDescription(
+        return DeviceDescription.construct(
             id=self.id,
-            name=self._get_name(entity_entry).strip(),
+            name=self._get_name(registry_info).strip(),
             room=room,
             type=self.type,
             capabilities=capabilities or None,
@@ -374,7 +542,7 @@ class Device:
         check_availability = True
 
         if self.unavailable:
-            return DeviceState(id=self.id, error_code=ResponseCode.DEVICE_UNREACHABLE)
+            return DeviceState.construct(id=self.id, error_code=ResponseCode.DEVICE_UNREACHABLE)
 
         capabilities: list[CapabilityInstanceState] = []
         for c in self.get_capabilities():
@@ -399,9 +567,9 @@ class Device:
                 check_availability = False
 
         if check_availability and not capabilities and not properties:
-            return DeviceState(id=self.id, error_code=ResponseCode.DEVICE_UNREACHABLE)
+            return DeviceState.construct(id=self.id, error_code=ResponseCode.DEVICE_UNREACHABLE)
 
-        return DeviceState(
+        return DeviceState.construct(
             id=self.id,
             capabilities=capabilities or None,
             properties=properties or None,
@@ -442,55 +610,73 @@ class Device:
         except Exception as e:
             raise APIError(ResponseCode.INTERNAL_ERROR, f"Failed to execute action for {target_capability}: {e!r}")
 
-    def _get_name(self, entity_entry: RegistryEntry | None) -> str:
+    def _get_name(self, registry_info: RegistryInfo) -> str:
         """Return the device name."""
         if name := self._config.get(CONF_NAME):
             return str(name)
 
-        if entity_entry:
-            if alias := self._get_entry_alias(entity_entry.aliases):
-                return alias
-
-        return self._state.name or self.id
+        return registry_info.name or self._state.name or self.id
 
-    def _get_room(self, area: AreaEntry | None) -> str | None:
+    def _get_room(self, registry_info: RegistryInfo) -> str | None:
         """Return room of the device."""
         if room := self._config.get(CONF_ROOM):
             return str(room)
 
-        if area:
-            if alias := self._get_entry_alias(area.aliases):
-                return alias
+        return registry_info.room
+
+    @property
+    def _error_code_template(self) -> Template | None:
+        """Prepare template for error code."""
+        return self._config.get(CONF_ERROR_CODE_TEMPLATE)
 
-            return area.name
 
+def _get_description_state_key(state: State) -> Hashable | None:
+    """Return fingerprint of the state that affects the device description."""
+    if (shape := _get_state_shape(state)) is None:
         return None
 
-    def _get_entry_alias(self, aliases: set[str] | None) -> str | None:
-        """Return best matched entry alias."""
-        filtered_aliases: set[str] = set()
-        for alias in aliases or []:
-            if "алиса:" in alias.lower():
-                filtered_aliases.add(alias.split(":", 1)[1].strip())
-            elif self._entry_data.use_entry_aliases and re.search(r"^[а-яё0-9 ]+$", alias, flags=re.IGNORECASE):
-                filtered_aliases.add(alias)
+    attributes = state.attributes
+    values: list[Any] = []
+    for name in _DESCRIPTION_ATTRIBUTES:
+        value = attributes.get(name)
+        if isinstance(value, list):
+            value = tuple(value)
 
-        if not filtered_aliases:
-            return None
+        values.append(value)
 
-        return sorted(filtered_aliases)[0]
+    return shape, tuple(values)
 
-    @property
-    def _error_code_template(self) -> Template | None:
-        """Prepare template for error code."""
-        return self._config.get(CONF_ERROR_CODE_TEMPLATE)
+
+def _get_state_shape(state: State) -> Hashable | None:
+    """Return fingerprint of the state that affects supported capabilities and properties."""
+    attributes = state.attributes
+    values: list[Any] = []
+    for name in _STATE_SHAPE_ATTRIBUTES:
+        value = attributes.get(name)
+        if isinstance(value, list):
+            value = tuple(value)
+        elif isinstance(value, set):
+            value = frozenset(value)
+
+        values.append(value)
+
+    shape = (state.domain, tuple((name, value is None) for name, value in attributes.items()), tuple(values))
+    try:
+        hash(shape)
+    except TypeError:
+        return None
+
+    return shape
 
 
 async def async_get_devices(hass: HomeAssistant, entry_data: ConfigEntryData) -> list[Device]:
     """Return list of supported user devices."""
     devices: list[Device] = []
 
-    for state in hass.states.async_all():
+    for entity_id in entry_data.exposed_entity_ids:
+        if (state := hass.states.get(entity_id)) is None:
+            continue
+
         device = Device(hass, entry_data, state.entity_id, state)
         if not device.should_expose:
             continue
@@ -510,19 +696,38 @@ async def async_get_device_description(hass: HomeAssistant, device: Device) -> D
 
 
 async def async_get_device_states(
-    hass: HomeAssistant, entry_data: ConfigEntryData, device_ids: list[str]
+    hass: HomeAssistant, entry_data: ConfigEntryData, device_ids: list[str], deadline: float | None = None
 ) -> list[DeviceState]:
-    """Return list of the states of user devices."""
+    """Return list of the states of user devices.
+
+    Devices are queried in chunks with yielding to the event loop between them, templates are rendered once per chunk.
+    Devices left unqueried when the deadline is reached are reported as busy.
+    """
     states: list[DeviceState] = []
 
-    for device_id in device_ids:
-        device = Device(hass, entry_data, device_id, hass.states.get(device_id))
-        if not device.should_expose:
-            _LOGGER.warning(
-                f"State requested for unexposed entity {device.id}. Please either expose the entity via "
-                f"filters in component configuration or delete the device from Yandex."
-            )
+    for chunk_start in range(0, len(device_ids), _QUERY_CHUNK_SIZE):
+        if chunk_start:
+            await asyncio.sleep(0)
+
+            if deadline is not None and hass.loop.time() >= deadline:
+                _LOGGER.error(
+                    f"Request deadline exceeded while querying states of {len(device_ids) - chunk_start} devices"
+                )
+                states.extend(
+                    DeviceState.construct(id=device_id, error_code=ResponseCode.DEVICE_BUSY)
+                    for device_id in device_ids[chunk_start:]
+                )
+                break
+
+        with cache_template_renders():
+            for device_id in device_ids[chunk_start : chunk_start + _QUERY_CHUNK_SIZE]:
+                device = Device(hass, entry_data, device_id, hass.states.get(device_id))
+                if not device.should_expose:
+                    _LOGGER.warning(
+                        f"State requested for unexposed entity {device.id}. Please either expose the entity via "
+                        f"filters in component configuration or delete the device from Yandex."
+                    )
 
-        states.append(device.query())
+                states.append(device.query())
 
     return states
@@ -6,6 +6,7 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import issue_registry
+from homeassistant.util import dt
 
 from . import DOMAIN, YandexSmartHome
 from .const import CONF_CLOUD_INSTANCE, CONF_SKILL
@@ -24,6 +25,9 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry:
     }
     diag.update(component.get_diagnostics())
 
+    if entry_data.cloud_manager:
+        diag["cloud_connection"] = entry_data.cloud_manager.stats.as_dict(dt.utcnow())
+
     for device in await async_get_devices(hass, entry_data):
         diag["devices"][device.id] = {
             "capabilities": [c.__repr__() for c in device.get_capabilities()],
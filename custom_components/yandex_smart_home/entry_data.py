@@ -5,8 +5,9 @@ from contextlib import suppress
 from dataclasses import dataclass
 from functools import cached_property
 import logging
-from typing import Any, Self, cast
+from typing import Any, Callable, Hashable, Self, cast
 
+from homeassistant.auth import EVENT_USER_REMOVED
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_ID,
@@ -15,10 +16,12 @@ from homeassistant.const import (
     CONF_TOKEN,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    MATCH_ALL,
 )
-from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, CoreState, Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er, issue_registry as ir
 from homeassistant.helpers.entityfilter import EntityFilter
+from homeassistant.helpers.event import async_track_state_added_domain, async_track_state_removed_domain
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_custom_components
@@ -28,10 +31,13 @@ from .capability_custom import CustomCapability, get_custom_capability
 from .cloud import CloudManager
 from .color import ColorProfiles
 from .const import (
+    CONF_ACTION_CONCURRENCY,
+    CONF_ACTION_TIMEOUT,
     CONF_BACKLIGHT_ENTITY_ID,
     CONF_CLOUD_INSTANCE,
     CONF_CLOUD_INSTANCE_CONNECTION_TOKEN,
     CONF_CLOUD_INSTANCE_ID,
+    CONF_CLOUD_REQUEST_CONCURRENCY,
     CONF_CLOUD_STREAM,
     CONF_COLOR_PROFILE,
     CONF_CONNECTION_TYPE,
@@ -46,6 +52,7 @@ from .const import (
     CONF_LINKED_PLATFORMS,
     CONF_NOTIFIER,
     CONF_PRESSURE_UNIT,
+    CONF_REQUEST_TIMEOUT,
     CONF_SETTINGS,
     CONF_SKILL,
     CONF_USER_ID,
@@ -60,13 +67,18 @@ from .const import (
 )
 from .device import BacklightCapability, DeviceId, StateCapability
 from .helpers import APIError, CacheStore, SmartHomePlatform
-from .notifier import CloudNotifier, Notifier, NotifierConfig, YandexDirectNotifier
+from .notifier import CloudNotifier, DeviceStatesTracker, Notifier, NotifierConfig, YandexDirectNotifier
 from .property import StateProperty
 from .property_custom import CustomProperty, get_custom_property, get_event_platform_custom_property_type
-from .schema import CapabilityType, OnOffCapabilityInstance
+from .schema import CapabilityType, DeviceDescription, OnOffCapabilityInstance
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_ACTION_CONCURRENCY = 10
+DEFAULT_ACTION_TIMEOUT = 2.0
+DEFAULT_CLOUD_REQUEST_CONCURRENCY = 16
+DEFAULT_REQUEST_TIMEOUT = {"query": 2.5, "action": 2.5}
+
 
 @dataclass
 class SkillConfig:
@@ -102,7 +114,18 @@ class ConfigEntryData:
         self._hass = hass
         self._entity_filter = entity_filter
         self._cloud_manager: CloudManager | None = None
+        self._context_user_id: str | None = None
         self._notifiers: list[Notifier] = []
+        self._exposed_entity_ids: dict[EntityId, None] | None = None
+        self._exposed_entity_ids_listeners: list[Callable[[EntityId, bool], None]] = []
+
+        self.capability_types_cache: dict[EntityId, tuple[Hashable, list[type[StateCapability[Any]]]]] = {}
+        self.property_types_cache: dict[EntityId, tuple[Hashable, list[type[StateProperty]]]] = {}
+        self.device_description_cache: dict[
+            EntityId, tuple[tuple[Any, ...], list[EntityId], DeviceDescription | None]
+        ] = {}
+        self.template_results: dict[Template, Any] = {}
+        self.value_templates: dict[tuple[str, str | None], Template] = {}
 
     async def async_setup(self) -> Self:
         """Set up the config entry data."""
@@ -111,6 +134,8 @@ class ConfigEntryData:
         await self.cache.async_load()
 
         self._entity_registry = er.async_get(self._hass)
+        self._async_setup_exposed_entity_ids()
+        self._async_setup_value_templates()
 
         with suppress(KeyError):
             integration = (await async_get_custom_components(self._hass))[DOMAIN]
@@ -173,6 +198,29 @@ class ConfigEntryData:
 
         return None
 
+    @property
+    def cloud_manager(self) -> CloudManager | None:
+        """Return the cloud connection manager (cloud connection only)."""
+        return self._cloud_manager
+
+    @property
+    def context_user_id(self) -> str | None:
+        """Return cached user id for service calls (cloud connection only)."""
+        return self._context_user_id
+
+    async def _async_update_context_user_id(self, *_: Any) -> None:
+        """Resolve and cache user id for service calls."""
+        self._context_user_id = await self.async_get_context_user_id()
+        return None
+
+    @callback
+    def _async_handle_user_removed(self, event: Event[dict[str, Any]]) -> None:
+        """Forget the cached user id for service calls when the user is removed."""
+        if event.data.get("user_id") == self._context_user_id:
+            self._context_user_id = None
+
+        return None
+
     @cached_property
     def is_reporting_states(self) -> bool:
         """Test if the config entry can report state changes."""
@@ -192,6 +240,31 @@ class ConfigEntryData:
         settings = self._yaml_config.get(CONF_SETTINGS, {})
         return bool(settings.get(CONF_CLOUD_STREAM))
 
+    @property
+    def action_concurrency(self) -> int:
+        """Return maximum number of devices that execute actions simultaneously."""
+        settings = self._yaml_config.get(CONF_SETTINGS, {})
+        return int(settings.get(CONF_ACTION_CONCURRENCY, DEFAULT_ACTION_CONCURRENCY))
+
+    @property
+    def action_timeout(self) -> float:
+        """Return timeout (in seconds) for executing all actions of a device."""
+        settings = self._yaml_config.get(CONF_SETTINGS, {})
+        return float(settings.get(CONF_ACTION_TIMEOUT, DEFAULT_ACTION_TIMEOUT))
+
+    @property
+    def cloud_request_concurrency(self) -> int:
+        """Return maximum number of cloud requests that are handled simultaneously."""
+        settings = self._yaml_config.get(CONF_SETTINGS, {})
+        return int(settings.get(CONF_CLOUD_REQUEST_CONCURRENCY, DEFAULT_CLOUD_REQUEST_CONCURRENCY))
+
+    def get_request_timeout(self, action: str) -> float | None:
+        """Return timeout (in seconds) for handling a request with the action."""
+        key = action.rsplit("/", 1)[-1]
+        settings = self._yaml_config.get(CONF_SETTINGS, {})
+        timeout = settings.get(CONF_REQUEST_TIMEOUT, {}).get(key, DEFAULT_REQUEST_TIMEOUT.get(key))
+        return float(timeout) if timeout is not None else None
+
     @property
     def use_entry_aliases(self) -> bool:
         """Test if device or area entry aliases should be used for device or room name."""
@@ -236,7 +309,7 @@ class ConfigEntryData:
         user_id = self.cloud_instance_id if self.connection_type == ConnectionType.CLOUD_PLUS else config[CONF_USER_ID]
         return SkillConfig(user_id=user_id, id=config[CONF_ID], token=config.get(CONF_TOKEN))
 
-    @property
+    @cached_property
     def color_profiles(self) -> ColorProfiles:
         """Return color profiles."""
         return ColorProfiles.from_dict(self._yaml_config.get(CONF_COLOR_PROFILE, {}))
@@ -259,6 +332,28 @@ class ConfigEntryData:
 
         return False
 
+    @property
+    def exposed_entity_ids(self) -> list[EntityId]:
+        """Return ids of entities that pass the entity filter."""
+        if self._exposed_entity_ids is None:
+            return [entity_id for entity_id in self._hass.states.async_entity_ids() if self.should_expose(entity_id)]
+
+        return list(self._exposed_entity_ids)
+
+    @callback
+    def async_add_exposed_entity_ids_listener(self, action: Callable[[EntityId, bool], None]) -> CALLBACK_TYPE:
+        """Listen for entities that become exposed or stop being exposed."""
+        if self._exposed_entity_ids is None:
+            self._async_setup_exposed_entity_ids()
+
+        self._exposed_entity_ids_listeners.append(action)
+
+        @callback
+        def remove_listener() -> None:
+            self._exposed_entity_ids_listeners.remove(action)
+
+        return remove_listener
+
     @property
     def linked_platforms(self) -> set[SmartHomePlatform]:
         """Return list of smart home platforms linked with the config entry."""
@@ -288,6 +383,54 @@ class ConfigEntryData:
 
         self._hass.config_entries.async_update_entry(self.entry, data=data)
 
+    @callback
+    def _async_setup_exposed_entity_ids(self) -> None:
+        """Build index of exposed entities and keep it updated."""
+        self._exposed_entity_ids = dict.fromkeys(
+            entity_id for entity_id in self._hass.states.async_entity_ids() if self.should_expose(entity_id)
+        )
+
+        self.entry.async_on_unload(
+            async_track_state_added_domain(self._hass, MATCH_ALL, self._async_handle_state_added_or_removed)
+        )
+        self.entry.async_on_unload(
+            async_track_state_removed_domain(self._hass, MATCH_ALL, self._async_handle_state_added_or_removed)
+        )
+        self.entry.async_on_unload(
+            self._hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_handle_entity_registry_updated)
+        )
+
+    @callback
+    def _async_update_exposed_entity_id(self, entity_id: EntityId) -> None:
+        """Add or remove the entity from the index of exposed entities."""
+        if self._exposed_entity_ids is None:
+            return
+
+        exposed = self._hass.states.get(entity_id) is not None and self.should_expose(entity_id)
+        if exposed == (entity_id in self._exposed_entity_ids):
+            return
+
+        if exposed:
+            self._exposed_entity_ids[entity_id] = None
+        else:
+            del self._exposed_entity_ids[entity_id]
+
+        for action in self._exposed_entity_ids_listeners.copy():
+            action(entity_id, exposed)
+
+    @callback
+    def _async_handle_state_added_or_removed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle adding or removing an entity state."""
+        return self._async_update_exposed_entity_id(event.data["entity_id"])
+
+    @callback
+    def _async_handle_entity_registry_updated(self, event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        """Handle entity registry changes (labels, entity id)."""
+        if event.data["action"] == "update" and (old_entity_id := event.data.get("old_entity_id")):
+            self._async_update_exposed_entity_id(old_entity_id)
+
+        return self._async_update_exposed_entity_id(event.data["entity_id"])
+
     async def _async_setup_notifiers(self, *_: Any) -> None:
         """Set up notifiers."""
         if self.is_reporting_states or self.platform == SmartHomePlatform.VK:
@@ -307,8 +450,13 @@ class ConfigEntryData:
         if not self.linked_platforms:
             return
 
-        track_templates = self._get_trackable_templates()
-        track_entity_states = self._get_trackable_entity_states()
+        states_tracker = DeviceStatesTracker(
+            self._hass,
+            self,
+            self._get_trackable_templates(),
+            self._get_trackable_entity_states(),
+            self._get_trackable_entity_values(),
+        )
         extended_log = len(self._hass.config_entries.async_entries(DOMAIN)) > 1
 
         match self.connection_type:
@@ -320,9 +468,7 @@ class ConfigEntryData:
                         platform=platform,
                         extended_log=extended_log,
                     )
-                    self._notifiers.append(
-                        CloudNotifier(self._hass, self, config, track_templates, track_entity_states)
-                    )
+                    self._notifiers.append(CloudNotifier(self._hass, self, config, states_tracker))
 
             case ConnectionType.CLOUD_PLUS:
                 if self.platform == SmartHomePlatform.YANDEX and self.skill and self.skill.token:
@@ -332,9 +478,7 @@ class ConfigEntryData:
                         skill_id=self.skill.id,
                         extended_log=extended_log,
                     )
-                    self._notifiers.append(
-                        YandexDirectNotifier(self._hass, self, config, track_templates, track_entity_states)
-                    )
+                    self._notifiers.append(YandexDirectNotifier(self._hass, self, config, states_tracker))
 
             case ConnectionType.DIRECT:
                 if self.platform == SmartHomePlatform.YANDEX and self.skill and self.skill.token:
@@ -344,9 +488,7 @@ class ConfigEntryData:
                         skill_id=self.skill.id,
                         extended_log=extended_log,
                     )
-                    self._notifiers.append(
-                        YandexDirectNotifier(self._hass, self, config, track_templates, track_entity_states)
-                    )
+                    self._notifiers.append(YandexDirectNotifier(self._hass, self, config, states_tracker))
 
         if self._notifiers:
             await asyncio.wait([asyncio.create_task(n.async_setup()) for n in self._notifiers])
@@ -357,11 +499,23 @@ class ConfigEntryData:
         """Set up the cloud connection."""
         self._cloud_manager = CloudManager(self._hass, self)
 
+        await self._async_update_context_user_id()
+        self.entry.async_on_unload(self.entry.add_update_listener(self._async_update_context_user_id))
+        self.entry.async_on_unload(self._hass.bus.async_listen(EVENT_USER_REMOVED, self._async_handle_user_removed))
+
         self._hass.loop.create_task(self._cloud_manager.async_connect())
         return self.entry.async_on_unload(
             self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._cloud_manager.async_disconnect)
         )
 
+    @callback
+    def _async_setup_value_templates(self) -> None:
+        """Build templates for entity states and attributes used by custom capabilities."""
+        for device_id, entity_config in self.entity_config.items():
+            for config_key in (CONF_ENTITY_CUSTOM_MODES, CONF_ENTITY_CUSTOM_TOGGLES, CONF_ENTITY_CUSTOM_RANGES):
+                for capability_config in entity_config.get(config_key, {}).values():
+                    capability_custom.get_value_template(self._hass, self, device_id, capability_config)
+
     def _append_trackable_templates_with_capability(
         self,
         templates: dict[Template, list[CustomCapability | CustomProperty]],
@@ -384,7 +538,7 @@ class ConfigEntryData:
             _LOGGER.debug(f"Failed to track custom capability: {e}")
             return
 
-        template = capability_custom.get_value_template(self._hass, device_id, capability_config)
+        template = capability_custom.get_value_template(self._hass, self, device_id, capability_config)
 
         if template:
             templates.setdefault(template, [])
@@ -422,9 +576,10 @@ class ConfigEntryData:
 
             for property_config in entity_config.get(CONF_ENTITY_PROPERTIES, []):
                 try:
+                    if not (template := property_custom.get_value_template(property_config)):
+                        continue
                     if not (custom_property := get_custom_property(self._hass, self, property_config, device_id)):
                         continue
-                    template = property_custom.get_value_template(self._hass, device_id, property_config)
                     templates.setdefault(template, [])
                     templates[template].append(custom_property)
                 except APIError as e:
@@ -432,6 +587,27 @@ class ConfigEntryData:
 
         return templates
 
+    def _get_trackable_entity_values(self) -> dict[EntityId, list[CustomProperty]]:
+        """Return custom properties which values are entity states or attributes to track state changes."""
+        values: dict[EntityId, list[CustomProperty]] = {}
+
+        for device_id, entity_config in self.entity_config.items():
+            if not self.should_expose(device_id):
+                continue
+
+            for property_config in entity_config.get(CONF_ENTITY_PROPERTIES, []):
+                try:
+                    if not (custom_property := get_custom_property(self._hass, self, property_config, device_id)):
+                        continue
+                    if (entity_id := custom_property.value_entity_id) is None:
+                        continue
+                    values.setdefault(entity_id, [])
+                    values[entity_id].append(custom_property)
+                except APIError as e:
+                    _LOGGER.debug(f"Failed to track custom property: {e}")
+
+        return values
+
     def _get_trackable_entity_states(
         self,
     ) -> dict[EntityId, list[tuple[DeviceId, type[StateProperty | StateCapability[Any]]]]]:
@@ -1,5 +1,6 @@
 """The Yandex Smart Home request handlers."""
 
+import asyncio
 import logging
 from typing import Any, Callable, Coroutine
 
@@ -9,13 +10,14 @@ from homeassistant.util.decorator import Registry
 
 from .const import ATTR_CAPABILITY, ATTR_ERROR_CODE, EVENT_DEVICE_ACTION
 from .device import Device, async_get_device_description, async_get_device_states, async_get_devices
-from .helpers import ActionNotAllowed, APIError, RequestData
+from .helpers import ActionNotAllowed, APIError, RequestData, batch_service_calls
 from .schema import (
     ActionRequest,
     ActionResult,
     ActionResultCapability,
     ActionResultCapabilityState,
     ActionResultDevice,
+    CapabilityInstanceAction,
     DeviceDescription,
     DeviceList,
     DeviceStates,
@@ -46,6 +48,9 @@ async def async_handle_request(hass: HomeAssistant, data: RequestData, action: s
         _LOGGER.error(f"Unexpected action '{action}'")
         return Response(request_id=data.request_id)
 
+    if data.deadline is None and (timeout := data.entry_data.get_request_timeout(action)) is not None:
+        data.deadline = hass.loop.time() + timeout
+
     try:
         return Response(request_id=data.request_id, payload=await handler(hass, data, payload))
     except APIError as err:
@@ -71,7 +76,7 @@ async def async_device_list(hass: HomeAssistant, data: RequestData, _payload: st
             devices.append(description)
 
     data.entry_data.link_platform(data.platform)
-    return DeviceList(user_id=data.request_user_id, devices=devices)
+    return DeviceList.construct(user_id=data.request_user_id, devices=devices)
 
 
 @HANDLERS.register("/user/devices/query")
@@ -81,8 +86,9 @@ async def async_devices_query(hass: HomeAssistant, data: RequestData, payload: s
     https://yandex.ru/dev/dialogs/smart-home/doc/reference/post-devices-query.html
     """
     request = StatesRequest.parse_raw(payload)
-    states = await async_get_device_states(hass, data.entry_data, [rd.id for rd in request.devices])
-    return DeviceStates(devices=states)
+    states = await async_get_device_states(hass, data.entry_data, [rd.id for rd in request.devices], data.deadline)
+
+    return DeviceStates.construct(devices=states)
 
 
 @HANDLERS.register("/user/devices/action")
@@ -92,71 +98,126 @@ async def async_devices_action(hass: HomeAssistant, data: RequestData, payload:
     https://yandex.ru/dev/dialogs/smart-home/doc/reference/post-action.html
     """
     request = ActionRequest.parse_raw(payload)
-    results: list[ActionResultDevice] = []
-
-    for device_id, actions in [(rd.id, rd.capabilities) for rd in request.payload.devices]:
-        device = Device(hass, data.entry_data, device_id, hass.states.get(device_id))
-
-        if device.unavailable:
-            hass.bus.async_fire(
-                EVENT_DEVICE_ACTION,
-                {ATTR_ENTITY_ID: device_id, ATTR_ERROR_CODE: ResponseCode.DEVICE_UNREACHABLE.value},
-                context=data.context,
-            )
-
-            results.append(
-                ActionResultDevice(
-                    id=device_id, action_result=FailedActionResult(error_code=ResponseCode.DEVICE_UNREACHABLE)
-                )
-            )
-            continue
-
-        capability_results: list[ActionResultCapability] = []
-        for action in actions:
-            try:
-                value = await device.execute(data.context, action)
-                hass.bus.async_fire(
-                    EVENT_DEVICE_ACTION,
-                    {ATTR_ENTITY_ID: device_id, ATTR_CAPABILITY: action.as_dict()},
-                    context=data.context,
-                )
-            except (APIError, ActionNotAllowed) as err:
-                if isinstance(err, APIError):
-                    _LOGGER.error(f"{err.message} ({err.code.value})")
-
-                hass.bus.async_fire(
-                    EVENT_DEVICE_ACTION,
-                    {ATTR_ENTITY_ID: device_id, ATTR_CAPABILITY: action.as_dict(), ATTR_ERROR_CODE: err.code.value},
-                    context=data.context,
-                )
-
-                capability_results.append(
-                    ActionResultCapability(
-                        type=action.type,
-                        state=ActionResultCapabilityState(
-                            instance=action.state.instance,
-                            action_result=FailedActionResult(error_code=ResponseCode(err.code)),
-                        ),
-                    )
-                )
-                continue
-
-            capability_results.append(
-                ActionResultCapability(
-                    type=action.type,
-                    state=ActionResultCapabilityState(
-                        instance=action.state.instance,
-                        value=value,
-                        action_result=SuccessActionResult(),
-                    ),
-                )
-            )
-
-        results.append(ActionResultDevice(id=device_id, capabilities=capability_results))
+    semaphore = asyncio.Semaphore(data.entry_data.action_concurrency)
+
+    with batch_service_calls(hass):
+        tasks = [
+            hass.async_create_task(_async_execute_device_actions(hass, data, semaphore, rd.id, rd.capabilities))
+            for rd in request.payload.devices
+        ]
+
+    results = await asyncio.gather(*tasks)
 
     return ActionResult(devices=results)
 
 
+async def _async_execute_device_actions(
+    hass: HomeAssistant,
+    data: RequestData,
+    semaphore: asyncio.Semaphore,
+    device_id: str,
+    actions: list[CapabilityInstanceAction],
+) -> ActionResultDevice:
+    """Execute actions for a device one by one and return the device result."""
+    device = Device(hass, data.entry_data, device_id, hass.states.get(device_id))
+
+    if device.unavailable:
+        hass.bus.async_fire(
+            EVENT_DEVICE_ACTION,
+            {ATTR_ENTITY_ID: device_id, ATTR_ERROR_CODE: ResponseCode.DEVICE_UNREACHABLE.value},
+            context=data.context,
+        )
+
+        return ActionResultDevice(
+            id=device_id, action_result=FailedActionResult(error_code=ResponseCode.DEVICE_UNREACHABLE)
+        )
+
+    capability_results: list[ActionResultCapability] = []
+    error_code: ResponseCode | None = None
+    try:
+        async with asyncio.timeout_at(data.deadline):
+            await semaphore.acquire()
+    except TimeoutError:
+        error_code = ResponseCode.DEVICE_BUSY
+    else:
+        try:
+            action_deadline = hass.loop.time() + data.entry_data.action_timeout
+            deadline = min(action_deadline, data.deadline) if data.deadline is not None else action_deadline
+            for action in actions:
+                # the action is left running on timeout, cancelling it may interrupt a service call halfway
+                task = hass.async_create_task(_async_execute_action(hass, data, device, action))
+                if not task.done():
+                    await asyncio.wait((task,), timeout=max(deadline - hass.loop.time(), 0))
+
+                if not task.done():
+                    error_code = (
+                        ResponseCode.DEVICE_UNREACHABLE if deadline == action_deadline else ResponseCode.DEVICE_BUSY
+                    )
+                    break
+
+                capability_results.append(task.result())
+        finally:
+            semaphore.release()
+
+    if error_code is not None:
+        if error_code == ResponseCode.DEVICE_BUSY:
+            _LOGGER.error(f"Request deadline exceeded while executing actions for {device_id}")
+        else:
+            _LOGGER.error(f"Timeout while executing actions for {device_id}")
+
+        for action in actions[len(capability_results) :]:
+            capability_results.append(_get_failed_action_result(hass, data, device, action, error_code))
+
+    return ActionResultDevice(id=device_id, capabilities=capability_results)
+
+
+async def _async_execute_action(
+    hass: HomeAssistant, data: RequestData, device: Device, action: CapabilityInstanceAction
+) -> ActionResultCapability:
+    """Execute an action for a device capability and return the capability result."""
+    try:
+        value = await device.execute(data.context, action)
+    except (APIError, ActionNotAllowed) as err:
+        if isinstance(err, APIError):
+            _LOGGER.error(f"{err.message} ({err.code.value})")
+
+        return _get_failed_action_result(hass, data, device, action, ResponseCode(err.code))
+
+    hass.bus.async_fire(
+        EVENT_DEVICE_ACTION,
+        {ATTR_ENTITY_ID: device.id, ATTR_CAPABILITY: action.as_dict()},
+        context=data.context,
+    )
+
+    return ActionResultCapability(
+        type=action.type,
+        state=ActionResultCapabilityState(
+            instance=action.state.instance,
+            value=value,
+            action_result=SuccessActionResult(),
+        ),
+    )
+
+
+def _get_failed_action_result(
+    hass: HomeAssistant, data: RequestData, device: Device, action: CapabilityInstanceAction, code: ResponseCode
+) -> ActionResultCapability:
+    """Fire the device action event with the error and return the failed capability result."""
+    hass.bus.async_fire(
+        EVENT_DEVICE_ACTION,
+        {ATTR_ENTITY_ID: device.id, ATTR_CAPABILITY: action.as_dict(), ATTR_ERROR_CODE: code.value},
+        context=data.context,
+    )
+
+    return ActionResultCapability(
+        type=action.type,
+        state=ActionResultCapabilityState(
+            instance=action.state.instance,
+            action_result=FailedActionResult(error_code=code),
+        ),
+    )
+
+
 @HANDLERS.register("/user/unlink")
 async def async_user_unlink(_hass: HomeAssistant, data: RequestData, _payload: str) -> None:
     """Handle request indicates that the user has unlink the account.
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+import logging
+import re
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Protocol, TypeVar
 from urllib.parse import urlparse
 
-from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_OFF, SERVICE_TURN_ON
+from homeassistant.core import CALLBACK_TYPE, Context, Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import area_registry as ar, device_registry as dr, entity_registry as er
 from homeassistant.helpers.storage import Store
+from homeassistant.helpers.template import Template
+from homeassistant.util.hass_dict import HassKey
+import voluptuous as vol
 
 from .const import DOMAIN
 from .schema import ResponseCode
@@ -18,6 +27,8 @@ from .schema import ResponseCode
 if TYPE_CHECKING:
     from .entry_data import ConfigEntryData
 
+_LOGGER = logging.getLogger(__name__)
+
 STORE_CACHE_ATTRS = "attrs"
 
 
@@ -52,6 +63,136 @@ def _get_registry_entries(hass: HomeAssistant, entity_id: str) -> tuple[
     return entity_entry, device_entry, area_entry
 
 
+_REGISTRY_INFO_CACHE_KEY: HassKey[RegistryInfoCache] = HassKey(f"{DOMAIN}_registry_info_cache")
+
+_ENTRY_ALIAS_RE = re.compile(r"^[а-яё0-9 ]+$", flags=re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class RegistryInfo:
+    """Entity information resolved from the entity, device and area registries."""
+
+    name: str | None = None
+    room: str | None = None
+    manufacturer: str | None = None
+    model: str | None = None
+    sw_version: str | None = None
+
+
+class RegistryInfoCache:
+    """Cache of entity information resolved from the registries, updated on the registries changes."""
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the cache."""
+        self._hass = hass
+        self._data: dict[tuple[str, bool], RegistryInfo] = {}
+        self._unsub_listeners: list[CALLBACK_TYPE] = [
+            hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_handle_entity_registry_updated),
+            hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_clear),
+            hass.bus.async_listen(ar.EVENT_AREA_REGISTRY_UPDATED, self._async_clear),
+        ]
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop tracking the registries changes and drop all cached information."""
+        for unsub in self._unsub_listeners:
+            unsub()
+
+        self._unsub_listeners.clear()
+        self._data.clear()
+
+    @callback
+    def async_get(self, entity_id: str, use_entry_aliases: bool) -> RegistryInfo:
+        """Return information about the entity."""
+        key = (entity_id, use_entry_aliases)
+        if (info := self._data.get(key)) is None:
+            info = self._data[key] = self._async_resolve(entity_id, use_entry_aliases)
+
+        return info
+
+    @callback
+    def _async_resolve(self, entity_id: str, use_entry_aliases: bool) -> RegistryInfo:
+        """Resolve information about the entity from the registries."""
+        entity_entry, device_entry, area_entry = _get_registry_entries(self._hass, entity_id)
+
+        name = _get_entry_alias(entity_entry.aliases, use_entry_aliases) if entity_entry else None
+        room = (_get_entry_alias(area_entry.aliases, use_entry_aliases) or area_entry.name) if area_entry else None
+        if device_entry is None:
+            return RegistryInfo(name=name, room=room)
+
+        return RegistryInfo(
+            name=name,
+            room=room,
+            manufacturer=device_entry.manufacturer,
+            model=device_entry.model,
+            sw_version=device_entry.sw_version,
+        )
+
+    @callback
+    def _async_handle_entity_registry_updated(self, event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        """Drop the cached information of the updated entity."""
+        entity_ids = [event.data["entity_id"]]
+        if event.data["action"] == "update" and (old_entity_id := event.data.get("old_entity_id")):
+            entity_ids.append(old_entity_id)
+
+        for entity_id in entity_ids:
+            for use_entry_aliases in (True, False):
+                self._data.pop((entity_id, use_entry_aliases), None)
+
+    @callback
+    def _async_clear(self, *_: Any) -> None:
+        """Drop all cached information."""
+        self._data.clear()
+
+
+@callback
+def async_get_registry_info_cache(hass: HomeAssistant) -> RegistryInfoCache:
+    """Return the registry information cache."""
+    if (cache := hass.data.get(_REGISTRY_INFO_CACHE_KEY)) is None:
+        cache = hass.data[_REGISTRY_INFO_CACHE_KEY] = RegistryInfoCache(hass)
+
+    return cache
+
+
+@callback
+def async_unload_registry_info_cache(hass: HomeAssistant) -> None:
+    """Unload the registry information cache if it was created."""
+    if (cache := hass.data.pop(_REGISTRY_INFO_CACHE_KEY, None)) is not None:
+        cache.async_unload()
+
+
+@callback
+def async_get_value_template(
+    hass: HomeAssistant, entry_data: ConfigEntryData, entity_id: str, attribute: str | None = None
+) -> Template:
+    """Return a template for the entity state or attribute (built once per config entry)."""
+    key = (entity_id, attribute)
+    if (template := entry_data.value_templates.get(key)) is None:
+        if attribute:
+            source = "{{ state_attr('%s', '%s') }}" % (entity_id, attribute)
+        else:
+            source = "{{ states('%s') }}" % entity_id
+
+        template = entry_data.value_templates[key] = Template(source, hass)
+
+    return template
+
+
+def _get_entry_alias(aliases: set[str] | None, use_entry_aliases: bool) -> str | None:
+    """Return best matched entry alias."""
+    filtered_aliases: set[str] = set()
+    for alias in aliases or []:
+        if "алиса:" in alias.lower():
+            filtered_aliases.add(alias.split(":", 1)[1].strip())
+        elif use_entry_aliases and _ENTRY_ALIAS_RE.search(alias):
+            filtered_aliases.add(alias)
+
+    if not filtered_aliases:
+        return None
+
+    return sorted(filtered_aliases)[0]
+
+
 class APIError(HomeAssistantError):
     """Base API error."""
 
@@ -91,6 +232,11 @@ class CacheStore:
 
         return self._data[STORE_CACHE_ATTRS][entity_id].get(attr)
 
+    def get_attr_values(self, entity_id: str) -> Mapping[str, Any]:
+        """Return all cached attribute values for entity."""
+        values: Mapping[str, Any] = self._data[STORE_CACHE_ATTRS].get(entity_id, {})
+        return values
+
     @callback
     def save_attr_value(self, entity_id: str, attr: str, value: Any) -> None:
         """Cache entity's attribute value to disk."""
@@ -143,6 +289,7 @@ class RequestData:
     platform: SmartHomePlatform
     request_user_id: str | None
     request_id: str | None
+    deadline: float | None = None
 
 
 class HasInstance(Protocol):
@@ -170,3 +317,241 @@ class ListRegistry[_T](list[_T]):
         """Register decorated type."""
         self.append(obj)
         return obj
+
+
+class DomainRegistry[_T: type[Any]](ListRegistry[_T]):
+    """List Registry of types with domains and device_classes attributes that can be looked up by domain."""
+
+    def __init__(self, items: Iterable[_T] = ()):
+        """Initialize the registry."""
+        super().__init__(items)
+        self._lookup_cache: dict[tuple[str, str | None], list[_T]] = {}
+
+    def register(self, obj: _T) -> _T:
+        """Register decorated type."""
+        self._lookup_cache.clear()
+        return super().register(obj)
+
+    def get_for_domain(self, domain: str, device_class: str | None = None) -> list[_T]:
+        """Return registered types that may be applied to the domain and device class (in registration order)."""
+        key = (domain, device_class)
+        if (items := self._lookup_cache.get(key)) is None:
+            items = self._lookup_cache[key] = [
+                obj
+                for obj in self
+                if (obj.domains is None or domain in obj.domains)
+                and (obj.device_classes is None or device_class in obj.device_classes)
+            ]
+
+        return items
+
+
+type _ServiceCallKey = tuple[str, str, Any, bool, str]
+
+_NOT_BATCHABLE_DOMAINS = {"script", "scene"}
+_BATCHABLE_SERVICES = {SERVICE_TURN_ON, SERVICE_TURN_OFF, "volume_set", "volume_mute"}
+
+
+def _is_batchable_service(domain: str, service: str) -> bool:
+    """Test if the service sets an absolute state and can be safely repeated for the same entity."""
+    if domain in _NOT_BATCHABLE_DOMAINS:
+        return False
+
+    return service in _BATCHABLE_SERVICES or service.startswith("set_")
+
+
+@dataclass
+class _BatchedServiceCall:
+    """Hold service calls that differ only in the target entity."""
+
+    domain: str
+    service: str
+    service_data: dict[str, Any]
+    blocking: bool
+    context: Context | None
+    waiters: list[tuple[str, asyncio.Future[None]]] = field(default_factory=list)
+
+
+class ServiceCallBatcher:
+    """Coalesce identical service calls targeting different entities into a single service call."""
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the batcher."""
+        self._hass = hass
+        self._pending: dict[_ServiceCallKey, _BatchedServiceCall] = {}
+        self._flush_scheduled = False
+
+    async def async_call(
+        self,
+        domain: str,
+        service: str,
+        service_data: dict[str, Any],
+        blocking: bool,
+        context: Context | None,
+    ) -> None:
+        """Queue the service call and wait until the batch it was added to is executed."""
+        entity_id = service_data.get(ATTR_ENTITY_ID)
+        data = {k: v for k, v in service_data.items() if k != ATTR_ENTITY_ID}
+        try:
+            key = (domain, service, _freeze(data), blocking, context.id if context else "")
+            hash(key)
+        except TypeError:
+            key = None
+
+        if key is None or not isinstance(entity_id, str) or not _is_batchable_service(domain, service):
+            await self._hass.services.async_call(domain, service, service_data, blocking=blocking, context=context)
+            return
+
+        if (call := self._pending.get(key)) is None:
+            call = self._pending[key] = _BatchedServiceCall(domain, service, data, blocking, context)
+
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        call.waiters.append((entity_id, future))
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._hass.loop.call_soon(self._async_flush)
+
+        await future
+
+    @callback
+    def _async_flush(self) -> None:
+        """Execute all queued service calls."""
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+
+        for call in pending.values():
+            call.waiters = [(entity_id, future) for entity_id, future in call.waiters if not future.done()]
+            if call.waiters:
+                self._hass.async_create_task(self._async_execute(call), eager_start=False)
+
+    async def _async_execute(self, call: _BatchedServiceCall) -> None:
+        """Execute the batched service call and resolve its waiters."""
+        entity_ids = list(dict.fromkeys(entity_id for entity_id, _ in call.waiters))
+        if len(entity_ids) == 1:
+            await self._async_execute_single(call, entity_ids[0], [future for _, future in call.waiters])
+            return
+
+        try:
+            await self._hass.services.async_call(
+                call.domain,
+                call.service,
+                {**call.service_data, ATTR_ENTITY_ID: entity_ids},
+                blocking=call.blocking,
+                context=call.context,
+            )
+        except (HomeAssistantError, vol.Invalid) as e:
+            _LOGGER.warning(
+                f"Batched call of {call.domain}.{call.service} for {', '.join(entity_ids)} failed ({e!r}), "
+                f"calling for each entity"
+            )
+            await asyncio.gather(
+                *(
+                    self._async_execute_single(
+                        call, entity_id, [future for waiter_id, future in call.waiters if waiter_id == entity_id]
+                    )
+                    for entity_id in entity_ids
+                )
+            )
+            return
+        except Exception as e:
+            _resolve_futures([future for _, future in call.waiters], e)
+            return
+
+        _resolve_futures([future for _, future in call.waiters])
+
+    async def _async_execute_single(
+        self, call: _BatchedServiceCall, entity_id: str, futures: list[asyncio.Future[None]]
+    ) -> None:
+        """Execute the service call for a single entity and resolve its waiters."""
+        try:
+            await self._hass.services.async_call(
+                call.domain,
+                call.service,
+                {**call.service_data, ATTR_ENTITY_ID: entity_id},
+                blocking=call.blocking,
+                context=call.context,
+            )
+        except Exception as e:
+            _resolve_futures(futures, e)
+        else:
+            _resolve_futures(futures)
+
+
+_service_call_batcher: ContextVar[ServiceCallBatcher | None] = ContextVar("service_call_batcher", default=None)
+
+
+@contextmanager
+def batch_service_calls(hass: HomeAssistant) -> Iterator[None]:
+    """Batch service calls made by async_call_service in tasks created within the context."""
+    token = _service_call_batcher.set(ServiceCallBatcher(hass))
+    try:
+        yield
+    finally:
+        _service_call_batcher.reset(token)
+
+
+async def async_call_service(
+    hass: HomeAssistant,
+    domain: str,
+    service: str,
+    service_data: dict[str, Any],
+    blocking: bool = False,
+    context: Context | None = None,
+) -> None:
+    """Call a service, batching it with identical calls for other entities when possible."""
+    if (batcher := _service_call_batcher.get()) is not None:
+        await batcher.async_call(domain, service, service_data, blocking, context)
+        return
+
+    await hass.services.async_call(domain, service, service_data, blocking=blocking, context=context)
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable representation of service data."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+
+    return value
+
+
+def _resolve_futures(futures: list[asyncio.Future[None]], exc: BaseException | None = None) -> None:
+    """Set the result or exception to not yet done futures."""
+    for future in futures:
+        if future.done():
+            continue
+
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(None)
+
+
+_template_render_cache: ContextVar[dict[Template, Any] | None] = ContextVar("template_render_cache", default=None)
+
+
+@contextmanager
+def cache_template_renders() -> Iterator[None]:
+    """Reuse results of templates rendered within the context (for templates equal by the source)."""
+    token = _template_render_cache.set({})
+    try:
+        yield
+    finally:
+        _template_render_cache.reset(token)
+
+
+@callback
+def async_render_template(template: Template, tracked_results: Mapping[Template, Any] | None = None) -> Any:
+    """Render the template or return the result from tracked results or rendered already in the current context."""
+    if tracked_results is not None and template in tracked_results:
+        return tracked_results[template]
+
+    if (cache := _template_render_cache.get()) is None:
+        return template.async_render()
+
+    if template not in cache:
+        cache[template] = template.async_render()
+
+    return cache[template]
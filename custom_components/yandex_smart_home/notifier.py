@@ -4,18 +4,17 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
-from contextlib import suppress
 from dataclasses import dataclass
 from datetime import timedelta
 import itertools
 import logging
 from random import randint
-from typing import TYPE_CHECKING, Any, Mapping, Protocol, Self, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Protocol, Self, Sequence
 
 from aiohttp import ClientTimeout, JsonPayload, hdrs
 from aiohttp.client_exceptions import ClientConnectionError
-from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED
-from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, State
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, State, callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE, async_create_clientsession
 from homeassistant.helpers.event import (
@@ -24,6 +23,7 @@ from homeassistant.helpers.event import (
     TrackTemplateResult,
     TrackTemplateResultInfo,
     async_call_later,
+    async_track_state_change_event,
     async_track_template_result,
 )
 from homeassistant.helpers.template import Template
@@ -69,11 +69,24 @@ class NotifierConfig:
     extended_log: bool = False
 
 
+type DeviceStateKey = tuple[str, str, str]
+
+
 class ReportableDeviceState(Protocol):
     """Protocol type for device capabilities and properties."""
 
     device_id: str
 
+    @property
+    def type(self) -> str:
+        """Return type of the capability or property."""
+        ...
+
+    @property
+    def instance(self) -> str:
+        """Return instance of the capability or property."""
+        ...
+
     @property
     @abstractmethod
     def time_sensitive(self) -> bool:
@@ -112,47 +125,75 @@ class ReportableTemplateDeviceState(ReportableDeviceState, Protocol):
         ...
 
 
+class ReportableEntityValueDeviceState(ReportableDeviceState, Protocol):
+    """Protocol type for custom properties which value is an entity state or attribute."""
+
+    @abstractmethod
+    def new_with_entity_state(self, state: State) -> Self:
+        """Return copy of the state with value from the entity state."""
+        ...
+
+
+def get_device_state_key(state: ReportableDeviceState) -> DeviceStateKey:
+    """Return a key that identifies a capability or property of a device."""
+    return state.device_id, state.type, state.instance
+
+
+def get_changed_device_states(
+    new_states: Sequence[ReportableDeviceState],
+    old_states: Iterable[ReportableDeviceState],
+) -> list[ReportableDeviceState]:
+    """Return states which values differ from old states."""
+    changed_states: list[ReportableDeviceState] = []
+    old_states_by_key = {get_device_state_key(s): s for s in old_states}
+
+    for state in new_states:
+        try:
+            if state.check_value_change(old_states_by_key.get(get_device_state_key(state))):
+                changed_states.append(state)
+        except APIError as e:
+            _LOGGER.warning(e)
+
+    return changed_states
+
+
 class PendingStates:
     """Hold states that about to be reported."""
 
     def __init__(self) -> None:
         """Initialize."""
-        self._device_states: dict[str, list[ReportableDeviceState]] = {}
-        self._lock = asyncio.Lock()
+        self._device_states: dict[str, dict[tuple[str, str], ReportableDeviceState]] = {}
+        self._time_sensitive_count = 0
 
-    async def async_add(
+    @callback
+    def async_add(
         self,
         new_states: Sequence[ReportableDeviceState],
-        old_states: Sequence[ReportableDeviceState],
+        old_states: Iterable[ReportableDeviceState],
     ) -> list[ReportableDeviceState]:
         """Add changed states to pending and return list of them."""
-        scheduled_states: list[ReportableDeviceState] = []
-
-        async with self._lock:
-            for state in new_states:
-                try:
-                    old_state = old_states[old_states.index(state)]
-                except ValueError:
-                    old_state = None
-                try:
-                    if state.check_value_change(old_state):
-                        device_states = self._device_states.setdefault(state.device_id, [])
-                        with suppress(ValueError):
-                            device_states.remove(state)
+        scheduled_states = get_changed_device_states(new_states, old_states)
+        self.async_extend(scheduled_states)
+        return scheduled_states
 
-                        device_states.append(state)
-                        scheduled_states.append(state)
-                except APIError as e:
-                    _LOGGER.warning(e)
+    @callback
+    def async_extend(self, states: Iterable[ReportableDeviceState]) -> None:
+        """Add already changed states to pending."""
+        for state in states:
+            device_states = self._device_states.setdefault(state.device_id, {})
+            key = (state.type, state.instance)
+            if (replaced_state := device_states.pop(key, None)) is not None:
+                self._time_sensitive_count -= replaced_state.time_sensitive
 
-        return scheduled_states
+            device_states[key] = state
+            self._time_sensitive_count += state.time_sensitive
 
-    async def async_get_all(self) -> dict[str, list[ReportableDeviceState]]:
+    @callback
+    def async_get_all(self) -> dict[str, list[ReportableDeviceState]]:
         """Return all states and clear pending."""
-        async with self._lock:
-            states = self._device_states.copy()
-            self._device_states.clear()
-            return states
+        device_states, self._device_states = self._device_states, {}
+        self._time_sensitive_count = 0
+        return {device_id: list(states.values()) for device_id, states in device_states.items()}
 
     @property
     def empty(self) -> bool:
@@ -162,11 +203,216 @@ class PendingStates:
     @property
     def time_sensitive(self) -> bool:
         """Test if pending states should be sent immediately."""
-        for state in itertools.chain(*self._device_states.values()):
-            if state.time_sensitive:
-                return True
+        return self._time_sensitive_count > 0
+
+
+class DeviceStatesTracker:
+    """Detect changes of capabilities and properties and pass them to all notifiers of a config entry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_data: ConfigEntryData,
+        track_templates: Mapping[Template, Sequence[ReportableTemplateDeviceState]],
+        track_entity_states: Mapping[EntityId, Sequence[tuple[DeviceId, type[ReportableDeviceStateFromEntityState]]]],
+        track_entity_values: Mapping[EntityId, Sequence[ReportableEntityValueDeviceState]],
+    ):
+        """Initialize."""
+        self._hass = hass
+        self._entry_data = entry_data
+        self._listeners: list[Callable[[list[ReportableDeviceState]], None]] = []
+
+        self._entity_snapshots: dict[EntityId, tuple[State, dict[DeviceStateKey, ReportableDeviceState]]] = {}
+
+        self._track_entity_states = track_entity_states
+        self._track_entity_values = track_entity_values
+        self._track_templates = track_templates
+        self._template_changes_tracker: TrackTemplateResultInfo | None = None
+        self._cacheable_templates: set[Template] = set()
+
+        self._unsub_exposed_entity_ids: CALLBACK_TYPE | None = None
+        self._unsub_entity_state_changed: dict[EntityId, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_add_listener(self, action: Callable[[list[ReportableDeviceState]], None]) -> CALLBACK_TYPE:
+        """Listen for changed capabilities and properties, start tracking on the first listener."""
+        if not self._listeners:
+            self._async_setup()
+
+        self._listeners.append(action)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(action)
+            if not self._listeners:
+                self._async_unload()
+
+        return remove_listener
+
+    @callback
+    def _async_setup(self) -> None:
+        """Start tracking state and template changes."""
+        self._unsub_exposed_entity_ids = self._entry_data.async_add_exposed_entity_ids_listener(
+            self._async_exposed_entity_id_changed
+        )
+        for entity_id in self._entry_data.exposed_entity_ids:
+            self._async_track_entity_state(entity_id)
+        for entity_id in itertools.chain(self._track_entity_states, self._track_entity_values):
+            self._async_track_entity_state(entity_id)
+
+        if self._track_templates:
+            self._cacheable_templates = {t for t in self._track_templates if _is_template_result_cacheable(t)}
+            self._template_changes_tracker = async_track_template_result(
+                self._hass,
+                [TrackTemplate(t, None) for t in self._track_templates],
+                self._async_template_result_changed,
+            )
+            self._template_changes_tracker.async_refresh()
+
+    @callback
+    def _async_unload(self) -> None:
+        """Stop tracking state and template changes."""
+        for unsub in [self._unsub_exposed_entity_ids, *self._unsub_entity_state_changed.values()]:
+            if unsub:
+                unsub()
+
+        self._unsub_exposed_entity_ids = None
+        self._unsub_entity_state_changed.clear()
+
+        if self._template_changes_tracker is not None:
+            self._template_changes_tracker.async_remove()
+            self._template_changes_tracker = None
+
+        self._entity_snapshots.clear()
+        self._entry_data.template_results.clear()
+
+    @callback
+    def _async_notify_listeners(self, changed_states: list[ReportableDeviceState]) -> None:
+        """Pass changed states to the listeners."""
+        if not changed_states:
+            return None
+
+        for action in self._listeners.copy():
+            action(changed_states)
+
+        return None
+
+    @callback
+    def _async_template_result_changed(
+        self,
+        event_type: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        """Handle track template changes."""
+        for result in updates:
+            if result.template not in self._cacheable_templates:
+                continue
+
+            if isinstance(result.result, TemplateError):
+                self._entry_data.template_results.pop(result.template, None)
+            else:
+                self._entry_data.template_results[result.template] = result.result
+
+        if event_type is None:  # update during setup
+            return None
+
+        changed_states: list[ReportableDeviceState] = []
+        for result in updates:
+            if isinstance(result.result, TemplateError):
+                _LOGGER.warning(f"Error while processing template: {result.template.template}", exc_info=result.result)
+                continue
+            if isinstance(result.last_result, TemplateError):
+                result.last_result = None
+
+            for state in self._track_templates[result.template]:
+                old_state = state.new_with_value(result.last_result)
+                new_state = state.new_with_value(result.result)
+
+                changed_states.extend(get_changed_device_states([new_state], [old_state]))
+
+        return self._async_notify_listeners(changed_states)
+
+    @callback
+    def _async_track_entity_state(self, entity_id: EntityId) -> None:
+        """Start tracking state changes of the entity."""
+        if entity_id not in self._unsub_entity_state_changed:
+            self._unsub_entity_state_changed[entity_id] = async_track_state_change_event(
+                self._hass, entity_id, self._async_state_changed
+            )
+
+    @callback
+    def _async_exposed_entity_id_changed(self, entity_id: EntityId, exposed: bool) -> None:
+        """Handle changes of the exposed entities."""
+        if exposed:
+            self._async_track_entity_state(entity_id)
+            if new_state := self._hass.states.get(entity_id):
+                self._async_handle_state_change(entity_id, None, new_state)
+
+            return None
+
+        if (
+            entity_id not in self._track_entity_states
+            and entity_id not in self._track_entity_values
+            and (unsub := self._unsub_entity_state_changed.pop(entity_id, None))
+        ):
+            unsub()
+
+        self._entity_snapshots.pop(entity_id, None)
+        return None
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle state changes."""
+        return self._async_handle_state_change(
+            str(event.data.get(ATTR_ENTITY_ID)), event.data.get("old_state"), event.data.get("new_state")
+        )
+
+    @callback
+    def _async_handle_state_change(self, entity_id: EntityId, old_state: State | None, new_state: State | None) -> None:
+        """Detect capabilities and properties changed by the entity state change."""
+        if not new_state:
+            self._entity_snapshots.pop(entity_id, None)
+            return None
+
+        snapshot_state, snapshot = self._entity_snapshots.get(entity_id, (None, {}))
+        if snapshot_state is new_state:  # already handled when the entity was exposed
+            return None
+
+        new_device_states = self._get_entity_device_states(entity_id, new_state)
+
+        old_device_states: Iterable[ReportableDeviceState] = []
+        if old_state:
+            if snapshot_state is old_state:
+                old_device_states = snapshot.values()
+            else:
+                old_device_states = self._get_entity_device_states(entity_id, old_state)
+
+        self._entity_snapshots[entity_id] = (new_state, {get_device_state_key(s): s for s in new_device_states})
+
+        return self._async_notify_listeners(get_changed_device_states(new_device_states, old_device_states))
+
+    def _get_entity_device_states(self, entity_id: str, state: State) -> list[ReportableDeviceState]:
+        """Return capabilities and properties that depend on the entity state."""
+        device_states: list[ReportableDeviceState] = []
+
+        for device_id, cls in self._track_entity_states.get(entity_id, []):
+            device_states.append(cls(self._hass, self._entry_data, device_id, state))
+
+        for device_state in self._track_entity_values.get(entity_id, []):
+            device_states.append(device_state.new_with_entity_state(state))
+
+        device = Device(self._hass, self._entry_data, entity_id, state)
+        if device.should_expose:
+            device_states.extend(device.get_state_capabilities())
+            device_states.extend(device.get_state_properties())
+
+        return device_states
 
-        return False
+
+def _is_template_result_cacheable(template: Template) -> bool:
+    """Test if the template tracker re-renders the template immediately on every change of its dependencies."""
+    info = template.async_render_to_info()
+    return not (info.exception or info.has_time or info.rate_limit is not None or info.all_states or info.domains)
 
 
 class Notifier(ABC):
@@ -177,8 +423,7 @@ class Notifier(ABC):
         hass: HomeAssistant,
         entry_data: ConfigEntryData,
         config: NotifierConfig,
-        track_templates: Mapping[Template, Sequence[ReportableTemplateDeviceState]],
-        track_entity_states: Mapping[EntityId, Sequence[tuple[DeviceId, type[ReportableDeviceStateFromEntityState]]]],
+        states_tracker: DeviceStatesTracker,
     ):
         """Initialize."""
         self._hass = hass
@@ -187,12 +432,9 @@ class Notifier(ABC):
         self._session = async_create_clientsession(hass)
 
         self._pending = PendingStates()
+        self._states_tracker = states_tracker
 
-        self._track_entity_states = track_entity_states
-        self._track_templates = track_templates
-        self._template_changes_tracker: TrackTemplateResultInfo | None = None
-
-        self._unsub_state_changed: CALLBACK_TYPE | None = None
+        self._unsub_states_tracker: CALLBACK_TYPE | None = None
         self._unsub_initial_report: CALLBACK_TYPE | None = None
         self._unsub_heartbeat_report: CALLBACK_TYPE | None = None
         self._unsub_report_states: CALLBACK_TYPE | None = None
@@ -200,7 +442,7 @@ class Notifier(ABC):
 
     async def async_setup(self) -> None:
         """Set up the notifier."""
-        self._unsub_state_changed = self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+        self._unsub_states_tracker = self._states_tracker.async_add_listener(self._async_states_changed)
         self._unsub_initial_report = async_call_later(
             self._hass, INITIAL_REPORT_DELAY, HassJob(self._async_initial_report)
         )
@@ -213,20 +455,12 @@ class Notifier(ABC):
             self._hass, DISCOVERY_REQUEST_DELAY, HassJob(self.async_send_discovery)
         )
 
-        if self._track_templates:
-            self._template_changes_tracker = async_track_template_result(
-                self._hass,
-                [TrackTemplate(t, None) for t in self._track_templates],
-                self._async_template_result_changed,
-            )
-            self._template_changes_tracker.async_refresh()
-
         return None
 
     async def async_unload(self) -> None:
         """Unload the notifier."""
         for unsub in [
-            self._unsub_state_changed,
+            self._unsub_states_tracker,
             self._unsub_initial_report,
             self._unsub_heartbeat_report,
             self._unsub_report_states,
@@ -235,16 +469,12 @@ class Notifier(ABC):
             if unsub:
                 unsub()
 
-        self._unsub_state_changed = None
+        self._unsub_states_tracker = None
         self._unsub_initial_report = None
         self._unsub_heartbeat_report = None
         self._unsub_report_states = None
         self._unsub_discovery = None
 
-        if self._template_changes_tracker is not None:
-            self._template_changes_tracker.async_remove()
-            self._template_changes_tracker = None
-
         return None
 
     async def async_send_discovery(self, *_: Any) -> None:
@@ -283,7 +513,7 @@ class Notifier(ABC):
         """Send notification about device state change."""
         states: list[DeviceState] = []
 
-        for device_id, device_states in (await self._pending.async_get_all()).items():
+        for device_id, device_states in self._pending.async_get_all().items():
             capabilities: list[CapabilityInstanceState] = []
             properties: list[PropertyInstanceState] = []
 
@@ -303,7 +533,7 @@ class Notifier(ABC):
 
             if capabilities or properties:
                 states.append(
-                    DeviceState(
+                    DeviceState.construct(
                         id=device_id,
                         capabilities=capabilities or None,
                         properties=properties or None,
@@ -311,8 +541,8 @@ class Notifier(ABC):
                 )
 
         if states:
-            request = CallbackStatesRequest(
-                payload=CallbackStatesRequestPayload(user_id=self._config.user_id, devices=states)
+            request = CallbackStatesRequest.construct(
+                payload=CallbackStatesRequestPayload.construct(user_id=self._config.user_id, devices=states)
             )
 
             asyncio.create_task(self._async_send_request(f"{self._base_url}/state", request))
@@ -331,12 +561,13 @@ class Notifier(ABC):
     async def _async_send_request(self, url: str, request: CallbackRequest) -> None:
         """Send a request to the url."""
         try:
-            self._debug_log(f"Request: {url} (POST data: {request.as_json()})")
+            request_body = request.as_json()
+            self._debug_log(f"Request: {url} (POST data: {request_body})")
 
             r = await self._session.post(
                 url,
                 headers=self._request_headers,
-                data=JsonPayload(request.as_json(), dumps=lambda p: p),
+                data=JsonPayload(request_body, dumps=lambda p: p),
                 timeout=ClientTimeout(total=5),
             )
 
@@ -363,61 +594,11 @@ class Notifier(ABC):
 
         return None
 
-    async def _async_template_result_changed(
-        self,
-        event_type: Event[EventStateChangedData] | None,
-        updates: list[TrackTemplateResult],
-    ) -> None:
-        """Handle track template changes."""
-        if event_type is None:  # update during setup
-            return None
-
-        for result in updates:
-            if isinstance(result.result, TemplateError):
-                _LOGGER.warning(f"Error while processing template: {result.template.template}", exc_info=result.result)
-                continue
-            if isinstance(result.last_result, TemplateError):
-                result.last_result = None
-
-            for state in self._track_templates[result.template]:
-                old_state = state.new_with_value(result.last_result)
-                new_state = state.new_with_value(result.result)
-
-                for pending_state in await self._pending.async_add([new_state], [old_state]):
-                    self._debug_log(
-                        f"State report with value '{pending_state.get_value()}' scheduled for {pending_state!r}"
-                    )
-
-        return self._schedule_report_states()
-
-    async def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
-        """Handle state changes."""
-        entity_id = str(event.data.get(ATTR_ENTITY_ID))
-        old_state: State | None = event.data.get("old_state")
-        new_state: State | None = event.data.get("new_state")
-
-        if not new_state:
-            return None
-
-        old_device_states: list[ReportableDeviceState] = []
-        new_device_states: list[ReportableDeviceState] = []
-
-        for device_id, cls in self._track_entity_states.get(entity_id, []):
-            new_device_states.append(cls(self._hass, self._entry_data, device_id, new_state))
-            if old_state:
-                old_device_states.append(cls(self._hass, self._entry_data, device_id, old_state))
-
-        new_device = Device(self._hass, self._entry_data, entity_id, new_state)
-        if new_device.should_expose:
-            new_device_states.extend(new_device.get_state_capabilities())
-            new_device_states.extend(new_device.get_state_properties())
-
-            if old_state:
-                old_device = Device(self._hass, self._entry_data, entity_id, old_state)
-                old_device_states.extend(old_device.get_state_capabilities())
-                old_device_states.extend(old_device.get_state_properties())
-
-        for pending_state in await self._pending.async_add(new_device_states, old_device_states):
+    @callback
+    def _async_states_changed(self, changed_states: list[ReportableDeviceState]) -> None:
+        """Schedule report of changed capabilities and properties."""
+        self._pending.async_extend(changed_states)
+        for pending_state in changed_states:
             self._debug_log(f"State report with value '{pending_state.get_value()}' scheduled for {pending_state!r}")
 
         return self._schedule_report_states()
@@ -425,25 +606,31 @@ class Notifier(ABC):
     async def _async_initial_report(self, *_: Any) -> None:
         """Schedule initial report."""
         self._debug_log("Reporting initial states")
-        for state in self._hass.states.async_all():
+        for entity_id in self._entry_data.exposed_entity_ids:
+            if (state := self._hass.states.get(entity_id)) is None:
+                continue
+
             device = Device(self._hass, self._entry_data, state.entity_id, state)
             if not device.should_expose:
                 continue
 
-            await self._pending.async_add(device.get_capabilities(), [])
-            await self._pending.async_add([p for p in device.get_properties() if p.heartbeat_report], [])
+            self._pending.async_add(device.get_capabilities(), [])
+            self._pending.async_add([p for p in device.get_properties() if p.heartbeat_report], [])
 
         return self._schedule_report_states()
 
     async def _async_hearbeat_report(self, *_: Any) -> None:
         """Schedule periodical state report."""
         self._debug_log("Reporting states (heartbeat)")
-        for state in self._hass.states.async_all():
+        for entity_id in self._entry_data.exposed_entity_ids:
+            if (state := self._hass.states.get(entity_id)) is None:
+                continue
+
             device = Device(self._hass, self._entry_data, state.entity_id, state)
             if not device.should_expose:
                 continue
 
-            await self._pending.async_add([p for p in device.get_properties() if p.heartbeat_report], [])
+            self._pending.async_add([p for p in device.get_properties() if p.heartbeat_report], [])
 
         self._unsub_heartbeat_report = async_call_later(
             self._hass,
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any, Protocol, Self, runtime_checkable
 from homeassistant.const import ATTR_DEVICE_CLASS
 from homeassistant.core import HomeAssistant, State
 
-from .helpers import ListRegistry
+from .helpers import DomainRegistry
 from .schema import (
     PropertyDescription,
     PropertyInstance,
@@ -78,8 +78,8 @@ class Property(Protocol):
     def get_instance_state(self) -> PropertyInstanceState | None:
         """Return a state for a state query request."""
         if (value := self.get_value()) is not None:
-            return PropertyInstanceState(
-                type=self.type, state=PropertyInstanceStateValue(instance=self.instance, value=value)
+            return PropertyInstanceState.construct(
+                type=self.type, state=PropertyInstanceStateValue.construct(instance=self.instance, value=value)
             )
 
         return None
@@ -120,6 +120,12 @@ class StateProperty(Property, Protocol):
     state: State
     device_id: str
 
+    domains: set[str] | None = None
+    """Domains the property may be supported for (None for any domain)."""
+
+    device_classes: set[str] | None = None
+    """Device classes the property may be supported for (None for any device class)."""
+
     _hass: HomeAssistant
     _entry_data: ConfigEntryData
 
@@ -137,4 +143,4 @@ class StateProperty(Property, Protocol):
         return self.state.attributes.get(ATTR_DEVICE_CLASS)
 
 
-STATE_PROPERTIES_REGISTRY = ListRegistry[type[StateProperty]]()
+STATE_PROPERTIES_REGISTRY = DomainRegistry[type[StateProperty]]()
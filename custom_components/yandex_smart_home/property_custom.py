@@ -7,8 +7,8 @@ import logging
 from typing import TYPE_CHECKING, Any, Protocol, Self, cast
 
 from homeassistant.components import binary_sensor, event
-from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
-from homeassistant.core import HomeAssistant, split_entity_id
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant, State, split_entity_id
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import UNDEFINED, ConfigType, UndefinedType
@@ -22,7 +22,7 @@ from .const import (
     CONF_ENTITY_PROPERTY_VALUE_TEMPLATE,
     PropertyInstanceType,
 )
-from .helpers import APIError, DictRegistry
+from .helpers import APIError, DictRegistry, async_render_template
 from .property import Property
 from .property_event import (
     BatteryLevelEventProperty,
@@ -80,7 +80,7 @@ class CustomProperty(Property, Protocol):
     _hass: HomeAssistant
     _entry_data: ConfigEntryData
     _config: ConfigType
-    _value_template: Template
+    _value_template: Template | None
     _value: Any | UndefinedType
 
     def __init__(
@@ -89,7 +89,7 @@ class CustomProperty(Property, Protocol):
         entry_data: ConfigEntryData,
         config: ConfigType,
         device_id: str,
-        value_template: Template,
+        value_template: Template | None,
         value: Any | UndefinedType = UNDEFINED,
     ):
         """Initialize a custom property."""
@@ -106,16 +106,43 @@ class CustomProperty(Property, Protocol):
         """Test if the property is supported."""
         return True
 
+    @property
+    def value_entity_id(self) -> str | None:
+        """Return the entity which state or attribute is the property value (None for value templates)."""
+        if self._value_template is not None:
+            return None
+
+        return self._entity_id
+
+    @property
+    def _entity_id(self) -> str:
+        """Return the entity from the property configuration."""
+        return str(self._config.get(CONF_ENTITY_PROPERTY_ENTITY, self.device_id))
+
     def _get_native_value(self) -> str:
         """Return the current property value without conversion."""
         if self._value is not UNDEFINED:
             return str(self._value).strip()
 
+        if self._value_template is None:
+            return str(self._get_entity_state_value(self._hass.states.get(self._entity_id))).strip()
+
         try:
-            return str(self._value_template.async_render()).strip()
+            return str(async_render_template(self._value_template, self._entry_data.template_results)).strip()
         except TemplateError as exc:
             raise APIError(ResponseCode.INVALID_VALUE, f"Failed to get current value for {self}: {exc!r}")
 
+    def _get_entity_state_value(self, state: State | None) -> Any:
+        """Return the property value from the entity state (same as states() and state_attr() in templates)."""
+        if attribute := self._config.get(CONF_ENTITY_PROPERTY_ATTRIBUTE):
+            return state.attributes.get(attribute) if state else None
+
+        return state.state if state else STATE_UNKNOWN
+
+    def new_with_entity_state(self, state: State) -> Self:
+        """Return copy of the property with value from the entity state."""
+        return self.new_with_value(self._get_entity_state_value(state))
+
     def new_with_value(self, value: Any) -> Self:
         """Return copy of the state with new value."""
         return self.__class__(
@@ -133,11 +160,22 @@ class CustomProperty(Property, Protocol):
             f"<{self.__class__.__name__}"
             f" device_id={self.device_id }"
             f" instance={self.instance}"
-            f" value_template={self._value_template}"
+            f" {self._value_source}"
             f" value={self._value}"
             f">"
         )
 
+    @property
+    def _value_source(self) -> str:
+        """Return the representation of the value source."""
+        if self._value_template is not None:
+            return f"value_template={self._value_template}"
+
+        if attribute := self._config.get(CONF_ENTITY_PROPERTY_ATTRIBUTE):
+            return f"entity_id={self._entity_id} attribute={attribute}"
+
+        return f"entity_id={self._entity_id}"
+
 
 class EventPlatformCustomProperty(EventPlatformProperty, Protocol):
     "Base class for an event property of event platform that user can set up using yaml configuration."
@@ -271,6 +309,15 @@ class CustomFloatProperty(CustomProperty, FloatProperty, Protocol):
         if unit := self._config.get(CONF_ENTITY_PROPERTY_UNIT_OF_MEASUREMENT):
             return str(unit)
 
+        if self._value_template is None:
+            if self._config.get(CONF_ENTITY_PROPERTY_ATTRIBUTE):
+                return None
+
+            if state := self._hass.states.get(self._entity_id):
+                return state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+
+            return None
+
         for s in ("state_attr(", ".attributes"):
             if s in self._value_template.template:
                 return None
@@ -409,8 +456,11 @@ def get_custom_property(
 
     cls: type[CustomEventProperty] | type[CustomFloatProperty]
     property_type: str = config[CONF_ENTITY_PROPERTY_TYPE]
-    value_template = get_value_template(hass, device_id, config)
-    vault_template_info = value_template.async_render_to_info()
+    value_template = get_value_template(config)
+    if value_template is not None:
+        template_entities = value_template.async_render_to_info().entities
+    else:
+        template_entities = {config.get(CONF_ENTITY_PROPERTY_ENTITY, device_id)}
 
     if property_type.startswith(f"{PropertyInstanceType.EVENT}."):
         cls = EVENT_PROPERTIES_REGISTRY[property_type.split(".", 1)[1]]
@@ -423,8 +473,8 @@ def get_custom_property(
         else:
             property_type = PropertyType.FLOAT
 
-        if len(vault_template_info.entities) == 1:
-            entity_id = next(iter(vault_template_info.entities))
+        if len(template_entities) == 1:
+            entity_id = next(iter(template_entities))
             domain, _ = split_entity_id(entity_id)
 
             if domain == binary_sensor.DOMAIN:
@@ -441,7 +491,7 @@ def get_custom_property(
         else:
             cls = FLOAT_PROPERTIES_REGISTRY[instance]
 
-    for entity_id in vault_template_info.entities:
+    for entity_id in template_entities:
         if _is_event_platform_entity(entity_id):
             _LOGGER.warning(f"Entity {entity_id} is not supported in value_template, use state_entity instead")
 
@@ -466,18 +516,12 @@ def get_event_platform_custom_property_type(config: ConfigType) -> type[EventPla
     return None
 
 
-def get_value_template(hass: HomeAssistant, device_id: str, property_config: ConfigType) -> Template:
-    """Return property value template from property configuration."""
+def get_value_template(property_config: ConfigType) -> Template | None:
+    """Return property value template from property configuration (None if the value is an entity state)."""
     if template := property_config.get(CONF_ENTITY_PROPERTY_VALUE_TEMPLATE):
         return cast(Template, template)
 
-    entity_id = property_config.get(CONF_ENTITY_PROPERTY_ENTITY, device_id)
-    attribute = property_config.get(CONF_ENTITY_PROPERTY_ATTRIBUTE)
-
-    if attribute:
-        return Template("{{ state_attr('%s', '%s') }}" % (entity_id, attribute), hass)
-
-    return Template("{{ states('%s') }}" % entity_id, hass)
+    return None
 
 
 def _is_event_platform_entity(entity_id: str | None) -> bool:
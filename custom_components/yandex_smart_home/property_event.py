@@ -76,7 +76,7 @@ class EventProperty(Property, Protocol[EventInstanceEventT]):
 
     def get_description(self) -> EventPropertyDescription:
         """Return a description for a device list request."""
-        return EventPropertyDescription(
+        return EventPropertyDescription.construct(
             retrievable=self.retrievable, reportable=self.reportable, parameters=self.parameters
         )
 
@@ -408,6 +408,14 @@ class EventPlatformProperty(StateProperty, EventProperty[Any], Protocol):
 class OpenStateEventProperty(StateEventProperty, SensorEventProperty, OpenEventProperty):
     """Represents the state event property that detect opening of something."""
 
+    domains = {binary_sensor.DOMAIN}
+    device_classes = {
+        BinarySensorDeviceClass.DOOR,
+        BinarySensorDeviceClass.GARAGE_DOOR,
+        BinarySensorDeviceClass.WINDOW,
+        BinarySensorDeviceClass.OPENING,
+    }
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -422,6 +430,13 @@ class OpenStateEventProperty(StateEventProperty, SensorEventProperty, OpenEventP
 class MotionStateEventProperty(SensorEventProperty, StateEventProperty, MotionEventProperty):
     """Represents the state event property that detect motion, presence or occupancy."""
 
+    domains = {binary_sensor.DOMAIN}
+    device_classes = {
+        BinarySensorDeviceClass.MOTION,
+        BinarySensorDeviceClass.OCCUPANCY,
+        BinarySensorDeviceClass.PRESENCE,
+    }
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -435,6 +450,9 @@ class MotionStateEventProperty(SensorEventProperty, StateEventProperty, MotionEv
 class MotionEventPlatformProperty(EventPlatformProperty, MotionEventProperty):
     """Represents the event platform property that detect motion."""
 
+    domains = {EVENT_DOMAIN}
+    device_classes = {EventDeviceClass.MOTION}
+
     @property
     def parameters(self) -> MotionEventPropertyParameters:
         """Return parameters for a devices list request."""
@@ -451,6 +469,9 @@ class MotionEventPlatformProperty(EventPlatformProperty, MotionEventProperty):
 class GasStateEventProperty(StateEventProperty, SensorEventProperty, GasEventProperty):
     """Represents the state event property that detect gas presence."""
 
+    domains = {binary_sensor.DOMAIN}
+    device_classes = {BinarySensorDeviceClass.GAS}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -460,6 +481,9 @@ class GasStateEventProperty(StateEventProperty, SensorEventProperty, GasEventPro
 class SmokeStateEventProperty(StateEventProperty, SensorEventProperty, SmokeEventProperty):
     """Represents the state event property that detect smoke presence."""
 
+    domains = {binary_sensor.DOMAIN}
+    device_classes = {BinarySensorDeviceClass.SMOKE}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -469,6 +493,9 @@ class SmokeStateEventProperty(StateEventProperty, SensorEventProperty, SmokeEven
 class BatteryLevelStateEvent(StateEventProperty, SensorEventProperty, BatteryLevelEventProperty):
     """Represents the state event property that detect low level of a battery."""
 
+    domains = {binary_sensor.DOMAIN}
+    device_classes = {BinarySensorDeviceClass.BATTERY}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -478,6 +505,9 @@ class BatteryLevelStateEvent(StateEventProperty, SensorEventProperty, BatteryLev
 class WaterLeakStateEventProperty(StateEventProperty, SensorEventProperty, WaterLeakEventProperty):
     """Represents the state event property that detect water leakage."""
 
+    domains = {binary_sensor.DOMAIN}
+    device_classes = {BinarySensorDeviceClass.MOISTURE}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -518,6 +548,8 @@ class ButtonPressStateEventProperty(StateEventProperty, ReactiveEventProperty, B
 class ButtonPressEventPlatformProperty(EventPlatformProperty, ButtonPressEventProperty):
     """Represents the event platform property that detect a button interaction."""
 
+    domains = {EVENT_DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -534,6 +566,8 @@ class ButtonPressEventPlatformProperty(EventPlatformProperty, ButtonPressEventPr
 class VibrationStateEventProperty(StateEventProperty, ReactiveEventProperty, VibrationEventProperty):
     """Represents the state event property that detect vibration."""
 
+    domains = {binary_sensor.DOMAIN, sensor.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
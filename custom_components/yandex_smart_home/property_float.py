@@ -96,7 +96,7 @@ class FloatProperty(Property, Protocol):
 
     def get_description(self) -> FloatPropertyDescription:
         """Return a description for a device list request."""
-        return FloatPropertyDescription(
+        return FloatPropertyDescription.construct(
             retrievable=self.retrievable, reportable=self.reportable, parameters=self.parameters
         )
 
@@ -499,6 +499,8 @@ class StateFloatProperty(StateProperty, FloatProperty):
 class TemperatureSensor(StateFloatProperty, TemperatureProperty):
     """Representaton of the state as a temperature sensor."""
 
+    domains = {sensor.DOMAIN, air_quality.DOMAIN, climate.DOMAIN, fan.DOMAIN, humidifier.DOMAIN, water_heater.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -534,6 +536,8 @@ class TemperatureSensor(StateFloatProperty, TemperatureProperty):
 class HumiditySensor(StateFloatProperty, HumidityProperty):
     """Representaton of the state as a humidity sensor."""
 
+    domains = {sensor.DOMAIN, air_quality.DOMAIN, climate.DOMAIN, fan.DOMAIN, humidifier.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -561,6 +565,9 @@ class HumiditySensor(StateFloatProperty, HumidityProperty):
 class PressureSensor(StateFloatProperty, PressureProperty):
     """Representaton of the state as a pressure sensor."""
 
+    domains = {sensor.DOMAIN}
+    device_classes = {SensorDeviceClass.PRESSURE, SensorDeviceClass.ATMOSPHERIC_PRESSURE}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -582,6 +589,8 @@ class PressureSensor(StateFloatProperty, PressureProperty):
 class IlluminationSensor(StateFloatProperty, IlluminationProperty):
     """Representaton of the state as a illumination sensor."""
 
+    domains = {sensor.DOMAIN, light.DOMAIN, fan.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -604,6 +613,8 @@ class IlluminationSensor(StateFloatProperty, IlluminationProperty):
 class WaterLevelPercentageSensor(StateFloatProperty, WaterLevelPercentageProperty):
     """Representaton of the state as a water level sensor."""
 
+    domains = {fan.DOMAIN, humidifier.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -620,6 +631,8 @@ class WaterLevelPercentageSensor(StateFloatProperty, WaterLevelPercentagePropert
 class CO2LevelSensor(StateFloatProperty, CO2LevelProperty):
     """Representaton of the state as a CO2 level sensor."""
 
+    domains = {sensor.DOMAIN, air_quality.DOMAIN, fan.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -642,6 +655,9 @@ class CO2LevelSensor(StateFloatProperty, CO2LevelProperty):
 class ElectricityMeterSensor(StateFloatProperty, ElectricityMeterProperty):
     """Representaton of the state as a electricity meter sensor."""
 
+    domains = {sensor.DOMAIN}
+    device_classes = {SensorDeviceClass.ENERGY}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -660,6 +676,9 @@ class ElectricityMeterSensor(StateFloatProperty, ElectricityMeterProperty):
 class GasMeterSensor(StateFloatProperty, GasMeterProperty):
     """Representaton of the state as a gas meter sensor."""
 
+    domains = {sensor.DOMAIN}
+    device_classes = {SensorDeviceClass.GAS}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -678,6 +697,9 @@ class GasMeterSensor(StateFloatProperty, GasMeterProperty):
 class WaterMeterSensor(StateFloatProperty, WaterMeterProperty):
     """Representaton of the state as a water meter sensor."""
 
+    domains = {sensor.DOMAIN}
+    device_classes = {SensorDeviceClass.WATER}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -697,6 +719,7 @@ class PM1DensitySensor(StateFloatProperty, PM1DensityProperty):
     """Representaton of the state as a PM1 density sensor."""
 
     instance = FloatPropertyInstance.PM1_DENSITY
+    domains = {sensor.DOMAIN, air_quality.DOMAIN}
 
     @property
     def supported(self) -> bool:
@@ -725,6 +748,8 @@ class PM1DensitySensor(StateFloatProperty, PM1DensityProperty):
 class PM25DensitySensor(StateFloatProperty, PM25DensityProperty):
     """Representaton of the state as a PM2.5 density sensor."""
 
+    domains = {sensor.DOMAIN, air_quality.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -747,6 +772,8 @@ class PM25DensitySensor(StateFloatProperty, PM25DensityProperty):
 class PM10DensitySensor(StateFloatProperty, PM10DensityProperty):
     """Representaton of the state as a PM10 density sensor."""
 
+    domains = {sensor.DOMAIN, air_quality.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -769,6 +796,8 @@ class PM10DensitySensor(StateFloatProperty, PM10DensityProperty):
 class TVOCConcentrationSensor(StateFloatProperty, TVOCConcentrationProperty):
     """Representaton of the state as a TVOC concentration sensor."""
 
+    domains = {sensor.DOMAIN, air_quality.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -802,6 +831,9 @@ class TVOCConcentrationSensor(StateFloatProperty, TVOCConcentrationProperty):
 class VOCConcentrationSensor(StateFloatProperty, TVOCConcentrationProperty):
     """Representaton of the state as a VOC concentration sensor."""
 
+    domains = {sensor.DOMAIN}
+    device_classes = {SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -818,6 +850,8 @@ class VOCConcentrationSensor(StateFloatProperty, TVOCConcentrationProperty):
 class VoltageSensor(StateFloatProperty, VoltageProperty):
     """Representaton of the state as a voltage sensor."""
 
+    domains = {sensor.DOMAIN, switch.DOMAIN, light.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -848,6 +882,8 @@ class VoltageSensor(StateFloatProperty, VoltageProperty):
 class ElectricCurrentSensor(StateFloatProperty, ElectricCurrentProperty):
     """Representaton of the state as a electric current sensor."""
 
+    domains = {sensor.DOMAIN, switch.DOMAIN, light.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
@@ -878,6 +914,8 @@ class ElectricCurrentSensor(StateFloatProperty, ElectricCurrentProperty):
 class ElectricPowerSensor(StateFloatProperty, ElectricPowerProperty):
     """Representaton of the state as a electric power sensor."""
 
+    domains = {sensor.DOMAIN, switch.DOMAIN}
+
     @property
     def supported(self) -> bool:
         """Test if the property is supported."""
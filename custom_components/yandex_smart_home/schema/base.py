@@ -1,9 +1,11 @@
 """Base class for API response schemas."""
 
+import json
 from typing import Any
 
 from pydantic.v1 import BaseModel
 from pydantic.v1.generics import GenericModel
+from pydantic.v1.json import pydantic_encoder
 
 
 class APIModel(BaseModel):
@@ -11,7 +13,7 @@ class APIModel(BaseModel):
 
     def as_json(self) -> str:
         """Generate a JSON representation of the model."""
-        return super().json(exclude_none=True, ensure_ascii=False)
+        return json.dumps(_jsonable(self), ensure_ascii=False, default=pydantic_encoder)
 
     def as_dict(self) -> dict[str, Any]:
         """Generate a dictionary representation of the model."""
@@ -20,3 +22,18 @@ class APIModel(BaseModel):
 
 class GenericAPIModel(GenericModel, APIModel):
     """Base generic API response model."""
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert a value to JSON compatible types the same way as BaseModel.json(exclude_none=True) does.
+
+    Skips pydantic machinery for include/exclude/alias handling which is not used by API models.
+    """
+    if isinstance(value, BaseModel):
+        return {k: _jsonable(v) for k, v in value.__dict__.items() if v is not None}
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+
+    return value
@@ -40,6 +40,24 @@ from tests import MockConfigEntryData, generate_entity_filter
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--benchmark", action="store_true", default=False, help="run benchmarks")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "benchmark: performance benchmark, runs only with --benchmark")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--benchmark"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="need --benchmark option to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture(autouse=True)
 def enable_custom_integrations(enable_custom_integrations: None) -> None:
     return enable_custom_integrations
@@ -0,0 +1,144 @@
+"""Performance benchmarks, run with: pytest tests/test_benchmark.py --benchmark -s"""
+
+import timeit
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import Template
+import pytest
+
+from custom_components.yandex_smart_home.helpers import async_get_value_template, async_render_template
+from custom_components.yandex_smart_home.schema import (
+    CapabilityDescription,
+    CapabilityInstanceState,
+    CapabilityInstanceStateValue,
+    CapabilityType,
+    DeviceDescription,
+    DeviceInfo,
+    DeviceList,
+    DeviceState,
+    DeviceStates,
+    DeviceType,
+    FloatPropertyDescription,
+    FloatPropertyInstance,
+    FloatPropertyParameters,
+    OnOffCapabilityInstance,
+    OnOffCapabilityParameters,
+    PropertyInstanceState,
+    PropertyInstanceStateValue,
+    PropertyType,
+    TemperatureUnit,
+)
+
+from . import MockConfigEntryData
+
+pytestmark = pytest.mark.benchmark
+
+
+def _timeit(func: Callable[[], Any], number: int) -> float:
+    """Return the best time of a single call in milliseconds."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1000
+
+
+def test_benchmark_schema_construct() -> None:
+    def _build(construct: bool) -> Callable[[], str]:
+        def _new(cls: Any, **kwargs: Any) -> Any:
+            return cls.construct(**kwargs) if construct else cls(**kwargs)
+
+        def _run() -> str:
+            devices = [
+                _new(
+                    DeviceDescription,
+                    id=f"light.light_{i}",
+                    name=f"Свет {i}",
+                    room="Кухня",
+                    type=DeviceType.LIGHT,
+                    capabilities=[
+                        _new(
+                            CapabilityDescription,
+                            type=CapabilityType.ON_OFF,
+                            retrievable=True,
+                            reportable=True,
+                            parameters=OnOffCapabilityParameters(split=False),
+                        )
+                    ],
+                    properties=[
+                        _new(
+                            FloatPropertyDescription,
+                            retrievable=True,
+                            reportable=True,
+                            parameters=FloatPropertyParameters(
+                                instance=FloatPropertyInstance.TEMPERATURE, unit=TemperatureUnit.CELSIUS
+                            ),
+                        )
+                    ],
+                    device_info=_new(DeviceInfo, manufacturer="Demo", model=f"light.light_{i}"),
+                )
+                for i in range(300)
+            ]
+            states = [
+                _new(
+                    DeviceState,
+                    id=f"light.light_{i}",
+                    capabilities=[
+                        _new(
+                            CapabilityInstanceState,
+                            type=CapabilityType.ON_OFF,
+                            state=_new(CapabilityInstanceStateValue, instance=OnOffCapabilityInstance.ON, value=True),
+                        )
+                    ],
+                    properties=[
+                        _new(
+                            PropertyInstanceState,
+                            type=PropertyType.FLOAT,
+                            state=_new(
+                                PropertyInstanceStateValue, instance=FloatPropertyInstance.TEMPERATURE, value=21.5
+                            ),
+                        )
+                    ],
+                )
+                for i in range(300)
+            ]
+            device_list: DeviceList = _new(DeviceList, user_id="user", devices=devices)
+            device_states: DeviceStates = _new(DeviceStates, devices=states)
+            return device_list.as_json() + device_states.as_json()
+
+        return _run
+
+    assert _build(True)() == _build(False)()
+
+    validated = _timeit(_build(False), number=5)
+    constructed = _timeit(_build(True), number=5)
+    print(f"\n300 devices, list + states: validated {validated:.1f} ms, constructed {constructed:.1f} ms")
+
+
+async def test_benchmark_value_templates(hass: HomeAssistant) -> None:
+    entry_data = MockConfigEntryData(hass)
+    for i in range(100):
+        hass.states.async_set(f"sensor.test_{i}", str(i), {"mode": "auto"})
+
+    def _build(shared: bool) -> Callable[[], list[Any]]:
+        def _get_template(entity_id: str, attribute: str | None) -> Template:
+            if shared:
+                return async_get_value_template(hass, entry_data, entity_id, attribute)
+
+            if attribute:
+                return Template("{{ state_attr('%s', '%s') }}" % (entity_id, attribute), hass)
+
+            return Template("{{ states('%s') }}" % entity_id, hass)
+
+        def _run() -> list[Any]:
+            return [
+                async_render_template(_get_template(f"sensor.test_{i}", attribute))
+                for i in range(100)
+                for attribute in (None, "mode")
+            ]
+
+        return _run
+
+    separate = _timeit(_build(False), number=5)
+    shared = _timeit(_build(True), number=5)
+    print(f"\n100 entities, state + attribute: separate {separate:.1f} ms, shared {shared:.1f} ms")
+
+    assert _build(True)() == _build(False)()
+    assert len(entry_data.value_templates) == 200
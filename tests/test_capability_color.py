@@ -42,7 +42,14 @@ from custom_components.yandex_smart_home.capability_color import (
     ColorTemperatureCapability,
     RGBColorCapability,
 )
-from custom_components.yandex_smart_home.color import ColorConverter, ColorName, rgb_to_int
+from custom_components.yandex_smart_home.color import (
+    ColorConverter,
+    ColorName,
+    ColorProfiles,
+    get_color_converter,
+    int_to_rgb,
+    rgb_to_int,
+)
 from custom_components.yandex_smart_home.const import CONF_COLOR_PROFILE, CONF_ENTITY_MODE_MAP
 from custom_components.yandex_smart_home.entry_data import ConfigEntryData
 from custom_components.yandex_smart_home.helpers import APIError
@@ -441,6 +448,31 @@ async def test_capability_color_setting_rgb_with_internal_profile(
         assert calls[0].data == {ATTR_ENTITY_ID: state.entity_id, ATTR_RGB_COLOR: (255, 0, 0)}
 
 
+def test_color_converter() -> None:
+    assert get_color_converter() is get_color_converter()
+    assert get_color_converter({ColorName.RED: 1}) is get_color_converter({ColorName.RED: 1})
+    assert get_color_converter({ColorName.RED: 1}) is not get_color_converter()
+
+    red = ColorConverter._palette[ColorName.RED]
+    r, g, b = int_to_rgb(red)
+    converter = get_color_converter()
+    assert converter.get_yandex_color(RGBColor(r, g, b)) == red
+    assert converter.get_yandex_color(RGBColor(r - 2, g, b)) == red
+    assert converter.get_yandex_color(RGBColor(r - 1, g + 1, b + 1)) == red
+    assert converter.get_yandex_color(RGBColor(r - 2, g + 1, b)) == rgb_to_int(RGBColor(r - 2, g + 1, b))
+
+    converter = get_color_converter({ColorName.RED: 100, ColorName.CORAL: 101})
+    assert converter.get_yandex_color(int_to_rgb(100)) == red
+    assert converter.get_yandex_color(int_to_rgb(101)) == red
+    assert converter.get_yandex_color(int_to_rgb(102)) == red
+    assert converter.get_yandex_color(int_to_rgb(103)) == ColorConverter._palette[ColorName.CORAL]
+    assert converter.get_ha_color(red) == int_to_rgb(100)
+
+    profiles = ColorProfiles.from_dict({"natural": {"red": 1}})
+    assert profiles["natural"][ColorName.RED] == 1
+    assert ColorProfiles.from_dict({})["natural"][ColorName.RED] == 16711680
+
+
 @pytest.mark.parametrize(
     "attributes,temp_range",
     [
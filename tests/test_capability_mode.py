@@ -17,6 +17,7 @@ from custom_components.yandex_smart_home.capability_mode import (
     FanSpeedCapabilityFanViaPreset,
     ModeCapability,
     StateModeCapability,
+    get_modes_lookup,
 )
 from custom_components.yandex_smart_home.const import CONF_ENTITY_MODE_MAP
 from custom_components.yandex_smart_home.helpers import APIError
@@ -214,6 +215,37 @@ async def test_capability_mode_fallback_index(hass: HomeAssistant, entry_data: M
     assert cap.supported_yandex_modes == ["americano", "baby_food"]
 
 
+async def test_capability_mode_lookup(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    state = State("switch.test", STATE_OFF, {"modes_list": ["some", "mode_1", "foo", "off"]})
+    cap = MockModeCapabilityA(hass, entry_data, state.entity_id, state)
+    for _ in range(2):
+        assert cap.get_ha_mode_by_yandex_mode(ModeCapabilityMode.FOWL) == "mode_1"
+    assert MockModeCapabilityA._modes_map_default[ModeCapabilityMode.FOWL] == ["mode_1"]
+
+    other_cap = MockModeCapabilityA(
+        hass, entry_data, "switch.other", State("switch.other", STATE_OFF, state.attributes)
+    )
+    assert other_cap._modes_lookup is cap._modes_lookup
+    assert other_cap.supported_yandex_modes is not cap.supported_yandex_modes
+
+    state = State("switch.test", STATE_OFF, {"modes_list": ["some", "mode_1", "foo"]})
+    assert MockModeCapabilityA(hass, entry_data, state.entity_id, state)._modes_lookup is not cap._modes_lookup
+    assert MockModeCapabilityAShortIndexFallback(hass, entry_data, state.entity_id, state)._modes_lookup is not (
+        MockModeCapabilityA(hass, entry_data, state.entity_id, state)._modes_lookup
+    )
+
+    state = State("switch.test", STATE_OFF, {"modes_list": ["mode_1", "mode_2"]})
+    cap = MockModeCapabilityA(hass, entry_data, state.entity_id, state)
+    with pytest.raises(APIError) as e:
+        cap.get_ha_mode_by_yandex_mode(ModeCapabilityMode.FIVE)
+    assert e.value.code == ResponseCode.INVALID_VALUE
+
+    lookup = get_modes_lookup(
+        (), ((0, ModeCapabilityMode.ONE), (1, ModeCapabilityMode.ONE), (3, ModeCapabilityMode.TWO)), ("a", "b", "c")
+    )
+    assert lookup.ha_modes == {ModeCapabilityMode.ONE: "a"}
+
+
 async def test_capability_mode_get_value(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
     state = State("switch.test", STATE_OFF, {"modes_list": ["mode_1", "mode_3"], "current_mode": "mode_1"})
     cap_a = MockModeCapabilityA(hass, entry_data, state.entity_id, state)
@@ -1,13 +1,16 @@
+import asyncio
 from asyncio import TimeoutError
+from datetime import UTC, datetime, timedelta
 import json
 from typing import Any, Generator, Self
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from aiohttp import WSMessage, WSMsgType
 from homeassistant import core
+from homeassistant.auth.models import User
 from homeassistant.components import demo
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Context, HomeAssistant
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.aiohttp_client import DATA_CLIENTSESSION, _make_key
 from homeassistant.setup import async_setup_component
@@ -16,7 +19,12 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
 
 from custom_components.yandex_smart_home import DOMAIN, YandexSmartHome
-from custom_components.yandex_smart_home.cloud import CloudManager
+from custom_components.yandex_smart_home.cloud import CloudConnectionStats, CloudManager, CloudRequest
+from custom_components.yandex_smart_home.const import CONF_USER_ID
+from custom_components.yandex_smart_home.diagnostics import async_get_config_entry_diagnostics
+from custom_components.yandex_smart_home.entry_data import ConfigEntryData
+from custom_components.yandex_smart_home.helpers import RequestData
+from custom_components.yandex_smart_home.schema import Response
 
 
 class MockWSConnection:
@@ -26,6 +34,7 @@ class MockWSConnection:
         self.close_code: int | None = kwargs.get("ws_close_code")
         self.closed = False
         self.msg = kwargs.get("msg", []) or []
+        self.hold: asyncio.Event | None = kwargs.get("hold")
         self.send_queue: list[Any] = []
 
     def __aiter__(self) -> Self:
@@ -35,6 +44,9 @@ class MockWSConnection:
         return self._async_next_msg()
 
     async def _async_next_msg(self) -> Any:
+        if not self.msg and self.hold:
+            await self.hold.wait()
+
         try:
             return self.msg.pop(0)
         except IndexError:
@@ -42,6 +54,8 @@ class MockWSConnection:
 
     async def close(self) -> None:
         self.closed = True
+        if self.hold:
+            self.hold.set()
 
     async def send_str(self, s: str) -> None:
         self.send_queue.append(s)
@@ -49,16 +63,22 @@ class MockWSConnection:
 
 class MockSession:
     def __init__(
-        self, aioclient: AiohttpClientMocker, ws_close_code: int | None = None, msg: list[WSMessage] | None = None
+        self,
+        aioclient: AiohttpClientMocker,
+        ws_close_code: int | None = None,
+        msg: list[WSMessage] | None = None,
+        hold: asyncio.Event | None = None,
     ):
         self.aioclient = aioclient
         self.ws: MockWSConnection | None = None
         self.ws_close_code = ws_close_code
+        self.hold = hold
         self.msg = msg or []
 
     async def ws_connect(self, *args: Any, **kwargs: Any) -> MockWSConnection:
         kwargs["ws_close_code"] = self.ws_close_code
         kwargs["msg"] = self.msg
+        kwargs["hold"] = self.hold
         self.ws = MockWSConnection(*args, **kwargs)
         return self.ws
 
@@ -92,6 +112,12 @@ def _get_manager(hass: HomeAssistant, config_entry: MockConfigEntry) -> CloudMan
     return entry_data._cloud_manager
 
 
+@pytest.fixture(name="mock_uniform")
+def mock_uniform_fixture() -> Generator[MagicMock, None, None]:
+    with patch("custom_components.yandex_smart_home.cloud.random.uniform") as mock_uniform:
+        yield mock_uniform
+
+
 @pytest.fixture(name="mock_call_later")
 def mock_call_later_fixture() -> Generator[AsyncMock, None, None]:
     with patch("custom_components.yandex_smart_home.cloud.async_call_later") as mock_call_later:
@@ -181,9 +207,11 @@ async def test_cloud_try_reconnect(
     config_entry_cloud: MockConfigEntry,
     aioclient_mock: AiohttpClientMocker,
     mock_call_later: AsyncMock,
+    mock_uniform: MagicMock,
 ) -> None:
     hass = hass_platform
     session = MockSession(aioclient_mock, ws_close_code=1000)
+    mock_uniform.side_effect = lambda a, b: b
 
     with patch.object(session, "ws_connect", side_effect=TimeoutError()):
         await async_setup_entry(hass, config_entry_cloud, session=session)
@@ -191,14 +219,14 @@ async def test_cloud_try_reconnect(
     manager = _get_manager(hass, config_entry_cloud)
 
     mock_call_later.assert_called_once()
-    assert manager._ws_reconnect_delay == 4
+    assert manager._ws_reconnect_delay == 6
 
     mock_call_later.reset_mock()
     with patch.object(session, "ws_connect", side_effect=TimeoutError()):
         await manager.async_connect()
     mock_call_later.assert_called_once()
 
-    assert manager._ws_reconnect_delay == 8
+    assert manager._ws_reconnect_delay == 18
 
     for _ in range(1, 10):
         mock_call_later.reset_mock()
@@ -212,7 +240,13 @@ async def test_cloud_try_reconnect(
     await manager.async_connect()
     mock_call_later.assert_called_once()
 
-    assert manager._ws_reconnect_delay == 4
+    assert manager._ws_reconnect_delay == 6
+    assert manager.stats.reconnect_count == 12
+
+    mock_uniform.side_effect = lambda a, b: a
+    mock_call_later.reset_mock()
+    await manager.async_connect()
+    assert manager._ws_reconnect_delay == 2
 
     mock_call_later.reset_mock()
     await manager.async_disconnect()
@@ -235,7 +269,7 @@ async def test_cloud_fast_reconnect(
 
     for _ in range(1, 4):
         await manager.async_connect()
-        assert manager._ws_reconnect_delay == 4
+        assert 2 <= manager._ws_reconnect_delay <= 6
 
     await manager.async_connect()
     assert manager._ws_reconnect_delay == 180
@@ -286,6 +320,210 @@ async def test_cloud_messages_invalid_format(
         assert json.loads(session.ws.send_queue[0]) == {"request_id": "req"}
 
 
+@pytest.mark.parametrize(
+    "concurrency,blocked_responses,responses", [(16, ["fast"], ["fast", "slow"]), (1, [], ["slow", "fast"])]
+)
+async def test_cloud_messages_concurrency(
+    hass_platform: HomeAssistant,
+    config_entry_cloud: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+    concurrency: int,
+    blocked_responses: list[str],
+    responses: list[str],
+) -> None:
+    hass = hass_platform
+    release = asyncio.Event()
+
+    async def _async_handle_request(_hass: HomeAssistant, data: RequestData, *_: Any) -> Response:
+        if data.request_id == "slow":
+            await release.wait()
+
+        return Response(request_id=data.request_id)
+
+    requests = [
+        json.dumps({"request_id": request_id, "platform": "yandex", "action": "/user/devices/query"})
+        for request_id in ("slow", "fast")
+    ]
+    session = MockSession(
+        aioclient_mock,
+        msg=[WSMessage(type=WSMsgType.TEXT, extra=None, data=r) for r in requests],
+        hold=asyncio.Event(),
+    )
+    mock_client_session(hass, session)
+
+    with patch(
+        "custom_components.yandex_smart_home.cloud.handlers.async_handle_request", new=_async_handle_request
+    ), patch.object(ConfigEntryData, "cloud_request_concurrency", new_callable=PropertyMock(return_value=concurrency)):
+        config_entry_cloud.add_to_hass(hass)
+        await hass.config_entries.async_setup(config_entry_cloud.entry_id)
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert session.ws
+        assert [json.loads(r)["request_id"] for r in session.ws.send_queue] == blocked_responses
+
+        release.set()
+        await hass.async_block_till_done()
+        assert [json.loads(r)["request_id"] for r in session.ws.send_queue] == responses
+
+    await hass.config_entries.async_unload(config_entry_cloud.entry_id)
+
+
+async def test_cloud_messages_reconnect_in_flight(
+    hass_platform: HomeAssistant,
+    config_entry_cloud: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+    mock_call_later: AsyncMock,
+) -> None:
+    hass = hass_platform
+    started = asyncio.Event()
+    cancelled: list[str | None] = []
+
+    async def _async_handle_request(_hass: HomeAssistant, data: RequestData, *_: Any) -> Response:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(data.request_id)
+            raise
+
+        return Response(request_id=data.request_id)  # pragma: no cover
+
+    requests = [json.dumps({"request_id": "req", "platform": "yandex", "action": "/user/devices/query"})]
+    hold = asyncio.Event()
+    session = MockSession(
+        aioclient_mock,
+        ws_close_code=1006,
+        msg=[WSMessage(type=WSMsgType.TEXT, extra=None, data=r) for r in requests],
+        hold=hold,
+    )
+    mock_client_session(hass, session)
+
+    with patch("custom_components.yandex_smart_home.cloud.handlers.async_handle_request", new=_async_handle_request):
+        config_entry_cloud.add_to_hass(hass)
+        await hass.config_entries.async_setup(config_entry_cloud.entry_id)
+        await started.wait()
+
+        manager = _get_manager(hass, config_entry_cloud)
+        assert len(manager._request_tasks) == 1
+        task = next(iter(manager._request_tasks))
+
+        hold.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert cancelled == ["req"]
+    assert manager._request_tasks == set()
+    assert session.ws
+    assert session.ws.send_queue == []
+    mock_call_later.assert_called_once()
+
+    await hass.config_entries.async_unload(config_entry_cloud.entry_id)
+
+
+async def test_cloud_messages_connection_closed(
+    hass_platform: HomeAssistant, config_entry_cloud: MockConfigEntry, aioclient_mock: AiohttpClientMocker
+) -> None:
+    hass = hass_platform
+
+    requests = [json.dumps({"request_id": "req", "platform": "yandex", "action": "/user/devices/query"})]
+    session = MockSession(aioclient_mock, msg=[WSMessage(type=WSMsgType.TEXT, extra=None, data=r) for r in requests])
+    with patch.object(MockWSConnection, "send_str", side_effect=ConnectionResetError()) as mock_send_str:
+        await async_setup_entry(hass, config_entry_cloud, session=session)
+        mock_send_str.assert_called_once()
+
+    assert session.ws
+    session.ws.closed = True
+    manager = _get_manager(hass, config_entry_cloud)
+    await manager._async_send(session.ws, CloudRequest.parse_raw(requests[0]), "foo")  # type: ignore[arg-type]
+    assert session.ws.send_queue == []
+    await hass.config_entries.async_unload(config_entry_cloud.entry_id)
+
+
+async def test_cloud_messages_context_user(
+    hass_platform: HomeAssistant,
+    config_entry_cloud: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+    hass_read_only_user: User,
+) -> None:
+    hass = hass_platform
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=config_entry_cloud.version,
+        data=config_entry_cloud.data,
+        options={**config_entry_cloud.options, CONF_USER_ID: hass_read_only_user.id},
+    )
+    contexts: list[Context] = []
+
+    async def _async_handle_request(_hass: HomeAssistant, data: RequestData, *_: Any) -> Response:
+        contexts.append(data.context)
+        return Response(request_id=data.request_id)
+
+    requests = [
+        json.dumps({"request_id": request_id, "platform": "yandex", "action": "/user/devices/query"})
+        for request_id in ("1", "2")
+    ]
+    session = MockSession(aioclient_mock, msg=[WSMessage(type=WSMsgType.TEXT, extra=None, data=r) for r in requests])
+    with patch(
+        "custom_components.yandex_smart_home.cloud.handlers.async_handle_request", new=_async_handle_request
+    ), patch.object(hass.auth, "async_get_user", wraps=hass.auth.async_get_user) as mock_get_user:
+        await async_setup_entry(hass, config_entry, session=session)
+        assert mock_get_user.call_count == 1
+
+    assert [c.user_id for c in contexts] == [hass_read_only_user.id, hass_read_only_user.id]
+
+    manager = _get_manager(hass, config_entry)
+    await hass.auth.async_remove_user(hass_read_only_user)
+    await hass.async_block_till_done()
+    assert manager._entry_data.context_user_id is None
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_cloud_connection_stats(
+    hass_platform: HomeAssistant,
+    config_entry_cloud: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+    mock_call_later: AsyncMock,
+) -> None:
+    hass = hass_platform
+
+    requests = [
+        json.dumps({"request_id": request_id, "platform": "yandex", "action": "/user/devices/query"})
+        for request_id in ("1", "2")
+    ]
+    session = MockSession(
+        aioclient_mock, ws_close_code=1006, msg=[WSMessage(type=WSMsgType.TEXT, extra=None, data=r) for r in requests]
+    )
+    now = datetime(2024, 5, 7, 1, 10, 6, tzinfo=UTC)
+    with patch("custom_components.yandex_smart_home.cloud.dt.utcnow", return_value=now):
+        await async_setup_entry(hass, config_entry_cloud, session=session)
+
+    manager = _get_manager(hass, config_entry_cloud)
+    stats = manager.stats.as_dict(now)
+    assert stats["connect_latency"] is not None
+    assert stats["average_request_time"] is not None
+    assert stats | {"connect_latency": None, "average_request_time": None} == {
+        "connected": False,
+        "connect_latency": None,
+        "connected_time": 0.0,
+        "messages_handled": 2,
+        "average_request_time": None,
+        "reconnect_count": 1,
+        "last_close_code": 1006,
+    }
+
+    manager.stats.connected_at = now
+    assert manager.stats.as_dict(now + timedelta(seconds=10))["connected"] is True
+    assert manager.stats.as_dict(now + timedelta(seconds=10))["connected_time"] == 10.0
+    assert CloudConnectionStats().as_dict(now)["average_request_time"] is None
+
+    diag = await async_get_config_entry_diagnostics(hass, config_entry_cloud)
+    assert diag["cloud_connection"]["messages_handled"] == 2
+
+    await hass.config_entries.async_unload(config_entry_cloud.entry_id)
+
+
 async def test_cloud_req_user_devices(
     hass_platform: HomeAssistant, config_entry_cloud: MockConfigEntry, aioclient_mock: AiohttpClientMocker
 ) -> None:
@@ -451,7 +689,9 @@ async def test_cloud_req_user_devices_action(
     assert switch_ac_state.state == "off"
 
     session = MockSession(
-        aioclient_mock, msg=[WSMessage(type=WSMsgType.TEXT, extra=None, data=json.dumps(r)) for r in requests]
+        aioclient_mock,
+        msg=[WSMessage(type=WSMsgType.TEXT, extra=None, data=json.dumps(r)) for r in requests],
+        hold=asyncio.Event(),
     )
     await async_setup_entry(hass, config_entry_cloud, session=session)
     await hass.async_block_till_done()
@@ -12,6 +12,7 @@ from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_SUPPORTED_FEATURES,
     ATTR_UNIT_OF_MEASUREMENT,
     CONF_NAME,
@@ -31,6 +32,7 @@ from homeassistant.helpers.template import Template
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry, async_mock_service
 
+from custom_components.yandex_smart_home.capability import StateCapability
 from custom_components.yandex_smart_home.capability_color import (
     ColorSceneStateCapability,
     ColorSettingCapability,
@@ -66,11 +68,13 @@ from custom_components.yandex_smart_home.const import (
     CONF_ENTITY_PROPERTY_ATTRIBUTE,
     CONF_ENTITY_PROPERTY_ENTITY,
     CONF_ENTITY_PROPERTY_TYPE,
+    CONF_ENTITY_PROPERTY_VALUE_TEMPLATE,
     CONF_ENTRY_ALIASES,
     DOMAIN,
 )
-from custom_components.yandex_smart_home.device import BacklightCapability, Device
-from custom_components.yandex_smart_home.helpers import APIError
+from custom_components.yandex_smart_home.device import BacklightCapability, Device, async_get_device_states
+from custom_components.yandex_smart_home.helpers import APIError, DomainRegistry
+from custom_components.yandex_smart_home.property import StateProperty
 from custom_components.yandex_smart_home.property_custom import (
     ButtonPressCustomEventProperty,
     FoodLevelEventPlatformCustomProperty,
@@ -84,6 +88,7 @@ from custom_components.yandex_smart_home.property_float import (
     VoltageSensor,
 )
 from custom_components.yandex_smart_home.schema import (
+    CapabilityType,
     DeviceType,
     OnOffCapabilityInstance,
     OnOffCapabilityInstanceAction,
@@ -107,6 +112,8 @@ async def test_device_duplicate_capabilities(hass: HomeAssistant, entry_data: Mo
             return True
 
     class MockCapability2(MuteCapability):
+        domains = None  # type: ignore[assignment]
+
         @property
         def supported(self) -> bool:
             return True
@@ -116,7 +123,7 @@ async def test_device_duplicate_capabilities(hass: HomeAssistant, entry_data: Mo
 
     with patch(
         "custom_components.yandex_smart_home.device.STATE_CAPABILITIES_REGISTRY",
-        [MockCapability, MockCapability2, MockCapability, MockCapability2],
+        DomainRegistry[type[StateCapability[Any]]]([MockCapability, MockCapability2, MockCapability, MockCapability2]),
     ):
         caps = device.get_capabilities()
         assert len(caps) == 2
@@ -248,6 +255,47 @@ async def test_device_capabilities_with_backlight_entity(hass: HomeAssistant) ->
     ]
 
 
+async def test_device_capabilities_types_cache(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    state = State("light.test", STATE_ON, {light.ATTR_SUPPORTED_COLOR_MODES: [ColorMode.ONOFF]})
+    device = Device(hass, entry_data, state.entity_id, state)
+    assert [type(c) for c in device.get_capabilities()] == [OnOffCapabilityBasic]
+    assert entry_data.capability_types_cache[state.entity_id][1] == [OnOffCapabilityBasic]
+
+    with patch("custom_components.yandex_smart_home.device.STATE_CAPABILITIES_REGISTRY", DomainRegistry()):
+        state = State("light.test", STATE_OFF, {light.ATTR_SUPPORTED_COLOR_MODES: [ColorMode.ONOFF]})
+        device = Device(hass, entry_data, state.entity_id, state)
+        assert [type(c) for c in device.get_capabilities()] == [OnOffCapabilityBasic]
+
+        with patch("custom_components.yandex_smart_home.device._get_state_shape", return_value=None):
+            assert [type(c) for c in device.get_capabilities()] == []
+
+        state = State("light.test", STATE_OFF, {light.ATTR_SUPPORTED_COLOR_MODES: [ColorMode.ONOFF], "foo": "bar"})
+        device = Device(hass, entry_data, state.entity_id, state)
+        assert [type(c) for c in device.get_capabilities()] == []
+
+    state = State("light.test", STATE_ON, {light.ATTR_SUPPORTED_COLOR_MODES: [ColorMode.BRIGHTNESS], "foo": "bar"})
+    device = Device(hass, entry_data, state.entity_id, state)
+    assert [type(c) for c in device.get_capabilities()] == [OnOffCapabilityBasic, BrightnessCapability]
+
+    state = State("media_player.tv", STATE_OFF, {ATTR_SUPPORTED_FEATURES: MediaPlayerEntityFeature.SELECT_SOURCE})
+    device = Device(hass, entry_data, state.entity_id, state)
+    assert [type(c) for c in device.get_capabilities()] == []
+    assert entry_data.capability_types_cache[state.entity_id][1] == [InputSourceCapability]
+
+    entry_data.cache.save_attr_value(state.entity_id, media_player.ATTR_INPUT_SOURCE_LIST, ["foo"])
+    assert [type(c) for c in device.get_capabilities()] == [InputSourceCapability]
+
+    state = State("sensor.test", "1", {ATTR_DEVICE_CLASS: SensorDeviceClass.TEMPERATURE})
+    device = Device(hass, entry_data, state.entity_id, state)
+    assert [type(p) for p in device.get_properties()] == [TemperatureSensor]
+    assert entry_data.property_types_cache[state.entity_id][1] == [TemperatureSensor]
+
+    state = State("sensor.test", "1", {ATTR_DEVICE_CLASS: SensorDeviceClass.VOLTAGE, "foo": {"bar": []}})
+    device = Device(hass, entry_data, state.entity_id, state)
+    assert [type(p) for p in device.get_properties()] == [VoltageSensor]
+    assert entry_data.property_types_cache[state.entity_id][1] == [VoltageSensor]
+
+
 async def test_device_disabled_capabilities(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
     state = State(
         "media_player.foo",
@@ -300,6 +348,9 @@ async def test_device_duplicate_properties(hass: HomeAssistant, entry_data: Mock
             return True
 
     class MockPropertyBE(BatteryLevelStateEvent):
+        domains = None  # type: ignore[assignment]
+        device_classes = None  # type: ignore[assignment]
+
         @property
         def supported(self) -> bool:
             return True
@@ -309,7 +360,9 @@ async def test_device_duplicate_properties(hass: HomeAssistant, entry_data: Mock
 
     with patch(
         "custom_components.yandex_smart_home.device.STATE_PROPERTIES_REGISTRY",
-        [MockProperty, MockPropertyBS, MockProperty, MockPropertyBS, MockPropertyBE],
+        DomainRegistry[type[StateProperty]](
+            [MockProperty, MockPropertyBS, MockProperty, MockPropertyBS, MockPropertyBE]
+        ),
     ):
         props = device.get_properties()
         assert len(props) == 3
@@ -473,6 +526,108 @@ async def test_device_name_room(
     assert d.room == "Комната"
 
 
+async def test_device_describe_cache(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry, area_registry: ar.AreaRegistry
+) -> None:
+    entry_data = MockConfigEntryData(hass, entity_config={"light.test": {CONF_BACKLIGHT_ENTITY_ID: "light.backlight"}})
+    attributes = {light.ATTR_SUPPORTED_COLOR_MODES: [ColorMode.BRIGHTNESS], ATTR_FRIENDLY_NAME: "Test"}
+    entry = entity_registry.async_get_or_create("light", "test", "1", suggested_object_id="test")
+    hass.states.async_set(entry.entity_id, STATE_ON, attributes)
+
+    async def _describe() -> Any:
+        state = hass.states.get("light.test")
+        assert state
+        return await Device(hass, entry_data, state.entity_id, state).describe()
+
+    d = await _describe()
+    assert d
+    assert d.name == "Test"
+    assert await _describe() is d
+
+    hass.states.async_set("light.test", STATE_OFF, attributes)
+    assert await _describe() is d
+
+    hass.states.async_set("light.test", STATE_ON, attributes | {light.ATTR_BRIGHTNESS: 10})
+    d = await _describe()
+    hass.states.async_set("light.test", STATE_ON, attributes | {light.ATTR_BRIGHTNESS: 200})
+    assert await _describe() is d
+
+    hass.states.async_set("light.test", STATE_ON, attributes | {ATTR_FRIENDLY_NAME: "Foo"})
+    d = await _describe()
+    assert d.name == "Foo"
+    assert await _describe() is d
+
+    entity_registry.async_update_entity(entry.entity_id, area_id=area_registry.async_create("Room").id)
+    d = await _describe()
+    assert d.room == "Room"
+    assert await _describe() is d
+
+    hass.states.async_set("light.backlight", STATE_OFF, {light.ATTR_SUPPORTED_COLOR_MODES: [ColorMode.RGB]})
+    d = await _describe()
+    assert CapabilityType.COLOR_SETTING in [c.type for c in d.capabilities]
+    assert await _describe() is d
+
+
+async def test_device_describe_cache_store(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    attributes = {ATTR_SUPPORTED_FEATURES: MediaPlayerEntityFeature.SELECT_SOURCE}
+    hass.states.async_set("media_player.tv", STATE_OFF, attributes)
+
+    async def _describe() -> Any:
+        state = hass.states.get("media_player.tv")
+        assert state
+        return await Device(hass, entry_data, state.entity_id, state).describe()
+
+    d = await _describe()
+    assert d is None
+    assert await _describe() is d
+
+    entry_data.cache.save_attr_value("media_player.tv", media_player.ATTR_INPUT_SOURCE_LIST, ["hdmi", "usb"])
+    d = await _describe()
+    assert d
+    assert [c.type for c in d.capabilities] == [CapabilityType.MODE]
+    assert await _describe() is d
+
+
+async def test_device_describe_cache_referenced_entities(hass: HomeAssistant) -> None:
+    entry_data = MockConfigEntryData(
+        hass,
+        entity_config={
+            "switch.test": {
+                CONF_ENTITY_PROPERTIES: [
+                    {CONF_ENTITY_PROPERTY_TYPE: "voltage", CONF_ENTITY_PROPERTY_ENTITY: "sensor.voltage"},
+                    {
+                        CONF_ENTITY_PROPERTY_TYPE: "temperature",
+                        CONF_ENTITY_PROPERTY_VALUE_TEMPLATE: Template("{{ states('sensor.temp') }}", hass),
+                    },
+                ]
+            }
+        },
+    )
+    hass.states.async_set("switch.test", STATE_ON)
+    hass.states.async_set("sensor.voltage", "220", {ATTR_UNIT_OF_MEASUREMENT: "V"})
+    hass.states.async_set("sensor.temp", "20", {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS})
+
+    async def _describe() -> Any:
+        state = hass.states.get("switch.test")
+        assert state
+        return await Device(hass, entry_data, state.entity_id, state).describe()
+
+    d = await _describe()
+    assert d
+    assert entry_data.device_description_cache["switch.test"][1] == ["sensor.temp", "sensor.voltage"]
+
+    hass.states.async_set("sensor.voltage", "230", {ATTR_UNIT_OF_MEASUREMENT: "V"})
+    hass.states.async_set("sensor.temp", "25", {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS})
+    assert await _describe() is d
+
+    hass.states.async_set("sensor.voltage", "230", {ATTR_UNIT_OF_MEASUREMENT: "mV"})
+    d = await _describe()
+    assert await _describe() is d
+
+    hass.states.async_set("sensor.temp", "25", {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.FAHRENHEIT})
+    assert await _describe() is not d
+
+
 async def test_device_name_room_ignore_aliases(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
@@ -808,6 +963,37 @@ async def test_device_query(hass: HomeAssistant, entry_data: MockConfigEntryData
         assert device.query().as_dict() == {"id": "switch.test"}
 
 
+async def test_async_get_device_states(hass: HomeAssistant) -> None:
+    entity_ids = [f"switch.test_{i}" for i in range(5)]
+    entry_data = MockConfigEntryData(
+        hass,
+        entity_config={
+            entity_id: {
+                CONF_ENTITY_PROPERTIES: [
+                    {
+                        CONF_ENTITY_PROPERTY_TYPE: "temperature",
+                        CONF_ENTITY_PROPERTY_VALUE_TEMPLATE: Template("{{ states('sensor.temp') }}", hass),
+                    }
+                ]
+            }
+            for entity_id in entity_ids
+        },
+    )
+    hass.states.async_set("sensor.temp", "21.5")
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_ON)
+
+    with (
+        patch("custom_components.yandex_smart_home.device._QUERY_CHUNK_SIZE", 2),
+        patch("custom_components.yandex_smart_home.device.asyncio.sleep") as mock_sleep,
+    ):
+        states = await async_get_device_states(hass, entry_data, entity_ids)
+
+    assert mock_sleep.call_count == 2
+    assert [s.id for s in states] == entity_ids
+    assert [s.as_dict()["properties"][0]["state"]["value"] for s in states] == [21.5] * 5
+
+
 async def test_device_execute(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
     state = State("switch.test", STATE_ON)
     device = Device(hass, entry_data, state.entity_id, state)
@@ -839,6 +1025,8 @@ async def test_device_execute_exception(hass: HomeAssistant, entry_data: MockCon
             raise Exception("fail set_state")
 
     class MockBrightnessCapability(BrightnessCapability):
+        domains = None  # type: ignore[assignment]
+
         @property
         def supported(self) -> bool:
             return True
@@ -848,7 +1036,9 @@ async def test_device_execute_exception(hass: HomeAssistant, entry_data: MockCon
 
     state = State("switch.test", STATE_ON)
     device = Device(hass, entry_data, state.entity_id, state)
-    with patch("custom_components.yandex_smart_home.device.STATE_CAPABILITIES_REGISTRY", [MockOnOffCapability]):
+    with patch(
+        "custom_components.yandex_smart_home.device.STATE_CAPABILITIES_REGISTRY", DomainRegistry([MockOnOffCapability])
+    ):
         with pytest.raises(APIError) as e:
             await device.execute(
                 Context(),
@@ -862,8 +1052,12 @@ async def test_device_execute_exception(hass: HomeAssistant, entry_data: MockCon
         "Failed to execute action for on_off capability of switch.test: Exception('fail set_state')"
     )
 
+    entry_data.capability_types_cache.clear()
     device = Device(hass, entry_data, state.entity_id, state)
-    with patch("custom_components.yandex_smart_home.device.STATE_CAPABILITIES_REGISTRY", [MockBrightnessCapability]):
+    with patch(
+        "custom_components.yandex_smart_home.device.STATE_CAPABILITIES_REGISTRY",
+        DomainRegistry([MockBrightnessCapability]),
+    ):
         with pytest.raises(APIError) as e:
             await device.execute(
                 Context(),
@@ -1,9 +1,10 @@
 from unittest.mock import patch
 
 from homeassistant.auth.models import User
-from homeassistant.const import CONF_PLATFORM
+from homeassistant.const import CONF_PLATFORM, CONF_STATE_TEMPLATE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er, issue_registry as ir
+from homeassistant.helpers.template import Template
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -12,8 +13,12 @@ from custom_components.yandex_smart_home.capability_toggle import BacklightCapab
 from custom_components.yandex_smart_home.config_flow import ConfigFlowHandler
 from custom_components.yandex_smart_home.const import (
     CONF_CONNECTION_TYPE,
+    CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ATTRIBUTE,
     CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ENTITY_ID,
+    CONF_ENTITY_CUSTOM_RANGES,
     CONF_ENTITY_CUSTOM_TOGGLES,
+    CONF_ENTITY_PROPERTY_ATTRIBUTE,
+    CONF_ENTITY_PROPERTY_VALUE_TEMPLATE,
     CONF_FILTER_SOURCE,
     CONF_LABEL,
     CONF_LINKED_PLATFORMS,
@@ -25,10 +30,13 @@ from custom_components.yandex_smart_home.const import (
     EntityFilterSource,
 )
 from custom_components.yandex_smart_home.entry_data import ConfigEntryData
-from custom_components.yandex_smart_home.helpers import APIError, SmartHomePlatform
+from custom_components.yandex_smart_home.helpers import APIError, SmartHomePlatform, async_get_value_template
 from custom_components.yandex_smart_home.property_custom import (
     ButtonPressEventPlatformCustomProperty,
+    HumidityCustomFloatProperty,
+    MotionCustomEventProperty,
     MotionEventPlatformCustomProperty,
+    TemperatureCustomFloatProperty,
 )
 from custom_components.yandex_smart_home.schema import ResponseCode
 from tests.test_device import (
@@ -68,6 +76,16 @@ def test_entry_data_platform(hass: HomeAssistant) -> None:
     assert entry_data.platform is None
 
 
+def test_entry_data_default_timeouts(hass: HomeAssistant) -> None:
+    entry_data = MockConfigEntryData(hass)
+    query_timeout = entry_data.get_request_timeout("/user/devices/query")
+    action_timeout = entry_data.get_request_timeout("/user/devices/action")
+    assert query_timeout is not None and query_timeout <= 3
+    assert action_timeout is not None and action_timeout <= 3
+    assert entry_data.action_timeout < action_timeout
+    assert entry_data.get_request_timeout("/user/devices") is None
+
+
 def test_entry_data_trackable_templates(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
     entry_data = MockConfigEntryData(
         hass=hass,
@@ -104,7 +122,49 @@ def test_entry_data_trackable_templates(hass: HomeAssistant, caplog: pytest.LogC
         entity_filter=generate_entity_filter(include_entity_globs=["*"]),
     )
 
-    assert len(entry_data._get_trackable_templates()) == 2
+    assert len(entry_data._get_trackable_templates()) == 1
+
+
+def test_entry_data_trackable_entity_values(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
+    entry_data = MockConfigEntryData(
+        hass=hass,
+        entity_config={
+            "sensor.foo": {
+                CONF_ENTITY_PROPERTIES: [
+                    {CONF_ENTITY_PROPERTY_TYPE: "temperature"},
+                    {
+                        CONF_ENTITY_PROPERTY_TYPE: "humidity",
+                        CONF_ENTITY_PROPERTY_ENTITY: "climate.bar",
+                        CONF_ENTITY_PROPERTY_ATTRIBUTE: "humidity",
+                    },
+                    {CONF_ENTITY_PROPERTY_TYPE: "motion", CONF_ENTITY_PROPERTY_ENTITY: "binary_sensor.motion"},
+                    {CONF_ENTITY_PROPERTY_TYPE: "button", CONF_ENTITY_PROPERTY_ENTITY: "event.button"},
+                    {CONF_ENTITY_PROPERTY_TYPE: "co2_level", CONF_ENTITY_PROPERTY_ENTITY: "binary_sensor.co2"},
+                    {
+                        CONF_ENTITY_PROPERTY_TYPE: "pressure",
+                        CONF_ENTITY_PROPERTY_VALUE_TEMPLATE: Template("{{ states('sensor.pressure') }}", hass),
+                    },
+                ],
+            },
+            "switch.not_exposed": {
+                CONF_ENTITY_PROPERTIES: [
+                    {CONF_ENTITY_PROPERTY_TYPE: "temperature", CONF_ENTITY_PROPERTY_ENTITY: "sensor.foo"},
+                ],
+            },
+        },
+        entity_filter=generate_entity_filter(include_entity_globs=["*"], exclude_entities=["switch.not_exposed"]),
+    )
+
+    values = entry_data._get_trackable_entity_values()
+    assert {entity_id: [type(p) for p in properties] for entity_id, properties in values.items()} == {
+        "sensor.foo": [TemperatureCustomFloatProperty],
+        "climate.bar": [HumidityCustomFloatProperty],
+        "binary_sensor.motion": [MotionCustomEventProperty],
+    }
+    assert [p.device_id for p in values["sensor.foo"]] == ["sensor.foo"]
+    assert caplog.messages == [
+        "Failed to track custom property: Unsupported entity binary_sensor.co2 for co2_level property of sensor.foo"
+    ]
 
 
 def test_entry_data_trackable_entity_states(hass: HomeAssistant) -> None:
@@ -213,6 +273,98 @@ async def test_entry_data_should_expose_labels(hass: HomeAssistant, entity_regis
     assert entry_data.should_expose("sensor.test_1") is True
 
 
+async def test_entry_data_exposed_entity_ids(hass: HomeAssistant) -> None:
+    hass.states.async_set("sensor.foo", "1")
+    hass.states.async_set("sensor.bar", "1")
+    hass.states.async_set("light.kitchen", "on")
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=ConfigFlowHandler.VERSION,
+        data={CONF_CONNECTION_TYPE: ConnectionType.DIRECT},
+    )
+    entry_data = MockConfigEntryData(
+        hass,
+        entry=entry,
+        entity_filter=generate_entity_filter(include_entity_globs=["sensor.*"], exclude_entities=["sensor.bar"]),
+    )
+    assert entry_data.exposed_entity_ids == ["sensor.foo"]
+
+    await entry_data.async_setup()
+    assert entry_data.exposed_entity_ids == ["sensor.foo"]
+
+    hass.states.async_set("sensor.baz", "1")
+    hass.states.async_set("light.living_room", "on")
+    hass.states.async_set("sensor.foo", "2")
+    assert entry_data.exposed_entity_ids == ["sensor.foo", "sensor.baz"]
+
+    hass.states.async_remove("sensor.foo")
+    assert entry_data.exposed_entity_ids == ["sensor.baz"]
+
+    hass.states.async_set("sensor.foo", "3")
+    assert entry_data.exposed_entity_ids == ["sensor.baz", "sensor.foo"]
+
+
+async def test_entry_data_value_templates(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=ConfigFlowHandler.VERSION,
+        data={CONF_CONNECTION_TYPE: ConnectionType.DIRECT},
+    )
+    entry_data = MockConfigEntryData(
+        hass,
+        entry=entry,
+        entity_config={
+            "switch.foo": {
+                CONF_ENTITY_CUSTOM_TOGGLES: {
+                    "pause": {CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ENTITY_ID: "binary_sensor.pause"},
+                    "backlight": {CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ATTRIBUTE: "backlight"},
+                },
+                CONF_ENTITY_CUSTOM_RANGES: {
+                    "volume": {CONF_STATE_TEMPLATE: Template("{{ 1 }}", hass)},
+                },
+            }
+        },
+    )
+    await entry_data.async_setup()
+    assert list(entry_data.value_templates) == [("binary_sensor.pause", None), ("switch.foo", "backlight")]
+
+    template = entry_data.value_templates[("binary_sensor.pause", None)]
+    assert template.template == "{{ states('binary_sensor.pause') }}"
+    assert async_get_value_template(hass, entry_data, "binary_sensor.pause") is template
+
+
+async def test_entry_data_exposed_entity_ids_labels(hass: HomeAssistant, entity_registry: er.EntityRegistry) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=ConfigFlowHandler.VERSION,
+        data={CONF_CONNECTION_TYPE: ConnectionType.DIRECT},
+        options={CONF_FILTER_SOURCE: EntityFilterSource.LABEL, CONF_LABEL: "foo"},
+    )
+    entry_data = MockConfigEntryData(hass, entry=entry)
+    e = entity_registry.async_get_or_create("sensor", "test", "1")
+    hass.states.async_set(e.entity_id, "1")
+    hass.states.async_set("sensor.test_2", "1")
+
+    await entry_data.async_setup()
+    assert entry_data.exposed_entity_ids == []
+
+    entity_registry.async_update_entity(e.entity_id, labels={"foo"})
+    await hass.async_block_till_done()
+    assert entry_data.exposed_entity_ids == ["sensor.test_1"]
+
+    entity_registry.async_update_entity(e.entity_id, new_entity_id="sensor.test_3")
+    await hass.async_block_till_done()
+    assert entry_data.exposed_entity_ids == []
+
+    hass.states.async_set("sensor.test_3", "1")
+    assert entry_data.exposed_entity_ids == ["sensor.test_3"]
+
+    entity_registry.async_update_entity("sensor.test_3", labels=set())
+    await hass.async_block_till_done()
+    assert entry_data.exposed_entity_ids == []
+
+
 async def test_deprecated_pressure_unit(
     hass: HomeAssistant,
     config_entry_direct: MockConfigEntry,
@@ -1,15 +1,26 @@
+import asyncio
 import json
 from typing import Any
 from unittest.mock import Mock, patch
 
 from homeassistant.auth.models import User
-from homeassistant.const import CONF_STATE_TEMPLATE, STATE_OFF, STATE_ON, STATE_UNAVAILABLE
-from homeassistant.core import Context, HomeAssistant, State
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    CONF_STATE_TEMPLATE,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+)
+from homeassistant.core import Context, HomeAssistant, ServiceCall, State
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.template import Template
 from homeassistant.util.decorator import Registry
 import pytest
 
 from custom_components.yandex_smart_home import DOMAIN, YandexSmartHome, handlers
+from custom_components.yandex_smart_home.capability import StateCapability
 from custom_components.yandex_smart_home.capability_onoff import OnOffCapability
 from custom_components.yandex_smart_home.capability_toggle import StateToggleCapability
 from custom_components.yandex_smart_home.const import (
@@ -19,7 +30,14 @@ from custom_components.yandex_smart_home.const import (
     CONF_ENTITY_PROPERTY_VALUE_TEMPLATE,
     EVENT_DEVICE_ACTION,
 )
-from custom_components.yandex_smart_home.helpers import APIError, RequestData, SmartHomePlatform
+from custom_components.yandex_smart_home.helpers import (
+    APIError,
+    DomainRegistry,
+    RequestData,
+    SmartHomePlatform,
+    async_call_service,
+    batch_service_calls,
+)
 from custom_components.yandex_smart_home.schema import (
     CapabilityInstanceActionResultValue,
     CapabilityType,
@@ -286,7 +304,7 @@ async def test_handler_devices_action(
 
     with patch(
         "custom_components.yandex_smart_home.device.STATE_CAPABILITIES_REGISTRY",
-        [MockCapabilityA, MockCapabilityReturnState, MockCapabilityFail],
+        DomainRegistry[type[StateCapability[Any]]]([MockCapabilityA, MockCapabilityReturnState, MockCapabilityFail]),
     ):
         payload = json.dumps(
             {
@@ -437,6 +455,317 @@ async def test_handler_devices_action(
         ]
 
 
+async def test_handler_devices_action_concurrency(hass: HomeAssistant) -> None:
+    running: set[str] = set()
+    max_running: list[int] = []
+
+    class MockCapability(StateToggleCapability):
+        instance = ToggleCapabilityInstance.PAUSE
+
+        @property
+        def supported(self) -> bool:
+            return True
+
+        def get_value(self) -> bool | None:
+            return None
+
+        async def set_instance_state(self, context: Context, state: ToggleCapabilityInstanceActionState) -> None:
+            running.add(self.device_id)
+            max_running.append(len(running))
+            await asyncio.sleep(0 if self.device_id != "switch.slow" else 1)
+            running.discard(self.device_id)
+
+    entry_data = MockConfigEntryData(hass, yaml_config={"settings": {"action_concurrency": 2, "action_timeout": 0.05}})
+    data = RequestData(entry_data, Context(), SmartHomePlatform.YANDEX, "test", REQ_ID)
+    entity_ids = ["switch.test_1", "switch.test_2", "switch.slow", "switch.test_3"]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_OFF)
+
+    action = {"type": MockCapability.type, "state": {"instance": MockCapability.instance, "value": True}}
+    payload = json.dumps(
+        {"payload": {"devices": [{"id": entity_id, "capabilities": [action, action]} for entity_id in entity_ids]}}
+    )
+
+    with patch(
+        "custom_components.yandex_smart_home.device.STATE_CAPABILITIES_REGISTRY",
+        DomainRegistry[type[StateCapability[Any]]]([MockCapability]),
+    ):
+        resp = await handlers.async_devices_action(hass, data, payload)
+
+    assert resp
+    devices = resp.as_dict()["devices"]
+    assert max(max_running) == 2
+    assert [d["id"] for d in devices] == entity_ids
+    assert [[c["state"]["action_result"] for c in d["capabilities"]] for d in devices] == [
+        [{"status": "DONE"}, {"status": "DONE"}],
+        [{"status": "DONE"}, {"status": "DONE"}],
+        [
+            {"status": "ERROR", "error_code": "DEVICE_UNREACHABLE"},
+            {"status": "ERROR", "error_code": "DEVICE_UNREACHABLE"},
+        ],
+        [{"status": "DONE"}, {"status": "DONE"}],
+    ]
+
+
+async def test_handler_request_deadline(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
+    class MockCapability(StateToggleCapability):
+        instance = ToggleCapabilityInstance.PAUSE
+
+        @property
+        def supported(self) -> bool:
+            return True
+
+        def get_value(self) -> bool | None:
+            return None
+
+        async def set_instance_state(self, context: Context, state: ToggleCapabilityInstanceActionState) -> None:
+            if self.device_id == "switch.slow":
+                await asyncio.sleep(state.value and 1 or 0)
+
+    entry_data = MockConfigEntryData(
+        hass,
+        yaml_config={"settings": {"action_concurrency": 1, "request_timeout": {"action": 0.05, "query": 0.05}}},
+    )
+    assert entry_data.get_request_timeout("/user/devices/action") == 0.05
+    assert entry_data.get_request_timeout("/user/devices") is None
+    assert entry_data.get_request_timeout("/user/unlink") is None
+
+    entity_ids = ["switch.test_1", "switch.slow", "switch.test_2"]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_OFF)
+
+    fast_action = {"type": MockCapability.type, "state": {"instance": MockCapability.instance, "value": False}}
+    slow_action = {"type": MockCapability.type, "state": {"instance": MockCapability.instance, "value": True}}
+    payload = json.dumps(
+        {
+            "payload": {
+                "devices": [
+                    {"id": "switch.test_1", "capabilities": [fast_action]},
+                    {"id": "switch.slow", "capabilities": [fast_action, slow_action, fast_action]},
+                    {"id": "switch.test_2", "capabilities": [fast_action]},
+                ]
+            }
+        }
+    )
+
+    data = RequestData(entry_data, Context(), SmartHomePlatform.YANDEX, "test", REQ_ID)
+    with patch(
+        "custom_components.yandex_smart_home.device.STATE_CAPABILITIES_REGISTRY",
+        DomainRegistry[type[StateCapability[Any]]]([MockCapability]),
+    ):
+        resp = await handlers.async_handle_request(hass, data, "/user/devices/action", payload)
+
+    assert data.deadline is not None
+    assert resp.payload
+    devices = resp.payload.as_dict()["devices"]
+    assert [d["id"] for d in devices] == entity_ids
+    assert [[c["state"]["action_result"] for c in d["capabilities"]] for d in devices] == [
+        [{"status": "DONE"}],
+        [
+            {"status": "DONE"},
+            {"status": "ERROR", "error_code": "DEVICE_BUSY"},
+            {"status": "ERROR", "error_code": "DEVICE_BUSY"},
+        ],
+        [{"status": "ERROR", "error_code": "DEVICE_BUSY"}],
+    ]
+    assert "Request deadline exceeded while executing actions for switch.slow" in caplog.messages
+    await hass.async_block_till_done()
+
+    caplog.clear()
+    entry_data = MockConfigEntryData(hass)
+    data = RequestData(entry_data, Context(), SmartHomePlatform.YANDEX, "test", REQ_ID)
+    data.deadline = hass.loop.time()
+    with patch("custom_components.yandex_smart_home.device._QUERY_CHUNK_SIZE", 1):
+        resp = await handlers.async_handle_request(
+            hass, data, "/user/devices/query", json.dumps({"devices": [{"id": entity_id} for entity_id in entity_ids]})
+        )
+
+    assert resp.payload
+    assert resp.payload.as_dict() == {
+        "devices": [
+            {
+                "id": "switch.test_1",
+                "capabilities": [{"type": "devices.capabilities.on_off", "state": {"instance": "on", "value": False}}],
+            },
+            {"id": "switch.slow", "error_code": "DEVICE_BUSY"},
+            {"id": "switch.test_2", "error_code": "DEVICE_BUSY"},
+        ]
+    }
+    assert caplog.messages[-1] == "Request deadline exceeded while querying states of 2 devices"
+
+
+async def test_handler_action_timeout_default_settings(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
+    completed: list[str] = []
+
+    class MockCapability(StateToggleCapability):
+        instance = ToggleCapabilityInstance.PAUSE
+
+        @property
+        def supported(self) -> bool:
+            return True
+
+        def get_value(self) -> bool | None:
+            return None
+
+        async def set_instance_state(self, context: Context, state: ToggleCapabilityInstanceActionState) -> None:
+            if self.device_id == "switch.slow":
+                await asyncio.sleep(0.1)
+                completed.append(self.device_id)
+
+    entry_data = MockConfigEntryData(hass)
+    request_timeout = entry_data.get_request_timeout("/user/devices/action")
+    assert request_timeout is not None
+    assert entry_data.action_timeout < request_timeout
+
+    entity_ids = ["switch.test", "switch.slow"]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_OFF)
+
+    action = {"type": MockCapability.type, "state": {"instance": MockCapability.instance, "value": True}}
+    payload = json.dumps(
+        {"payload": {"devices": [{"id": entity_id, "capabilities": [action]} for entity_id in entity_ids]}}
+    )
+
+    data = RequestData(entry_data, Context(), SmartHomePlatform.YANDEX, "test", REQ_ID)
+    with (
+        patch(
+            "custom_components.yandex_smart_home.device.STATE_CAPABILITIES_REGISTRY",
+            DomainRegistry[type[StateCapability[Any]]]([MockCapability]),
+        ),
+        patch(
+            "custom_components.yandex_smart_home.entry_data.DEFAULT_ACTION_TIMEOUT",
+            entry_data.action_timeout / 100,
+        ),
+        patch.dict(
+            "custom_components.yandex_smart_home.entry_data.DEFAULT_REQUEST_TIMEOUT",
+            {"action": request_timeout / 100},
+        ),
+    ):
+        resp = await handlers.async_handle_request(hass, data, "/user/devices/action", payload)
+
+    assert resp.payload
+    devices = resp.payload.as_dict()["devices"]
+    assert [d["id"] for d in devices] == entity_ids
+    assert [[c["state"]["action_result"] for c in d["capabilities"]] for d in devices] == [
+        [{"status": "DONE"}],
+        [{"status": "ERROR", "error_code": "DEVICE_UNREACHABLE"}],
+    ]
+    assert "Timeout while executing actions for switch.slow" in caplog.messages
+
+    assert completed == []
+    await hass.async_block_till_done()
+    assert completed == ["switch.slow"]
+
+
+async def test_handler_devices_action_batched_service_calls(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    calls: list[tuple[str, Any]] = []
+
+    async def _service_handler(call: ServiceCall) -> None:
+        calls.append((call.service, call.data[ATTR_ENTITY_ID]))
+        if "light.bad" in call.data[ATTR_ENTITY_ID]:
+            raise HomeAssistantError("bad light")
+
+    hass.services.async_register("light", SERVICE_TURN_ON, _service_handler)
+    hass.services.async_register("light", SERVICE_TURN_OFF, _service_handler)
+
+    entry_data = MockConfigEntryData(hass)
+    data = RequestData(entry_data, Context(), SmartHomePlatform.YANDEX, "test", REQ_ID)
+    devices = {"light.a": False, "light.b": False, "light.c": False, "light.d": True, "light.e": True}
+    for entity_id in devices:
+        hass.states.async_set(entity_id, STATE_ON)
+
+    def _payload(devices: dict[str, bool]) -> str:
+        return json.dumps(
+            {
+                "payload": {
+                    "devices": [
+                        {
+                            "id": entity_id,
+                            "capabilities": [
+                                {"type": "devices.capabilities.on_off", "state": {"instance": "on", "value": value}}
+                            ],
+                        }
+                        for entity_id, value in devices.items()
+                    ]
+                }
+            }
+        )
+
+    resp = await handlers.async_devices_action(hass, data, _payload(devices))
+    assert resp
+    assert [d["capabilities"][0]["state"]["action_result"] for d in resp.as_dict()["devices"]] == [
+        {"status": "DONE"}
+    ] * 5
+    assert sorted(calls) == [
+        ("turn_off", ["light.a", "light.b", "light.c"]),
+        ("turn_on", ["light.d", "light.e"]),
+    ]
+
+    calls.clear()
+    hass.states.async_set("light.bad", STATE_ON)
+    caplog.clear()
+    resp = await handlers.async_devices_action(hass, data, _payload({"light.a": False, "light.bad": False}))
+    assert resp
+    assert [d["capabilities"][0]["state"]["action_result"] for d in resp.as_dict()["devices"]] == [
+        {"status": "DONE"},
+        {"status": "ERROR", "error_code": "INTERNAL_ERROR"},
+    ]
+    assert calls == [
+        ("turn_off", ["light.a", "light.bad"]),
+        ("turn_off", "light.a"),
+        ("turn_off", "light.bad"),
+    ]
+    assert "bad light" in caplog.messages[-1]
+    assert "Batched call of light.turn_off for light.a, light.bad failed" in caplog.text
+
+
+async def test_batch_service_calls_not_batchable(hass: HomeAssistant) -> None:
+    calls: list[tuple[str, str, Any]] = []
+
+    async def _service_handler(call: ServiceCall) -> None:
+        calls.append((call.domain, call.service, call.data[ATTR_ENTITY_ID]))
+        if call.service == "set_value":
+            raise ValueError("unexpected")
+
+    for domain, service in [
+        ("media_player", "volume_up"),
+        ("script", SERVICE_TURN_ON),
+        ("button", "press"),
+        ("number", "set_value"),
+    ]:
+        hass.services.async_register(domain, service, _service_handler)
+
+    async def _call(domain: str, service: str, entity_id: str) -> None:
+        await async_call_service(hass, domain, service, {ATTR_ENTITY_ID: entity_id}, blocking=True)
+
+    with batch_service_calls(hass):
+        tasks = [
+            hass.async_create_task(_call(domain, service, entity_id))
+            for domain, service in [("media_player", "volume_up"), ("script", SERVICE_TURN_ON), ("button", "press")]
+            for entity_id in (f"{domain}.a", f"{domain}.b")
+        ]
+    await asyncio.gather(*tasks)
+
+    assert sorted(calls) == [
+        ("button", "press", "button.a"),
+        ("button", "press", "button.b"),
+        ("media_player", "volume_up", "media_player.a"),
+        ("media_player", "volume_up", "media_player.b"),
+        ("script", "turn_on", "script.a"),
+        ("script", "turn_on", "script.b"),
+    ]
+
+    calls.clear()
+    with batch_service_calls(hass):
+        tasks = [hass.async_create_task(_call("number", "set_value", f"number.{e}")) for e in ("a", "b")]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert calls == [("number", "set_value", ["number.a", "number.b"])]
+    assert [repr(r) for r in results] == ["ValueError('unexpected')"] * 2
+
+
 async def test_handler_devices_action_error_template(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
     class MockCapabilityA(OnOffCapability):
         @property
@@ -507,7 +836,7 @@ async def test_handler_devices_action_error_template(hass: HomeAssistant, caplog
 
     with patch(
         "custom_components.yandex_smart_home.device.STATE_CAPABILITIES_REGISTRY",
-        [MockCapabilityA, MockCapabilityB, MockCapabilityC],
+        DomainRegistry[type[StateCapability[Any]]]([MockCapabilityA, MockCapabilityB, MockCapabilityC]),
     ):
         payload = json.dumps(
             {
@@ -1,4 +1,19 @@
-from . import MockCacheStore, MockStore
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import area_registry as ar, device_registry as dr, entity_registry as er
+from homeassistant.helpers.template import Template
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.yandex_smart_home.helpers import (
+    DomainRegistry,
+    RegistryInfo,
+    async_get_registry_info_cache,
+    async_get_value_template,
+    async_render_template,
+    async_unload_registry_info_cache,
+    cache_template_renders,
+)
+
+from . import MockCacheStore, MockConfigEntryData, MockStore
 
 
 async def test_async_load() -> None:
@@ -27,3 +42,121 @@ async def test_cache() -> None:
     cache.save_attr_value("foo", "bar", [1, 2, 3])
     cache._store.saved_mock.assert_called_once()
     assert cache.get_attr_value("foo", "bar") == [1, 2, 3]
+
+
+def test_domain_registry() -> None:
+    class Base:
+        domains: set[str] | None = None
+        device_classes: set[str] | None = None
+
+    class Light(Base):
+        domains = {"light"}
+
+    class Motion(Base):
+        domains = {"binary_sensor", "event"}
+        device_classes = {"motion"}
+
+    registry = DomainRegistry[type[Base]]()
+    registry.register(Light)
+    registry.register(Base)
+    assert registry.get_for_domain("light") == [Light, Base]
+    assert registry.get_for_domain("switch") == [Base]
+
+    registry.register(Motion)
+    assert registry.get_for_domain("light") == [Light, Base]
+    assert registry.get_for_domain("binary_sensor") == [Base]
+    assert registry.get_for_domain("binary_sensor", "motion") == [Base, Motion]
+    assert registry.get_for_domain("binary_sensor", "door") == [Base]
+    assert registry.get_for_domain("event", "motion") == [Base, Motion]
+
+
+async def test_registry_info_cache(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    device_registry: dr.DeviceRegistry,
+    area_registry: ar.AreaRegistry,
+) -> None:
+    config_entry = MockConfigEntry(domain="test", data={})
+    config_entry.add_to_hass(hass)
+
+    cache = async_get_registry_info_cache(hass)
+    assert async_get_registry_info_cache(hass) is cache
+    assert cache.async_get("switch.missing", True) == RegistryInfo()
+
+    area = area_registry.async_create("Кухня", aliases={"Kitchen"})
+    dev_entry = device_registry.async_get_or_create(
+        identifiers={("test", "1")}, config_entry_id=config_entry.entry_id, manufacturer="Foo", model="Bar"
+    )
+    entry = entity_registry.async_get_or_create(
+        "switch", "test", "1", device_id=dev_entry.id, suggested_object_id="test"
+    )
+    entity_registry.async_update_entity(entry.entity_id, aliases={"Алиса: Лампа", "лампочка"})
+    device_registry.async_update_device(dev_entry.id, area_id=area.id)
+
+    info = cache.async_get("switch.test", True)
+    assert info == RegistryInfo(name="Лампа", room="Кухня", manufacturer="Foo", model="Bar")
+    assert cache.async_get("switch.test", True) is info
+    assert cache.async_get("switch.test", False) == info
+
+    entity_registry.async_update_entity(entry.entity_id, aliases={"лампочка"})
+    assert cache.async_get("switch.test", True).name == "лампочка"
+    assert cache.async_get("switch.test", False).name is None
+
+    device_registry.async_update_device(dev_entry.id, sw_version="1.0")
+    assert cache.async_get("switch.test", True).sw_version == "1.0"
+
+    area_registry.async_update(area.id, aliases={"Алиса: Столовая"})
+    assert cache.async_get("switch.test", True).room == "Столовая"
+
+    entity_registry.async_update_entity(entry.entity_id, new_entity_id="switch.new")
+    assert cache.async_get("switch.test", True) == RegistryInfo()
+    assert cache.async_get("switch.new", True).name == "лампочка"
+
+    listeners = hass.bus.async_listeners()
+    async_unload_registry_info_cache(hass)
+    for event_type in (
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        ar.EVENT_AREA_REGISTRY_UPDATED,
+    ):
+        assert hass.bus.async_listeners().get(event_type, 0) == listeners[event_type] - 1
+
+    assert async_get_registry_info_cache(hass) is not cache
+
+
+async def test_cache_template_renders(hass: HomeAssistant) -> None:
+    hass.states.async_set("sensor.test", "1")
+    template_a = Template("{{ states('sensor.test') }}", hass)
+    template_b = Template("{{ states('sensor.test') }}", hass)
+
+    assert async_render_template(template_a) == 1
+    hass.states.async_set("sensor.test", "2")
+    assert async_render_template(template_b) == 2
+
+    with cache_template_renders():
+        assert async_render_template(template_a) == 2
+        hass.states.async_set("sensor.test", "3")
+        assert async_render_template(template_a) == 2
+        assert async_render_template(template_b) == 2
+
+    assert async_render_template(template_b) == 3
+
+
+async def test_async_get_value_template(hass: HomeAssistant) -> None:
+    entry_data = MockConfigEntryData(hass)
+    hass.states.async_set("sensor.test", "1", {"foo": "bar"})
+
+    template = async_get_value_template(hass, entry_data, "sensor.test")
+    assert template.template == "{{ states('sensor.test') }}"
+    assert template.async_render() == 1
+    assert async_get_value_template(hass, entry_data, "sensor.test") is template
+    assert entry_data.value_templates == {("sensor.test", None): template}
+
+    template = async_get_value_template(hass, entry_data, "sensor.test", "foo")
+    assert template.template == "{{ state_attr('sensor.test', 'foo') }}"
+    assert template.async_render() == "bar"
+    assert async_get_value_template(hass, entry_data, "sensor.test", "foo") is template
+    assert async_get_value_template(hass, entry_data, "sensor.test", "bar") is not template
+    assert len(entry_data.value_templates) == 3
+
+    assert MockConfigEntryData(hass).value_templates == {}
@@ -24,6 +24,7 @@ from custom_components.yandex_smart_home.const import (
     CONF_NOTIFIER_USER_ID,
     EntityFilterSource,
 )
+from custom_components.yandex_smart_home.helpers import async_get_registry_info_cache
 
 
 async def test_bad_config(hass: HomeAssistant) -> None:
@@ -434,10 +435,33 @@ async def test_unload_entry(hass: HomeAssistant, config_entry_direct: MockConfig
     with pytest.raises(ValueError):
         assert entry_data.cloud_instance_id
 
-    await hass.config_entries.async_unload(config_entry_direct.entry_id)
+    cache = async_get_registry_info_cache(hass)
+    with patch.object(cache, "async_unload") as mock_unload_cache:
+        await hass.config_entries.async_unload(config_entry_direct.entry_id)
+        mock_unload_cache.assert_called_once()
+
+    assert async_get_registry_info_cache(hass) is not cache
     assert entry_data.entry.state == ConfigEntryState.NOT_LOADED  # type: ignore[comparison-overlap]
 
 
+async def test_unload_entry_keeps_registry_info_cache(
+    hass: HomeAssistant, config_entry_direct: MockConfigEntry, config_entry_cloud: MockConfigEntry
+) -> None:
+    config_entry_direct.add_to_hass(hass)
+    config_entry_cloud.add_to_hass(hass)
+    with patch("custom_components.yandex_smart_home.entry_data.ConfigEntryData._async_setup_cloud_connection"):
+        await hass.config_entries.async_setup(config_entry_direct.entry_id)
+        await hass.async_block_till_done()
+
+    assert config_entry_cloud.state == ConfigEntryState.LOADED
+    cache = async_get_registry_info_cache(hass)
+    await hass.config_entries.async_unload(config_entry_cloud.entry_id)
+    assert async_get_registry_info_cache(hass) is cache
+
+    await hass.config_entries.async_unload(config_entry_direct.entry_id)
+    assert async_get_registry_info_cache(hass) is not cache
+
+
 async def test_remove_entry(hass: HomeAssistant, config_entry_direct: MockConfigEntry) -> None:
     config_entry_direct.add_to_hass(hass)
     await hass.config_entries.async_setup(config_entry_direct.entry_id)
@@ -3,7 +3,7 @@ from datetime import timedelta
 import json
 import logging
 import time
-from typing import Any, Coroutine, Generator, cast
+from typing import Any, Generator, cast
 from unittest.mock import AsyncMock, patch
 
 from aiohttp.client_exceptions import ClientConnectionError
@@ -47,14 +47,17 @@ from custom_components.yandex_smart_home.const import (
     CONF_ENTITY_PROPERTIES,
     CONF_ENTITY_PROPERTY_ENTITY,
     CONF_ENTITY_PROPERTY_TYPE,
+    CONF_ENTITY_PROPERTY_VALUE_TEMPLATE,
     CONF_LINKED_PLATFORMS,
     CONF_SKILL,
     CONF_USER_ID,
     ConnectionType,
 )
+from custom_components.yandex_smart_home.device import Device
 from custom_components.yandex_smart_home.helpers import APIError, SmartHomePlatform
 from custom_components.yandex_smart_home.notifier import (
     CloudNotifier,
+    DeviceStatesTracker,
     Notifier,
     NotifierConfig,
     PendingStates,
@@ -68,6 +71,7 @@ from custom_components.yandex_smart_home.property_custom import (
     PressureCustomFloatProperty,
     get_custom_property,
 )
+from custom_components.yandex_smart_home.property_event import ButtonPressStateEventProperty
 from custom_components.yandex_smart_home.property_float import HumiditySensor, TemperatureSensor
 from custom_components.yandex_smart_home.schema import (
     CapabilityType,
@@ -96,12 +100,12 @@ async def _async_set_state(
     await hass.async_block_till_done()
 
 
-async def _assert_empty_list(coro: Coroutine[Any, Any, Any]) -> None:
-    assert await coro == []
+def _assert_empty_list(states: list[Any]) -> None:
+    assert states == []
 
 
-async def _assert_not_empty_list(coro: Coroutine[Any, Any, Any]) -> None:
-    assert await coro != []
+def _assert_not_empty_list(states: list[Any]) -> None:
+    assert states != []
 
 
 async def test_notifier_setup_no_linked_platforms(
@@ -238,7 +242,7 @@ async def test_notifier_lifecycle_link_platform_cloud(
     assert len(component.get_entry_data(config_entry)._notifiers) == len(platforms)
 
     for notifier in component.get_entry_data(config_entry)._notifiers:
-        assert notifier._unsub_state_changed is not None
+        assert notifier._unsub_states_tracker is not None
         assert notifier._unsub_initial_report is not None
         assert notifier._unsub_heartbeat_report is not None
         assert notifier._unsub_report_states is None
@@ -248,7 +252,7 @@ async def test_notifier_lifecycle_link_platform_cloud(
     await hass.config_entries.async_unload(config_entry.entry_id)
 
     for notifier in component.get_entry_data(config_entry)._notifiers:
-        assert notifier._unsub_state_changed is None
+        assert notifier._unsub_states_tracker is None
         assert notifier._unsub_initial_report is None
         assert notifier._unsub_heartbeat_report is None
         assert notifier._unsub_report_states is None
@@ -322,7 +326,7 @@ async def test_notifier_lifecycle_link_platform_direct(
 
     for config_entry in [config_entry_direct, config_entry_cloud_plus]:
         for notifier in component.get_entry_data(config_entry)._notifiers:
-            assert notifier._unsub_state_changed is not None
+            assert notifier._unsub_states_tracker is not None
             assert notifier._unsub_initial_report is not None
             assert notifier._unsub_report_states is None
             assert notifier._unsub_discovery is not None
@@ -330,7 +334,7 @@ async def test_notifier_lifecycle_link_platform_direct(
         await hass.config_entries.async_unload(config_entry.entry_id)
 
         for notifier in component.get_entry_data(config_entry)._notifiers:
-            assert notifier._unsub_state_changed is None
+            assert notifier._unsub_states_tracker is None
             assert notifier._unsub_initial_report is None
             assert notifier._unsub_report_states is None
             assert notifier._unsub_discovery is None
@@ -416,8 +420,11 @@ async def test_notifier_postponed_setup(hass: HomeAssistant, hass_admin_user: Us
 async def test_notifier_format_log_message(
     hass: HomeAssistant, entry_data: MockConfigEntryData, cls: type[Notifier], caplog: pytest.LogCaptureFixture
 ) -> None:
-    n = cls(hass, entry_data, NotifierConfig(user_id="foo", skill_id="bar", token="x"), {}, {})
-    ne = cls(hass, entry_data, NotifierConfig(user_id="foo", skill_id="bar", token="x", extended_log=True), {}, {})
+    states_tracker = DeviceStatesTracker(hass, entry_data, {}, {}, {})
+    n = cls(hass, entry_data, NotifierConfig(user_id="foo", skill_id="bar", token="x"), states_tracker)
+    ne = cls(
+        hass, entry_data, NotifierConfig(user_id="foo", skill_id="bar", token="x", extended_log=True), states_tracker
+    )
     assert n._format_log_message("test") == "test"
     assert ne._format_log_message("test") == "Mock Title: test"
 
@@ -491,12 +498,17 @@ async def test_notifier_track_templates(
         hass_platform,
         entry_data,
         BASIC_CONFIG,
-        entry_data._get_trackable_templates(),
-        entry_data._get_trackable_entity_states(),
+        DeviceStatesTracker(
+            hass_platform,
+            entry_data,
+            entry_data._get_trackable_templates(),
+            entry_data._get_trackable_entity_states(),
+            entry_data._get_trackable_entity_values(),
+        ),
     )
     await notifier.async_setup()
 
-    assert notifier._template_changes_tracker is not None
+    assert notifier._states_tracker._template_changes_tracker is not None
     assert notifier._pending.empty is True
     assert caplog.messages[:1] == [
         "Failed to track custom property: Unsupported entity binary_sensor.foo for "
@@ -508,7 +520,7 @@ async def test_notifier_track_templates(
     await _async_set_state(hass, "sensor.button", "click", {"foo": "bar"})
     assert notifier._pending.empty is True
     await _async_set_state(hass, "sensor.button", "double_click", {"foo": "bar"})
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert list(pending.keys()) == ["sensor.outside_temp"]
     assert len(pending["sensor.outside_temp"]) == 1
     assert pending["sensor.outside_temp"][0].get_value() == "double_click"
@@ -520,7 +532,7 @@ async def test_notifier_track_templates(
     mock_call_later.reset_mock()
     await _async_set_state(hass, "sensor.float", "50")
     await _async_set_state(hass, "sensor.pressure", "1200", {ATTR_UNIT_OF_MEASUREMENT: UnitOfPressure.HPA})
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert list(pending.keys()) == ["light.kitchen", "sensor.outside_temp"]
     assert isinstance(pending["light.kitchen"][0], HumidityCustomFloatProperty)
     assert pending["light.kitchen"][0].get_value() == 50
@@ -547,7 +559,7 @@ async def test_notifier_track_templates(
     assert notifier._pending.empty is True
     caplog.clear()
     await _async_set_state(hass, "sensor.state_template", "on")
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert list(pending.keys()) == ["sensor.outside_temp"]
     assert isinstance(pending["sensor.outside_temp"][0], CustomOnOffCapability)
 
@@ -558,14 +570,14 @@ async def test_notifier_track_templates(
     assert notifier._pending.empty is True
     caplog.clear()
     await _async_set_state(hass, "sensor.dishwashing", "one")
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert list(pending.keys()) == ["sensor.outside_temp"]
     assert len(pending["sensor.outside_temp"]) == 1
     assert pending["sensor.outside_temp"][0].get_value() == "fowl"
     assert (
         caplog.messages[-1]
         == "State report with value 'fowl' scheduled for <CustomModeCapability device_id=sensor.outside_temp "
-        "instance=dishwashing value_template=Template<template=({{ states('sensor.dishwashing') }}) renders=0> value=one>"
+        "instance=dishwashing entity_id=sensor.dishwashing value=one>"
     )
     await _async_set_state(hass, "sensor.dishwashing", "unavailable")
     assert notifier._pending.empty is True
@@ -575,19 +587,19 @@ async def test_notifier_track_templates(
 
     # toggle
     await _async_set_state(hass, "binary_sensor.pause", "off")  # type: ignore[unreachable]
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert list(pending.keys()) == ["sensor.outside_temp"]
     assert len(pending["sensor.outside_temp"]) == 1
     assert pending["sensor.outside_temp"][0].get_value() is False
     await _async_set_state(hass, "binary_sensor.pause", "unavailable")
     assert notifier._pending.empty is True
     await _async_set_state(hass, "binary_sensor.pause", "on")
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert pending["sensor.outside_temp"][0].get_value() is True
 
     # range
     await _async_set_state(hass, "sensor.volume", "50")
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert list(pending.keys()) == ["sensor.outside_temp"]
     assert len(pending["sensor.outside_temp"]) == 1
     assert pending["sensor.outside_temp"][0].get_value() == 50
@@ -595,7 +607,7 @@ async def test_notifier_track_templates(
     assert notifier._pending.empty is True
 
     await notifier.async_unload()
-    assert notifier._template_changes_tracker is None
+    assert notifier._states_tracker._template_changes_tracker is None
 
 
 async def test_notifier_track_templates_exception(
@@ -618,8 +630,13 @@ async def test_notifier_track_templates_exception(
         hass_platform,
         entry_data,
         BASIC_CONFIG,
-        entry_data._get_trackable_templates(),
-        entry_data._get_trackable_entity_states(),
+        DeviceStatesTracker(
+            hass_platform,
+            entry_data,
+            entry_data._get_trackable_templates(),
+            entry_data._get_trackable_entity_states(),
+            entry_data._get_trackable_entity_values(),
+        ),
     )
     await notifier.async_setup()
 
@@ -627,7 +644,7 @@ async def test_notifier_track_templates_exception(
     assert notifier._pending.empty is True
     hass.states.async_set("sensor.v", "5")
     await hass.async_block_till_done()
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert len(pending.keys()) == 1
 
     caplog.clear()
@@ -639,7 +656,7 @@ async def test_notifier_track_templates_exception(
     caplog.clear()
     hass.states.async_set("sensor.v", "6")
     await hass.async_block_till_done()
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert len(pending.keys()) == 1
 
     await notifier.async_unload()
@@ -693,8 +710,13 @@ async def test_notifier_track_entity_states(
         hass_platform,
         entry_data,
         BASIC_CONFIG,
-        entry_data._get_trackable_templates(),
-        entry_data._get_trackable_entity_states(),
+        DeviceStatesTracker(
+            hass_platform,
+            entry_data,
+            entry_data._get_trackable_templates(),
+            entry_data._get_trackable_entity_states(),
+            entry_data._get_trackable_entity_values(),
+        ),
     )
     await notifier.async_setup()
     assert notifier._pending.empty is True
@@ -702,13 +724,13 @@ async def test_notifier_track_entity_states(
     mock_call_later.reset_mock()
     await _async_set_state(hass, "event.motion", STATE_UNKNOWN, {ATTR_EVENT_TYPE: "motion"})
     assert cast(bool, notifier._pending.empty) is False
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert list(pending.keys()) == ["light.kitchen"]
     assert len(pending["light.kitchen"]) == 1
     assert pending["light.kitchen"][0].get_value() == "detected"
 
     await _async_set_state(hass, "event.button", STATE_UNKNOWN, {ATTR_EVENT_TYPE: "pressed"})
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert list(pending.keys()) == ["light.kitchen", "input_text.button"]
     assert pending["light.kitchen"][0].get_value() == "click"
     assert pending["input_text.button"][0].get_value() == "click"
@@ -718,7 +740,7 @@ async def test_notifier_track_entity_states(
 
     mock_call_later.reset_mock()
     await _async_set_state(hass, "event.button", "tick", {ATTR_EVENT_TYPE: "pressed"})
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert list(pending.keys()) == ["light.kitchen", "input_text.button"]
 
 
@@ -735,8 +757,13 @@ async def test_notifier_state_changed(
         hass_platform,
         entry_data,
         BASIC_CONFIG,
-        entry_data._get_trackable_templates(),
-        entry_data._get_trackable_entity_states(),
+        DeviceStatesTracker(
+            hass_platform,
+            entry_data,
+            entry_data._get_trackable_templates(),
+            entry_data._get_trackable_entity_states(),
+            entry_data._get_trackable_entity_values(),
+        ),
     )
     await notifier.async_setup()
 
@@ -748,7 +775,7 @@ async def test_notifier_state_changed(
     caplog.clear()
     mock_call_later.reset_mock()
     await _async_set_state(hass, "sensor.button", "click", {ATTR_DEVICE_CLASS: "button"})
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert list(pending.keys()) == ["sensor.button"]
     assert len(pending["sensor.button"]) == 1
     assert pending["sensor.button"][0].get_value() == "click"
@@ -760,7 +787,7 @@ async def test_notifier_state_changed(
     assert notifier._unsub_report_states is not None
 
     await _async_set_state(hass, "binary_sensor.front_door", "off", {ATTR_DEVICE_CLASS: "door"})  # type: ignore[unreachable]
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert list(pending.keys()) == ["binary_sensor.front_door"]
     assert len(pending["binary_sensor.front_door"]) == 1
     assert pending["binary_sensor.front_door"][0].get_value() == "closed"
@@ -768,7 +795,7 @@ async def test_notifier_state_changed(
     light_state = hass.states.get("light.kitchen")
     assert light_state
     await _async_set_state(hass, light_state.entity_id, "off", light_state.attributes)
-    pending = await notifier._pending.async_get_all()
+    pending = notifier._pending.async_get_all()
     assert list(pending.keys()) == ["light.kitchen"]
     assert len(pending["light.kitchen"]) == 1
     assert pending["light.kitchen"][0].get_value() is False
@@ -783,6 +810,182 @@ async def test_notifier_state_changed(
     await notifier.async_unload()
 
 
+async def test_notifier_track_exposed_entities(hass_platform: HomeAssistant, mock_call_later: AsyncMock) -> None:
+    hass = hass_platform
+    entry_data = MockConfigEntryData(
+        hass=hass,
+        entity_config={
+            "light.kitchen": {
+                CONF_ENTITY_PROPERTIES: [
+                    {CONF_ENTITY_PROPERTY_TYPE: "button", CONF_ENTITY_PROPERTY_ENTITY: "event.button"}
+                ]
+            },
+        },
+        entity_filter=generate_entity_filter(include_entity_globs=["light.*", "sensor.*"]),
+    )
+    notifier = YandexDirectNotifier(
+        hass,
+        entry_data,
+        BASIC_CONFIG,
+        DeviceStatesTracker(hass, entry_data, {}, entry_data._get_trackable_entity_states(), {}),
+    )
+    await notifier.async_setup()
+    assert set(notifier._states_tracker._unsub_entity_state_changed.keys()) == {
+        "light.kitchen",
+        "sensor.outside_temp",
+        "event.button",
+    }
+
+    await _async_set_state(hass, "switch.foo", "on")
+    await _async_set_state(hass, "switch.foo", "off")
+    assert "switch.foo" not in notifier._states_tracker._unsub_entity_state_changed
+    assert notifier._pending.empty is True
+
+    await _async_set_state(hass, "light.new", "on")
+    assert "light.new" in notifier._states_tracker._unsub_entity_state_changed
+    pending = notifier._pending.async_get_all()
+    assert list(pending.keys()) == ["light.new"]
+    assert pending["light.new"][0].get_value() is True
+
+    await _async_set_state(hass, "light.new", "off")
+    pending = notifier._pending.async_get_all()
+    assert pending["light.new"][0].get_value() is False
+
+    hass.states.async_remove("light.new")
+    hass.states.async_remove("event.button")
+    await hass.async_block_till_done()
+    assert "light.new" not in notifier._states_tracker._unsub_entity_state_changed
+    assert "event.button" in notifier._states_tracker._unsub_entity_state_changed
+
+    await notifier.async_unload()
+    assert notifier._states_tracker._unsub_entity_state_changed == {}
+    assert entry_data._exposed_entity_ids_listeners == []
+
+
+async def test_notifier_state_changed_snapshot(hass_platform: HomeAssistant, mock_call_later: AsyncMock) -> None:
+    hass = hass_platform
+    entry_data = MockConfigEntryData(hass=hass, entity_filter=generate_entity_filter(include_entity_globs=["*"]))
+    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, DeviceStatesTracker(hass, entry_data, {}, {}, {}))
+    await notifier.async_setup()
+
+    await _async_set_state(hass, "light.test", "on")
+    notifier._pending.async_get_all()
+    assert notifier._states_tracker._entity_snapshots["light.test"][0] is hass.states.get("light.test")
+    assert list(notifier._states_tracker._entity_snapshots["light.test"][1].keys()) == [
+        ("light.test", "devices.capabilities.on_off", "on")
+    ]
+
+    with patch("custom_components.yandex_smart_home.notifier.Device", wraps=Device) as mock_device:
+        await _async_set_state(hass, "light.test", "on", {"foo": "bar"})
+        assert mock_device.call_count == 1
+        assert notifier._pending.empty is True
+
+        await _async_set_state(hass, "light.test", "off", {"foo": "bar"})
+        assert mock_device.call_count == 2
+        pending = notifier._pending.async_get_all()
+        assert pending["light.test"][0].get_value() is False
+
+        notifier._states_tracker._entity_snapshots.clear()
+        await _async_set_state(hass, "light.test", "on", {"foo": "bar"})
+        assert mock_device.call_count == 4
+        pending = notifier._pending.async_get_all()
+        assert pending["light.test"][0].get_value() is True
+
+    hass.states.async_remove("light.test")
+    await hass.async_block_till_done()
+    assert "light.test" not in notifier._states_tracker._entity_snapshots
+
+    await notifier.async_unload()
+
+
+async def test_notifier_shared_states_tracker(hass_platform: HomeAssistant, mock_call_later: AsyncMock) -> None:
+    hass = hass_platform
+    entry_data = MockConfigEntryData(hass=hass, entity_filter=generate_entity_filter(include_entity_globs=["*"]))
+    states_tracker = DeviceStatesTracker(hass, entry_data, {}, {}, {})
+    notifier_yandex = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, states_tracker)
+    notifier_vk = CloudNotifier(hass, entry_data, BASIC_CONFIG, states_tracker)
+    await notifier_yandex.async_setup()
+    await notifier_vk.async_setup()
+    assert len(states_tracker._listeners) == 2
+
+    await _async_set_state(hass, "light.test", "on")
+    with patch("custom_components.yandex_smart_home.notifier.Device", wraps=Device) as mock_device:
+        await _async_set_state(hass, "light.test", "off")
+        assert mock_device.call_count == 1
+
+    for notifier in (notifier_yandex, notifier_vk):
+        pending = notifier._pending.async_get_all()
+        assert pending["light.test"][0].get_value() is False
+
+    await notifier_yandex.async_unload()
+    assert states_tracker._listeners == [notifier_vk._async_states_changed]
+    await _async_set_state(hass, "light.test", "on")
+    assert notifier_yandex._pending.empty is True
+    assert notifier_vk._pending.empty is False
+
+    await notifier_vk.async_unload()
+    assert states_tracker._unsub_exposed_entity_ids is None
+    assert states_tracker._unsub_entity_state_changed == {}
+
+
+async def test_notifier_states_tracker_template_results(hass: HomeAssistant) -> None:
+    hass.states.async_set("sensor.foo", "10")
+    hass.states.async_set("sensor.bar", "20")
+    entry_data = MockConfigEntryData(
+        hass=hass,
+        entity_config={
+            "sensor.foo": {
+                CONF_ENTITY_PROPERTIES: [
+                    {
+                        CONF_ENTITY_PROPERTY_TYPE: "temperature",
+                        CONF_ENTITY_PROPERTY_VALUE_TEMPLATE: Template("{{ states('sensor.foo') }}", hass),
+                    }
+                ]
+            },
+            "sensor.bar": {
+                CONF_ENTITY_PROPERTIES: [
+                    {
+                        CONF_ENTITY_PROPERTY_TYPE: "temperature",
+                        CONF_ENTITY_PROPERTY_VALUE_TEMPLATE: Template(
+                            "{{ states('sensor.bar') if now() else 0 }}", hass
+                        ),
+                    }
+                ]
+            },
+        },
+        entity_filter=generate_entity_filter(include_entity_globs=["*"]),
+    )
+    states_tracker = DeviceStatesTracker(
+        hass,
+        entry_data,
+        entry_data._get_trackable_templates(),
+        entry_data._get_trackable_entity_states(),
+        entry_data._get_trackable_entity_values(),
+    )
+    foo_template = Template("{{ states('sensor.foo') }}", hass)
+    unsub = states_tracker.async_add_listener(lambda _: None)
+    assert entry_data.template_results == {foo_template: 10}
+
+    hass.states.async_set("sensor.foo", "11")
+    await hass.async_block_till_done()
+    assert entry_data.template_results == {foo_template: 11}
+
+    foo_properties = Device(hass, entry_data, "sensor.foo", hass.states.get("sensor.foo")).get_properties()
+    assert [p.get_value() for p in foo_properties] == [11.0]
+    with patch.object(Template, "async_render") as mock_render:
+        assert [p.get_value() for p in foo_properties] == [11.0]
+        mock_render.assert_not_called()
+
+    hass.states.async_set("sensor.foo", "unavailable")
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.bar", "21")
+    await hass.async_block_till_done()
+    assert entry_data.template_results == {foo_template: "unavailable"}
+
+    unsub()
+    assert entry_data.template_results == {}
+
+
 @pytest.mark.parametrize("use_custom", [True, False])
 async def test_notifier_track_templates_over_states(
     hass_platform: HomeAssistant, mock_call_later: AsyncMock, use_custom: bool
@@ -817,8 +1020,13 @@ async def test_notifier_track_templates_over_states(
         hass_platform,
         entry_data,
         BASIC_CONFIG,
-        entry_data._get_trackable_templates(),
-        entry_data._get_trackable_entity_states(),
+        DeviceStatesTracker(
+            hass_platform,
+            entry_data,
+            entry_data._get_trackable_templates(),
+            entry_data._get_trackable_entity_states(),
+            entry_data._get_trackable_entity_values(),
+        ),
     )
     await notifier.async_setup()
     assert notifier._pending.empty is True
@@ -832,7 +1040,7 @@ async def test_notifier_track_templates_over_states(
     if use_custom:
         assert notifier._pending.empty is True
     else:
-        assert len(await notifier._pending.async_get_all()) > 0
+        assert len(notifier._pending.async_get_all()) > 0
 
     await _async_set_state(
         hass,
@@ -843,7 +1051,7 @@ async def test_notifier_track_templates_over_states(
     if use_custom:
         assert notifier._pending.empty is True
     else:
-        assert len(await notifier._pending.async_get_all()) > 0
+        assert len(notifier._pending.async_get_all()) > 0
 
     await notifier.async_unload()
 
@@ -869,8 +1077,13 @@ async def test_notifier_initial_report(
         hass_platform,
         entry_data,
         BASIC_CONFIG,
-        entry_data._get_trackable_templates(),
-        entry_data._get_trackable_entity_states(),
+        DeviceStatesTracker(
+            hass_platform,
+            entry_data,
+            entry_data._get_trackable_templates(),
+            entry_data._get_trackable_entity_states(),
+            entry_data._get_trackable_entity_values(),
+        ),
     )
 
     hass_platform.states.async_set("switch.test", "on")
@@ -881,7 +1094,7 @@ async def test_notifier_initial_report(
     await notifier._async_initial_report()
     mock_call_later.assert_called_once()
 
-    devices = await notifier._pending.async_get_all()
+    devices = notifier._pending.async_get_all()
     assert list(devices.keys()) == ["sensor.outside_temp", "light.kitchen"]
 
     def _get_states(entity_id: str) -> list[dict[str, Any]]:
@@ -927,8 +1140,13 @@ async def test_notifier_heartbeat_report(
         hass_platform,
         entry_data,
         BASIC_CONFIG,
-        entry_data._get_trackable_templates(),
-        entry_data._get_trackable_entity_states(),
+        DeviceStatesTracker(
+            hass_platform,
+            entry_data,
+            entry_data._get_trackable_templates(),
+            entry_data._get_trackable_entity_states(),
+            entry_data._get_trackable_entity_values(),
+        ),
     )
 
     hass_platform.states.async_set("switch.test", "on")
@@ -945,7 +1163,7 @@ async def test_notifier_heartbeat_report(
     mock_call_later.reset_mock()
     await notifier._async_hearbeat_report()
 
-    devices = await notifier._pending.async_get_all()
+    devices = notifier._pending.async_get_all()
     assert list(devices.keys()) == ["sensor.outside_temp", "light.kitchen"]
 
     def _get_states(entity_id: str) -> list[dict[str, Any]]:
@@ -971,7 +1189,7 @@ async def test_notifier_heartbeat_report(
 async def test_notifier_send_callback_exception(
     hass: HomeAssistant, entry_data: MockConfigEntryData, caplog: pytest.LogCaptureFixture
 ) -> None:
-    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, {}, {})
+    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, DeviceStatesTracker(hass, entry_data, {}, {}, {}))
 
     with patch.object(notifier._session, "post", side_effect=ClientConnectionError()):
         caplog.clear()
@@ -992,7 +1210,7 @@ async def test_notifier_send_direct(
     aioclient_mock: AiohttpClientMocker,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
-    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, {}, {})
+    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, DeviceStatesTracker(hass, entry_data, {}, {}, {}))
     token = BASIC_CONFIG.token
     skill_id = BASIC_CONFIG.skill_id
     user_id = BASIC_CONFIG.user_id
@@ -1018,7 +1236,7 @@ async def test_notifier_send_direct(
         status=202,
         json={"request_id": REQ_ID, "status": "ok"},
     )
-    await notifier._pending.async_add(
+    notifier._pending.async_add(
         [ButtonPressCustomEventProperty(hass, entry_data, {}, "btn", Template("click", hass))],
         [],
     )
@@ -1105,7 +1323,7 @@ async def test_notifier_send_cloud(
 ) -> None:
     await async_setup_component(hass, DOMAIN, {})
 
-    notifier = CloudNotifier(hass, entry_data, config, {}, {})
+    notifier = CloudNotifier(hass, entry_data, config, DeviceStatesTracker(hass, entry_data, {}, {}, {}))
     token = config.token
     user_id = config.user_id
     now = time.time()
@@ -1131,7 +1349,7 @@ async def test_notifier_send_cloud(
         status=202,
         json={"request_id": REQ_ID, "status": "ok"},
     )
-    await notifier._pending.async_add(
+    notifier._pending.async_add(
         [ButtonPressCustomEventProperty(hass, entry_data, {}, "btn", Template("click", hass))],
         [],
     )
@@ -1220,7 +1438,7 @@ async def test_notifier_report_states(
         def get_value(self) -> bool | None:
             raise APIError(ResponseCode.INTERNAL_ERROR, "api error prop")
 
-    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, {}, {})
+    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, DeviceStatesTracker(hass, entry_data, {}, {}, {}))
     skill_id = BASIC_CONFIG.skill_id
     user_id = BASIC_CONFIG.user_id
     now = time.time()
@@ -1235,21 +1453,15 @@ async def test_notifier_report_states(
     assert aioclient_mock.call_count == 0
     assert notifier._unsub_report_states is None
 
-    await notifier._pending.async_add(
-        [OnOffCapabilityBasic(hass, entry_data, "switch.on", State("switch.on", "on"))], []
-    )
-    await notifier._pending.async_add(
-        [MockCapabilityFail(hass, entry_data, "switch.fail", State("switch.fail", "on"))], []
-    )
-    await notifier._pending.async_add(
+    notifier._pending.async_add([OnOffCapabilityBasic(hass, entry_data, "switch.on", State("switch.on", "on"))], [])
+    notifier._pending.async_add([MockCapabilityFail(hass, entry_data, "switch.fail", State("switch.fail", "on"))], [])
+    notifier._pending.async_add(
         [TemperatureSensor(hass, entry_data, "sensor.temperature", State("sensor.temperature", "5"))], []
     )
-    await notifier._pending.async_add(
+    notifier._pending.async_add(
         [HumiditySensor(hass, entry_data, "sensor.temperature", State("sensor.temperature", "5"))], []
     )
-    await notifier._pending.async_add(
-        [MockPropertyFail(hass, entry_data, "sensor.fail", State("sensor.fail", "5"))], []
-    )
+    notifier._pending.async_add([MockPropertyFail(hass, entry_data, "sensor.fail", State("sensor.fail", "5"))], [])
 
     assert notifier._pending.empty is False
     with patch("time.time", return_value=now):
@@ -1281,10 +1493,8 @@ async def test_notifier_report_states(
         "ts": now,
     }
 
-    with patch.object(notifier._pending, "async_get_all", return_value=notifier._pending._device_states):
-        await notifier._pending.async_add(
-            [OnOffCapabilityBasic(hass, entry_data, "switch.on", State("switch.on", "on"))], []
-        )
+    with patch.object(notifier._pending, "async_get_all", return_value={}):
+        notifier._pending.async_add([OnOffCapabilityBasic(hass, entry_data, "switch.on", State("switch.on", "on"))], [])
         await notifier._async_report_states()
         await hass.async_block_till_done()
         assert notifier._pending.empty is False
@@ -1293,10 +1503,25 @@ async def test_notifier_report_states(
 
 async def test_notifier_pending_states(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
     ps = PendingStates()
-    await ps.async_add([OnOffCapabilityBasic(hass, entry_data, "switch.test", State("switch.test", "on"))], [])
-    assert ps._device_states["switch.test"][0].get_value() is True
-    await ps.async_add([OnOffCapabilityBasic(hass, entry_data, "switch.test", State("switch.test", "off"))], [])
-    assert ps._device_states["switch.test"][0].get_value() is False
+    ps.async_add([OnOffCapabilityBasic(hass, entry_data, "switch.test", State("switch.test", "on"))], [])
+    assert ps._device_states["switch.test"][("devices.capabilities.on_off", "on")].get_value() is True
+    ps.async_add([OnOffCapabilityBasic(hass, entry_data, "switch.test", State("switch.test", "off"))], [])
+    assert ps._device_states["switch.test"][("devices.capabilities.on_off", "on")].get_value() is False
+    assert ps.time_sensitive is False
+
+    button = State("sensor.button", "click", {ATTR_DEVICE_CLASS: "button"})
+    ps.async_add([ButtonPressStateEventProperty(hass, entry_data, button.entity_id, button)], [])
+    ps.async_add([TemperatureSensor(hass, entry_data, "switch.test", State("switch.test", "5"))], [])
+    assert cast(bool, ps.time_sensitive) is True
+    ps.async_add([ButtonPressStateEventProperty(hass, entry_data, button.entity_id, button)], [])
+    assert cast(bool, ps.time_sensitive) is True
+    assert ps._time_sensitive_count == 1
+
+    pending = ps.async_get_all()
+    assert list(pending.keys()) == ["switch.test", "sensor.button"]
+    assert [s.instance for s in pending["switch.test"]] == ["on", "temperature"]
+    assert ps.empty is True
+    assert ps.time_sensitive is False
 
 
 async def test_notifier_capability_check_value_change(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
@@ -1311,11 +1536,11 @@ async def test_notifier_capability_check_value_change(hass: HomeAssistant, entry
         RangeCapabilityInstance.OPEN,
         "foo",
     )
-    await _assert_not_empty_list(ps.async_add([cap.new_with_value("5")], []))
-    await _assert_empty_list(ps.async_add([cap.new_with_value("5")], [cap.new_with_value("5")]))
-    await _assert_not_empty_list(ps.async_add([cap.new_with_value("5")], [cap.new_with_value("6")]))
-    await _assert_not_empty_list(ps.async_add([cap.new_with_value("5")], [cap.new_with_value(STATE_UNAVAILABLE)]))
-    await _assert_empty_list(ps.async_add([cap.new_with_value(STATE_UNAVAILABLE)], [cap.new_with_value("5")]))
+    _assert_not_empty_list(ps.async_add([cap.new_with_value("5")], []))
+    _assert_empty_list(ps.async_add([cap.new_with_value("5")], [cap.new_with_value("5")]))
+    _assert_not_empty_list(ps.async_add([cap.new_with_value("5")], [cap.new_with_value("6")]))
+    _assert_not_empty_list(ps.async_add([cap.new_with_value("5")], [cap.new_with_value(STATE_UNAVAILABLE)]))
+    _assert_empty_list(ps.async_add([cap.new_with_value(STATE_UNAVAILABLE)], [cap.new_with_value("5")]))
 
 
 @pytest.mark.parametrize("instance", FloatPropertyInstance.__members__.values())
@@ -1325,11 +1550,11 @@ async def test_notifier_float_property_check_value_change(
     ps = PendingStates()
     prop = get_custom_property(hass, entry_data, {CONF_ENTITY_PROPERTY_TYPE: instance}, "sensor.foo")
     assert prop
-    await _assert_not_empty_list(ps.async_add([prop.new_with_value("5")], []))
-    await _assert_empty_list(ps.async_add([prop.new_with_value("5")], [prop.new_with_value("5")]))
-    await _assert_not_empty_list(ps.async_add([prop.new_with_value("5")], [prop.new_with_value("6")]))
-    await _assert_not_empty_list(ps.async_add([prop.new_with_value("5")], [prop.new_with_value(STATE_UNAVAILABLE)]))
-    await _assert_empty_list(ps.async_add([prop.new_with_value(STATE_UNAVAILABLE)], [prop.new_with_value("5")]))
+    _assert_not_empty_list(ps.async_add([prop.new_with_value("5")], []))
+    _assert_empty_list(ps.async_add([prop.new_with_value("5")], [prop.new_with_value("5")]))
+    _assert_not_empty_list(ps.async_add([prop.new_with_value("5")], [prop.new_with_value("6")]))
+    _assert_not_empty_list(ps.async_add([prop.new_with_value("5")], [prop.new_with_value(STATE_UNAVAILABLE)]))
+    _assert_empty_list(ps.async_add([prop.new_with_value(STATE_UNAVAILABLE)], [prop.new_with_value("5")]))
 
 
 @pytest.mark.parametrize("instance", EventPropertyInstance.__members__.values())
@@ -1346,11 +1571,11 @@ async def test_notifier_binary_event_property_check_value_change(
     ps = PendingStates()
     prop = get_custom_property(hass, entry_data, {CONF_ENTITY_PROPERTY_TYPE: instance}, "binary_sensor.foo")
     assert prop
-    await _assert_empty_list(ps.async_add([prop.new_with_value(a_value)], []))
-    await _assert_empty_list(ps.async_add([prop.new_with_value(a_value)], [prop.new_with_value(a_value)]))
-    await _assert_not_empty_list(ps.async_add([prop.new_with_value(a_value)], [prop.new_with_value(b_value)]))
-    await _assert_empty_list(ps.async_add([prop.new_with_value(a_value)], [prop.new_with_value(STATE_UNAVAILABLE)]))
-    await _assert_empty_list(ps.async_add([prop.new_with_value(STATE_UNAVAILABLE)], [prop.new_with_value(a_value)]))
+    _assert_empty_list(ps.async_add([prop.new_with_value(a_value)], []))
+    _assert_empty_list(ps.async_add([prop.new_with_value(a_value)], [prop.new_with_value(a_value)]))
+    _assert_not_empty_list(ps.async_add([prop.new_with_value(a_value)], [prop.new_with_value(b_value)]))
+    _assert_empty_list(ps.async_add([prop.new_with_value(a_value)], [prop.new_with_value(STATE_UNAVAILABLE)]))
+    _assert_empty_list(ps.async_add([prop.new_with_value(STATE_UNAVAILABLE)], [prop.new_with_value(a_value)]))
 
 
 @pytest.mark.parametrize(
@@ -1362,12 +1587,12 @@ async def test_notifier_reactive_event_property_check_value_change(
     ps = PendingStates()
     prop = get_custom_property(hass, entry_data, {CONF_ENTITY_PROPERTY_TYPE: instance}, "binary_sensor.foo")
     assert prop
-    await _assert_not_empty_list(ps.async_add([prop.new_with_value(v)], []))
-    await _assert_empty_list(ps.async_add([prop.new_with_value(v)], [prop.new_with_value(v)]))
-    await _assert_empty_list(ps.async_add([prop.new_with_value("foo")], []))
-    await _assert_not_empty_list(ps.async_add([prop.new_with_value(v)], [prop.new_with_value("off")]))
-    await _assert_not_empty_list(ps.async_add([prop.new_with_value(v)], [prop.new_with_value(STATE_UNAVAILABLE)]))
-    await _assert_empty_list(ps.async_add([prop.new_with_value(STATE_UNAVAILABLE)], [prop.new_with_value(v)]))
+    _assert_not_empty_list(ps.async_add([prop.new_with_value(v)], []))
+    _assert_empty_list(ps.async_add([prop.new_with_value(v)], [prop.new_with_value(v)]))
+    _assert_empty_list(ps.async_add([prop.new_with_value("foo")], []))
+    _assert_not_empty_list(ps.async_add([prop.new_with_value(v)], [prop.new_with_value("off")]))
+    _assert_not_empty_list(ps.async_add([prop.new_with_value(v)], [prop.new_with_value(STATE_UNAVAILABLE)]))
+    _assert_empty_list(ps.async_add([prop.new_with_value(STATE_UNAVAILABLE)], [prop.new_with_value(v)]))
 
 
 async def test_notifier_event_platform_property_check_value_change(
@@ -1376,32 +1601,32 @@ async def test_notifier_event_platform_property_check_value_change(
     ps = PendingStates()
     cls = ButtonPressEventPlatformCustomProperty
 
-    await _assert_not_empty_list(
+    _assert_not_empty_list(
         ps.async_add(
             [cls(hass, entry_data, "foo", State("event.foo", STATE_UNKNOWN, {ATTR_EVENT_TYPE: "click"}))],
             [],
         )
     )
-    await _assert_not_empty_list(
+    _assert_not_empty_list(
         ps.async_add(
             [cls(hass, entry_data, "foo", State("event.foo", "foo", {ATTR_EVENT_TYPE: "click"}))],
             [cls(hass, entry_data, "foo", State("event.foo", "bar", {ATTR_EVENT_TYPE: "click"}))],
         )
     )
 
-    await _assert_empty_list(
+    _assert_empty_list(
         ps.async_add(
             [cls(hass, entry_data, "foo", State("event.foo", STATE_UNKNOWN, {ATTR_EVENT_TYPE: "foo"}))],
             [],
         )
     )
-    await _assert_empty_list(
+    _assert_empty_list(
         ps.async_add(
             [cls(hass, entry_data, "foo", State("event.foo", "bar", {ATTR_EVENT_TYPE: "click"}))],
             [cls(hass, entry_data, "foo", State("event.foo", "bar", {ATTR_EVENT_TYPE: "click"}))],
         )
     )
-    await _assert_empty_list(
+    _assert_empty_list(
         ps.async_add(
             [cls(hass, entry_data, "foo", State("event.foo", "bar", {ATTR_EVENT_TYPE: "click"}))],
             [cls(hass, entry_data, "foo", State("event.foo", "bar", {ATTR_EVENT_TYPE: "double_click"}))],
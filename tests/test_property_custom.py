@@ -1,6 +1,7 @@
 from enum import StrEnum
 import itertools
 from typing import Any
+from unittest.mock import patch
 
 from homeassistant.components import binary_sensor, sensor
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, STATE_ON, STATE_UNAVAILABLE
@@ -338,6 +339,76 @@ async def test_property_custom_get_value_float(hass: HomeAssistant, entry_data:
     )
 
 
+async def test_property_custom_entity_value(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    prop = get_custom_property(hass, entry_data, {CONF_ENTITY_PROPERTY_TYPE: "temperature"}, "sensor.test")
+    assert prop
+    assert prop.value_entity_id == "sensor.test"
+    assert repr(prop) == (
+        "<TemperatureCustomFloatProperty device_id=sensor.test instance=temperature "
+        "entity_id=sensor.test value=UndefinedType._singleton>"
+    )
+    attr_prop = get_custom_property(
+        hass,
+        entry_data,
+        {
+            CONF_ENTITY_PROPERTY_TYPE: "humidity",
+            CONF_ENTITY_PROPERTY_ENTITY: "sensor.foo",
+            CONF_ENTITY_PROPERTY_ATTRIBUTE: "value",
+        },
+        "sensor.test",
+    )
+    assert attr_prop
+    assert attr_prop.value_entity_id == "sensor.foo"
+    assert repr(attr_prop) == (
+        "<HumidityCustomFloatProperty device_id=sensor.test instance=humidity "
+        "entity_id=sensor.foo attribute=value value=UndefinedType._singleton>"
+    )
+
+    template_prop = get_custom_property(
+        hass,
+        entry_data,
+        {
+            CONF_ENTITY_PROPERTY_TYPE: "temperature",
+            CONF_ENTITY_PROPERTY_VALUE_TEMPLATE: Template("{{ states('sensor.test') }}", hass),
+        },
+        "sensor.test",
+    )
+    template_attr_prop = get_custom_property(
+        hass,
+        entry_data,
+        {
+            CONF_ENTITY_PROPERTY_TYPE: "humidity",
+            CONF_ENTITY_PROPERTY_VALUE_TEMPLATE: Template("{{ state_attr('sensor.foo', 'value') }}", hass),
+        },
+        "sensor.test",
+    )
+    assert template_prop and template_attr_prop
+    assert template_prop.value_entity_id is None
+
+    for value in ["10", " 1.50 ", "unavailable", None, 5, 4.5]:
+        if value is None:
+            hass.states.async_remove("sensor.test")
+            hass.states.async_remove("sensor.foo")
+        else:
+            hass.states.async_set("sensor.test", str(value))
+            hass.states.async_set("sensor.foo", "on", {"value": value})
+
+        assert prop.get_value() == template_prop.get_value()
+        assert attr_prop.get_value() == template_attr_prop.get_value()
+
+    hass.states.async_set("sensor.test", "5")
+    hass.states.async_set("sensor.foo", "on", {"value": 20})
+    assert prop.new_with_entity_state(State("sensor.test", "7")).get_value() == 7
+    assert attr_prop.new_with_entity_state(State("sensor.foo", "on", {"value": 30})).get_value() == 30
+    assert prop.get_value() == 5
+    assert attr_prop.get_value() == 20
+
+    with patch.object(Template, "async_render") as mock_render:
+        assert prop.get_value() == 5
+        assert attr_prop.get_value() == 20
+        mock_render.assert_not_called()
+
+
 async def test_property_custom_value_float_limit(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
     state = State("sensor.test", "-5")
     hass.states.async_set(state.entity_id, state.state)
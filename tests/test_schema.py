@@ -1,6 +1,29 @@
 from pytest_homeassistant_custom_component.common import load_fixture
 
-from custom_components.yandex_smart_home.schema import ActionRequest, GetStreamInstanceActionStateValue
+from custom_components.yandex_smart_home.schema import (
+    ActionRequest,
+    ActionResult,
+    ActionResultCapability,
+    ActionResultCapabilityState,
+    ActionResultDevice,
+    CallbackStatesRequest,
+    CallbackStatesRequestPayload,
+    DeviceList,
+    DeviceState,
+    DeviceStates,
+    FailedActionResult,
+    FloatPropertyInstance,
+    GetStreamInstanceActionResultValue,
+    GetStreamInstanceActionStateValue,
+    PropertyInstanceState,
+    PropertyInstanceStateValue,
+    PropertyType,
+    ResponseCode,
+    StatesRequest,
+    StatesRequestDevice,
+    SuccessActionResult,
+)
+from custom_components.yandex_smart_home.schema.base import APIModel
 from custom_components.yandex_smart_home.schema.capability import *
 from custom_components.yandex_smart_home.schema.capability_color import *
 from custom_components.yandex_smart_home.schema.capability_mode import *
@@ -58,3 +81,116 @@ def test_devices_action_request_vk() -> None:
     assert request.payload.devices[0].capabilities[0] == RangeCapabilityInstanceAction(
         state=RangeCapabilityInstanceActionState(instance=RangeCapabilityInstance.VOLUME, value=54.0, relative=False),
     )
+
+
+def test_as_json_compatibility() -> None:
+    def _assert_compatible(model: APIModel) -> None:
+        assert model.as_json() == model.json(exclude_none=True, ensure_ascii=False)
+
+    _assert_compatible(
+        DeviceList.parse_obj(
+            {
+                "user_id": "user",
+                "devices": [
+                    {
+                        "id": "light.kitchen",
+                        "name": "Свет на кухне",
+                        "description": None,
+                        "room": "Кухня",
+                        "type": "devices.types.light",
+                        "capabilities": [
+                            {"type": "devices.capabilities.on_off", "retrievable": True, "reportable": True},
+                            {
+                                "type": "devices.capabilities.color_setting",
+                                "retrievable": True,
+                                "reportable": True,
+                                "parameters": {
+                                    "color_model": "rgb",
+                                    "temperature_k": {"min": 2700, "max": 6500},
+                                    "color_scene": {"scenes": [{"id": "party"}, {"id": "alarm"}]},
+                                },
+                            },
+                            {
+                                "type": "devices.capabilities.range",
+                                "retrievable": True,
+                                "reportable": True,
+                                "parameters": {
+                                    "instance": "brightness",
+                                    "random_access": True,
+                                    "range": {"min": 1.0, "max": 100.0, "precision": 0.5},
+                                },
+                            },
+                        ],
+                        "properties": [
+                            {
+                                "type": "devices.properties.float",
+                                "retrievable": True,
+                                "reportable": True,
+                                "parameters": {"instance": "temperature", "unit": "unit.temperature.celsius"},
+                            },
+                            {
+                                "type": "devices.properties.event",
+                                "retrievable": True,
+                                "reportable": True,
+                                "parameters": {
+                                    "instance": "button",
+                                    "events": [{"value": "click"}, {"value": "double_click"}],
+                                },
+                            },
+                        ],
+                        "device_info": {"manufacturer": 'Ёлка "№1"', "model": "x\ty", "sw_version": "1.0"},
+                    }
+                ],
+            }
+        )
+    )
+    _assert_compatible(
+        DeviceStates(
+            devices=[
+                DeviceState(
+                    id="sensor.test",
+                    capabilities=[
+                        CapabilityInstanceState(
+                            type=CapabilityType.RANGE,
+                            state=CapabilityInstanceStateValue(instance=RangeCapabilityInstance.OPEN, value=1e16),
+                        )
+                    ],
+                    properties=[
+                        PropertyInstanceState(
+                            type=PropertyType.FLOAT,
+                            state=PropertyInstanceStateValue(instance=FloatPropertyInstance.TEMPERATURE, value=-0.1),
+                        )
+                    ],
+                ),
+                DeviceState(id="switch.test", error_code=ResponseCode.DEVICE_UNREACHABLE, error_message="Ошибка"),
+            ]
+        )
+    )
+    _assert_compatible(
+        ActionResult(
+            devices=[
+                ActionResultDevice(
+                    id="light.test",
+                    capabilities=[
+                        ActionResultCapability(
+                            type=CapabilityType.VIDEO_STREAM,
+                            state=ActionResultCapabilityState(
+                                instance=VideoStreamCapabilityInstance.GET_STREAM,
+                                value=GetStreamInstanceActionResultValue(stream_url="https://foo", protocol="hls"),
+                                action_result=SuccessActionResult(),
+                            ),
+                        )
+                    ],
+                ),
+                ActionResultDevice(
+                    id="switch.test", action_result=FailedActionResult(error_code=ResponseCode.DEVICE_UNREACHABLE)
+                ),
+            ]
+        )
+    )
+    _assert_compatible(
+        CallbackStatesRequest(
+            ts=1.5, payload=CallbackStatesRequestPayload(user_id="user", devices=[DeviceState(id="light.test")])
+        )
+    )
+    _assert_compatible(StatesRequest(devices=[StatesRequestDevice(id="foo", custom_data={"a": None, "b": [1, (2,)]})]))